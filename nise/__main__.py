@@ -22,6 +22,7 @@ import datetime
 import os
 import sys
 import time
+from importlib.util import find_spec
 from pprint import pformat
 
 from dateutil import parser as date_parser
@@ -34,6 +35,7 @@ from nise.report import aws_create_report
 from nise.report import azure_create_report
 from nise.report import gcp_create_report
 from nise.report import ocp_create_report
+from nise.report import ocp_simulate_operator
 from nise.util import load_yaml
 from nise.util import LOG
 from nise.util import LOG_VERBOSITY
@@ -90,6 +92,17 @@ def today():
     return datetime.datetime.now(tz=datetime.UTC).replace(microsecond=0, second=0, minute=0)
 
 
+def add_file_byte_limit_arg(parser):
+    """Add the file byte limit arg to the sub-parser of a provider whose report files rotate by size."""
+    parser.add_argument(
+        "--file-byte-limit",
+        dest="byte_limit",
+        required=False,
+        type=int,
+        help="Maximum size in bytes per report file. Files are rotated at whichever limit is reached first.",
+    )
+
+
 def add_aws_parser_args(parser):
     """Add AWS sub-parser args."""
     parser.add_argument(
@@ -124,6 +137,22 @@ def add_aws_parser_args(parser):
                             or \'overwrite\' to finalize the normal report files.
                             """,
     )
+    parser.add_argument(
+        "--workers",
+        metavar="N",
+        dest="workers",
+        required=False,
+        type=int,
+        default=1,
+        help="Number of worker processes used to run the generators. Default is 1.",
+    )
+    parser.add_argument(
+        "--gzip",
+        dest="gzip_output",
+        action="store_true",
+        required=False,
+        help="Write the report files as .csv.gz while they are generated instead of compressing them afterwards.",
+    )
 
 
 def add_aws_marketplace_parser_args(parser):
@@ -201,6 +230,48 @@ def add_azure_parser_args(parser):
         required=False,
         help="Generate resource group based azure report.",
     )
+    parser.add_argument(
+        "--dual-export",
+        dest="azure_dual_export",
+        action="store_true",
+        required=False,
+        help="Generate the subscription and resource group based azure reports from the same data. "
+        "The resource group report is placed under the report name suffixed with -resource-group.",
+    )
+    parser.add_argument(
+        "--upload-workers",
+        metavar="N",
+        dest="upload_workers",
+        required=False,
+        type=int,
+        default=4,
+        help="Number of report files uploaded to the storage account at the same time. Default is 4.",
+    )
+    parser.add_argument(
+        "--upload-concurrency",
+        metavar="N",
+        dest="azure_upload_concurrency",
+        required=False,
+        type=int,
+        default=4,
+        help="Number of blocks of each report file uploaded to the storage account at the same time. Default is 4.",
+    )
+    parser.add_argument(
+        "--upload-block-size",
+        metavar="BYTES",
+        dest="azure_block_size",
+        required=False,
+        type=int,
+        help="Size in bytes of the blocks report files are uploaded in. Default is the Azure SDK's.",
+    )
+    parser.add_argument(
+        "--meter-cache",
+        metavar="FILE_NAME",
+        dest="azure_meter_cache",
+        required=False,
+        help="JSON file the meters of each subscription are loaded from and saved to, "
+        "so that each generator keeps its meter id, name and category from one run to the next.",
+    )
 
 
 def add_gcp_parser_args(parser):
@@ -268,6 +339,17 @@ def length_of_cluster_id(cluster_id):
     return cluster_id
 
 
+def positive_int(value):
+    """Validate that the value is a positive integer."""
+    try:
+        number = int(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"{value} is not an integer.") from e
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} must be a positive integer.")
+    return number
+
+
 def add_ocp_parser_args(parser):
     """Add OCP sub-parser args."""
     parser.add_argument(
@@ -285,6 +367,15 @@ def add_ocp_parser_args(parser):
         required=False,
         help="URL for Insights Upload Service.",
     )
+    parser.add_argument(
+        "--upload-workers",
+        metavar="N",
+        dest="upload_workers",
+        required=False,
+        type=int,
+        default=4,
+        help="Number of payloads uploaded to the Insights Upload Service at the same time. Default is 4.",
+    )
     parser.add_argument(
         "--minio-upload",
         metavar="MINIO_UPLOAD_ENDPOINT",
@@ -327,6 +418,63 @@ def add_ocp_parser_args(parser):
         action="store_true",
         help="Generate ONLY ROS for Openshift data",
     )
+    parser.add_argument(
+        "--ros-ocp-numpy",
+        dest="ros_ocp_numpy",
+        required=False,
+        action="store_true",
+        help="Use NumPy to randomize ROS for Openshift container data in bulk (requires the numpy extra)",
+    )
+    parser.add_argument(
+        "--single-pass",
+        dest="single_pass",
+        required=False,
+        action="store_true",
+        help="Generate every report type in one pass over the time axis, writing the same rows to all files at once",
+    )
+    parser.add_argument(
+        "--workers",
+        metavar="N",
+        dest="workers",
+        required=False,
+        type=int,
+        default=1,
+        help="Split the cluster's nodes into N shards generated by separate processes. Default is 1.",
+    )
+    parser.add_argument(
+        "--simulate-operator",
+        dest="simulate_operator",
+        required=False,
+        action="store_true",
+        help="Keep running from the start date, uploading a payload with only the new hours every upload cycle",
+    )
+    parser.add_argument(
+        "--upload-cycle",
+        metavar="MINUTES",
+        dest="upload_cycle",
+        required=False,
+        type=positive_int,
+        default=360,
+        help="Minutes of data in each payload of the operator simulation. Default is 360.",
+    )
+    parser.add_argument(
+        "--simulation-speed",
+        metavar="FACTOR",
+        dest="simulation_speed",
+        required=False,
+        type=float,
+        default=0,
+        help="How many times faster than wall-clock time the operator simulation runs, "
+        "1 for real time. Default is 0, which uploads cycles back to back.",
+    )
+    parser.add_argument(
+        "--simulation-cycles",
+        metavar="N",
+        dest="simulation_cycles",
+        required=False,
+        type=positive_int,
+        help="Stop the operator simulation after N upload cycles. Default is to run until interrupted.",
+    )
 
 
 def create_parser():
@@ -375,6 +523,22 @@ def create_parser():
         default=100000,
         help="Maximum number of lines per report file. Default is 100000.",
     )
+    parent_parser.add_argument(
+        "--compression-level",
+        metavar="LEVEL",
+        dest="compression_level",
+        required=False,
+        type=int,
+        choices=range(10),
+        help="Gzip compression level from 0 (none) to 9 (smallest). Default is 9.",
+    )
+    parent_parser.add_argument(
+        "--seed",
+        dest="seed",
+        required=False,
+        type=int,
+        help="Seed for reproducible output. Each generator draws from its own stream derived from this seed.",
+    )
     parent_parser.add_argument(
         "--static-report-file", dest="static_report_file", required=False, help="Generate static data based on yaml."
     )
@@ -415,6 +579,8 @@ def create_parser():
     add_aws_parser_args(aws_parser)
     add_aws_marketplace_parser_args(aws_marketplace_parser)
     add_azure_parser_args(azure_parser)
+    for byte_limit_parser in (aws_parser, aws_marketplace_parser, azure_parser):
+        add_file_byte_limit_arg(byte_limit_parser)
     add_gcp_parser_args(gcp_parser)
     add_ocp_parser_args(ocp_parser)
 
@@ -587,6 +753,12 @@ def _validate_ocp_arguments(parser, options):
         msg = "\n\t--payload-name is only used with --minio-upload\n"
         msg = msg.format("--payload-name", payload_name)
         parser.error(msg)
+    if options.get("simulate_operator") and not (insights_upload or minio_upload):
+        parser.error("--simulate-operator requires --insights-upload or --minio-upload.")
+    if (options.get("simulation_speed") or 0) < 0:
+        parser.error("--simulation-speed must not be negative.")
+    if options.get("ros_ocp_numpy") and find_spec("numpy") is None:
+        parser.error("--ros-ocp-numpy requires NumPy. Install it with: pip install 'koku-nise[numpy]'")
 
     return True
 
@@ -777,7 +949,10 @@ def run(provider_type, options):
     elif provider_type == "azure":
         azure_create_report(options)
     elif provider_type == "ocp":
-        ocp_create_report(options)
+        if options.get("simulate_operator"):
+            ocp_simulate_operator(options)
+        else:
+            ocp_create_report(options)
     elif provider_type == "gcp":
         gcp_create_report(options)
 
@@ -18,11 +18,11 @@
 
 import datetime
 from abc import abstractmethod
-from random import choice
-from random import randint
 
 from nise.generators.aws.aws_constants import REGIONS
 from nise.generators.generator import AbstractGenerator
+from nise.generators.row import row_schema
+from nise.generators.time_axis import TIMESTAMPS
 
 
 IDENTITY_COLS = ("identity/LineItemId", "identity/TimeInterval")
@@ -260,7 +260,10 @@ class AWSGenerator(AbstractGenerator):
         self.attributes = attributes if attributes else {}
         self._tags = None
         self._cost_category = None
-        self.num_instances = 1 if attributes else randint(2, 60)
+        self._row_templates = {}
+        # When set, rows are list backed Row objects instead of dicts.
+        self.compact_rows = False
+        self.num_instances = 1 if attributes else self.random.randint(2, 60)
         if tag_cols:
             self.RESOURCE_TAG_COLS.update(tag_cols)
             self.AWS_COLUMNS.update(tag_cols)
@@ -276,7 +279,7 @@ class AWSGenerator(AbstractGenerator):
         """Provide timestamp for a date."""
         if not (in_date and isinstance(in_date, datetime.datetime)):
             raise ValueError("in_date must be a date object.")
-        return in_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+        return TIMESTAMPS.format(in_date, "%Y-%m-%dT%H:%M:%SZ")
 
     @staticmethod
     def time_interval(start, end):
@@ -292,7 +295,7 @@ class AWSGenerator(AbstractGenerator):
         elif self.attributes:
             tags = None
         else:
-            tags = choice(options)
+            tags = self.random.choice(options)
         return tags
 
     def _init_data_row(self, start, end, **kwargs):  # noqa: C901
@@ -305,23 +308,33 @@ class AWSGenerator(AbstractGenerator):
             raise ValueError("end must be a date object.")
 
         bill_begin = start.replace(microsecond=0, second=0, minute=0, hour=0, day=1)
+        # AWS_COLUMNS is shared by every generator and only grows, so its size tells its versions apart
+        key = (bill_begin, self.compact_rows, len(self.AWS_COLUMNS))
+        if (template := self._row_templates.get(key)) is None:
+            template = self._row_templates[key] = self._compile_row_template(bill_begin)
+        row = template.copy()
+        row["identity/LineItemId"] = self.fake.sha1(raw_output=False)
+        row["identity/TimeInterval"] = AWSGenerator.time_interval(start, end)
+        return row
+
+    def _compile_row_template(self, bill_begin):
+        """Build the placeholder row with the values that are fixed for a billing period."""
         bill_end = AbstractGenerator.next_month(bill_begin)
-        row = {}
         COL_MAP = {
-            "identity/LineItemId": self.fake.sha1(raw_output=False),
-            "identity/TimeInterval": AWSGenerator.time_interval(start, end),
             "bill/BillingEntity": "AWS",
             "bill/BillType": "Anniversary",
             "bill/PayerAccountId": self.payer_account,
             "bill/BillingPeriodStartDate": AWSGenerator.timestamp(bill_begin),
             "bill/BillingPeriodEndDate": AWSGenerator.timestamp(bill_end),
         }
-        for column in self.AWS_COLUMNS:
-            row[column] = ""
-            if COL_MAP.get(column):
-                row[column] = COL_MAP.get(column)
-
-        return row
+        if self.compact_rows:
+            template = row_schema(tuple(sorted(self.AWS_COLUMNS))).row()
+        else:
+            template = dict.fromkeys(self.AWS_COLUMNS, "")
+        for column, value in COL_MAP.items():
+            if column in template and value:
+                template[column] = value
+        return template
 
     def _get_location(self):
         """Pick instance location."""
@@ -329,9 +342,9 @@ class AWSGenerator(AbstractGenerator):
         if region := self.attributes.get("region"):
             options = [option for option in REGIONS if region in option]
         if options:
-            location = choice(options)
+            location = self.random.choice(options)
         else:
-            location = choice(REGIONS)
+            location = self.random.choice(REGIONS)
         return location
 
     def _get_legal_entity(self):
@@ -345,7 +358,7 @@ class AWSGenerator(AbstractGenerator):
         if user_account := self.attributes.get("user"):
             row["lineItem/UsageAccountId"] = user_account
         else:
-            row["lineItem/UsageAccountId"] = choice(self.usage_accounts)
+            row["lineItem/UsageAccountId"] = self.random.choice(self.usage_accounts)
         row["lineItem/LineItemType"] = "Usage"
         row["lineItem/UsageStartDate"] = start
         row["lineItem/UsageEndDate"] = end
@@ -362,7 +375,7 @@ class AWSGenerator(AbstractGenerator):
             num_tags = self.fake.random_int(0, 5)
             for _ in range(num_tags):
                 seen_tags = set()
-                tag_key = choice(list(self.RESOURCE_TAG_COLS))
+                tag_key = self.random.choice(sorted(self.RESOURCE_TAG_COLS))
                 if tag_key not in seen_tags:
                     row[tag_key] = self.fake.word()
                     seen_tags.update([tag_key])
@@ -376,7 +389,7 @@ class AWSGenerator(AbstractGenerator):
             num_category = self.fake.random_int(0, 5)
             for _ in range(num_category):
                 seen_categories = set()
-                category_key = choice(list(self.COST_CATEGORY_COLS))
+                category_key = self.random.choice(sorted(self.COST_CATEGORY_COLS))
                 if category_key not in seen_categories:
                     row[category_key] = self.fake.word()
                     seen_categories.update([category_key])
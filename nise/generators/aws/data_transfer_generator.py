@@ -16,9 +16,6 @@
 #
 """Module for ebs data generation."""
 
-from random import choice
-from random import uniform
-
 from nise.generators.aws.aws_generator import AWSGenerator
 
 
@@ -55,13 +52,13 @@ class DataTransferGenerator(AWSGenerator):
             return self._data_direction.capitalize()
 
         # Purposefully not caching this value so a different value is returned on each call
-        return choice(self.DATA_TRANSFER_DIRECTIONS).capitalize()
+        return self.random.choice(self.DATA_TRANSFER_DIRECTIONS).capitalize()
 
     def _get_data_transfer(self, rate):
         """Get data transfer info."""
         location1, aws_region, _, storage_region1 = self._get_location()
         location2, _, _, storage_region2 = self._get_location()
-        trans_desc, operation, trans_type = choice(self.DATA_TRANSFER)
+        trans_desc, operation, trans_type = self.random.choice(self.DATA_TRANSFER)
         trans_desc = trans_desc.format(region1=storage_region1, region2=storage_region2, direction=self.data_direction)
         operation = operation.format(direction=self.data_direction)
         trans_type = trans_type.format(direction=self.data_direction)
@@ -82,10 +79,10 @@ class DataTransferGenerator(AWSGenerator):
         row = self._add_common_usage_info(row, start, end)
 
         resource_id = self._resource_id if self._resource_id else self.fake.ean8()
-        rate = self._rate if self._rate else round(uniform(0.12, 0.19), 3)
+        rate = self._rate if self._rate else round(self.random.uniform(0.12, 0.19), 3)
         saving = self._saving
         negation = self._negation
-        amount = self._amount if self._amount else uniform(0.000002, 0.09)
+        amount = self._amount if self._amount else self.random.uniform(0.000002, 0.09)
         cost = amount * rate
         trans_desc, operation, description, location1, location2, trans_type, aws_region = self._get_data_transfer(rate)
 
@@ -17,8 +17,6 @@
 """Module for ebs data generation."""
 
 import calendar
-from random import choice
-from random import uniform
 
 from nise.generators.aws.aws_generator import AWSGenerator
 
@@ -35,8 +33,8 @@ class EBSGenerator(AWSGenerator):
         """Initialize the EBS generator."""
         super().__init__(start_date, end_date, currency, payer_account, usage_accounts, attributes, tag_cols)
         self._resource_id = f"vol-{self.fake.ean8()}"
-        self._disk_size = choice([5, 10, 15, 20, 25])
-        self._rate = round(uniform(0.02, 0.16), 3)
+        self._disk_size = self.random.choice([5, 10, 15, 20, 25])
+        self._rate = round(self.random.uniform(0.02, 0.16), 3)
         self._product_sku = self.fake.pystr(min_chars=12, max_chars=12).upper()
 
         if self.attributes:
@@ -53,7 +51,7 @@ class EBSGenerator(AWSGenerator):
 
     def _get_storage(self):
         """Get storage data."""
-        return choice(self.STORAGE)
+        return self.random.choice(self.STORAGE)
 
     def _calculate_hourly_rate(self, start):
         """Calculates the houly rate based of the provided monthly rate."""
@@ -16,8 +16,6 @@
 #
 """Module for ec2 data generation."""
 
-from random import choice
-
 from dateutil.relativedelta import relativedelta
 from nise.generators.aws.aws_generator import AWSGenerator
 
@@ -133,9 +131,9 @@ class EC2Generator(AWSGenerator):
     def __init__(self, start_date, end_date, currency, payer_account, usage_accounts, attributes=None, tag_cols=None):
         """Initialize the EC2 generator."""
         super().__init__(start_date, end_date, currency, payer_account, usage_accounts, attributes, tag_cols)
-        self._instance_type = choice(self.INSTANCE_TYPES)
-        self._operating_system = self.attributes.get("operating_system", choice(self.OPERATING_SYSTEMS))
-        self._processor_arch = self.attributes.get("processor_arch", choice(self.ARCHS))
+        self._instance_type = self.random.choice(self.INSTANCE_TYPES)
+        self._operating_system = self.attributes.get("operating_system", self.random.choice(self.OPERATING_SYSTEMS))
+        self._processor_arch = self.attributes.get("processor_arch", self.random.choice(self.ARCHS))
         self._resource_id = f"i-{self.attributes.get('resource_id', self.fake.ean8())}"
         self._product_sku = self.attributes.get("product_sku", self.fake.pystr(min_chars=12, max_chars=12).upper())
         self._tags = self.attributes.get("tags", [])
@@ -17,8 +17,6 @@
 """Module for marketplace data generation."""
 
 import string
-from random import choice
-from random import uniform
 
 from nise.generators.aws.aws_generator import AWSGenerator
 
@@ -39,8 +37,8 @@ class MarketplaceGenerator(AWSGenerator):
         """Initialize the generator."""
         super().__init__(start_date, end_date, currency, payer_account, usage_accounts, attributes, tag_cols)
 
-        self._amount = uniform(0.2, 300.99)
-        self._rate = round(uniform(0.02, 0.16), 3)
+        self._amount = self.random.uniform(0.2, 300.99)
+        self._rate = round(self.random.uniform(0.02, 0.16), 3)
         self._resource_id = f"i-{self.fake.ean8()}"
         self._product_sku = self.fake.pystr(min_chars=12, max_chars=12).upper()
 
@@ -61,11 +59,11 @@ class MarketplaceGenerator(AWSGenerator):
         chars = string.ascii_uppercase + string.digits
 
         return (
-            "".join([choice(chars) for _ in range(16)])
+            "".join([self.random.choice(chars) for _ in range(16)])
             + "."
-            + "".join([choice(chars) for _ in range(10)])
+            + "".join([self.random.choice(chars) for _ in range(10)])
             + "."
-            + "".join([choice(chars) for _ in range(10)])
+            + "".join([self.random.choice(chars) for _ in range(10)])
         )
 
     @property
@@ -73,14 +71,14 @@ class MarketplaceGenerator(AWSGenerator):
         """Return a formatted rate code."""
         if hasattr(self, "_rate_id"):
             return self._rate_id
-        return "".join([choice(string.digits) for _ in range(10)])
+        return "".join([self.random.choice(string.digits) for _ in range(10)])
 
     @property
     def subscription_id(self):
         """Return a formatted rate code."""
         if hasattr(self, "_subscription_id"):
             return self._subscription_id
-        return "".join([choice(string.digits) for _ in range(10)])
+        return "".join([self.random.choice(string.digits) for _ in range(10)])
 
     def _update_data(self, row, start, end, **kwargs):
         """Update data with generator specific data."""
@@ -96,7 +94,7 @@ class MarketplaceGenerator(AWSGenerator):
 
         row["bill/BillingEntity"] = row_data.get("billingentity")
 
-        row["lineItem/UsageAccountId"] = choice(self.usage_accounts)
+        row["lineItem/UsageAccountId"] = self.random.choice(self.usage_accounts)
         row["lineItem/LegalEntity"] = legal_entity
         row["lineItem/LineItemType"] = "Usage"
         row["lineItem/UsageStartDate"] = start
@@ -144,7 +142,7 @@ class MarketplaceGenerator(AWSGenerator):
         if self.attributes and self.attributes.get("legal_entity"):
             legal_entity = self.attributes.get("legal_entity")
         else:
-            legal_entity = choice(self.LEGAL_ENTITY_CHOICES)
+            legal_entity = self.random.choice(self.LEGAL_ENTITY_CHOICES)
 
         return legal_entity
 
@@ -156,18 +154,19 @@ class MarketplaceGenerator(AWSGenerator):
             products = {
                 "Amazon Web Services, Inc.": "Amazon Elastic Compute Cloud",
             }
-            product_name = products.get(legal_entity, choice(self.MARKETPLACE_PRODUCTS))
+            product_name = products.get(legal_entity, self.random.choice(self.MARKETPLACE_PRODUCTS))
 
         return product_name
 
     def _get_marketplace_data(self, legal_entity):
         """Return a dictionary of values based on the legal entity for CCSP vs Private offer testing."""
         if legal_entity in ["Amazon Web Services, Inc.", "AWS"]:
+            rhel_description = self.random.choice(self.RHEL_DESCRIPTION_CHOICES)
             return {
                 "description": getattr(
                     self,
                     "_lineitem_lineitemdescription",
-                    f"$0.1158 per On Demand {choice(self.RHEL_DESCRIPTION_CHOICES)} with HA t3.small Instance Hour",
+                    f"$0.1158 per On Demand {rhel_description} with HA t3.small Instance Hour",
                 ),
                 "billingentity": "AWS",
                 "productcode": "AmazonEC2",
@@ -16,8 +16,6 @@
 #
 """Module for rds data generation."""
 
-from random import choice
-
 from nise.generators.aws.aws_generator import AWSGenerator
 
 
@@ -72,9 +70,9 @@ class RDSGenerator(AWSGenerator):
     def __init__(self, start_date, end_date, currency, payer_account, usage_accounts, attributes=None, tag_cols=None):
         """Initialize the RDS generator."""
         super().__init__(start_date, end_date, currency, payer_account, usage_accounts, attributes, tag_cols)
-        self._processor_arch = choice(self.ARCHS)
+        self._processor_arch = self.random.choice(self.ARCHS)
         self._product_sku = self.fake.pystr(min_chars=12, max_chars=12).upper()
-        self._instance_type = choice(self.INSTANCE_TYPES)
+        self._instance_type = self.random.choice(self.INSTANCE_TYPES)
         self._resource_id = f"i-{self.fake.ean8()}"
         if self.attributes:
             if self.attributes.get("product_sku"):
@@ -16,8 +16,6 @@
 #
 """Module for route 53 data generation."""
 
-from random import choices
-
 from nise.generators.aws.aws_generator import AWSGenerator
 
 ROUTE_53_PRODUCTS_DICT = {
@@ -61,7 +59,9 @@ class Route53Generator(AWSGenerator):
         if self._product_family:
             product_family, usage_type, default_rate, default_cost = ROUTE_53_PRODUCTS_DICT.get(self._product_family)
         else:
-            product_family, usage_type, default_rate, default_cost = choices(ROUTE_53_PRODUCTS, weights=[1, 10])[0]
+            product_family, usage_type, default_rate, default_cost = self.random.choices(
+                ROUTE_53_PRODUCTS, weights=[1, 10]
+            )[0]
 
         rate = float(self._rate) if self._rate else default_rate
         cost = float(self._cost) if self._cost else default_cost
@@ -16,8 +16,6 @@
 #
 """Module for s3 data generation."""
 
-from random import uniform
-
 from nise.generators.aws.aws_generator import AWSGenerator
 
 
@@ -27,8 +25,8 @@ class S3Generator(AWSGenerator):
     def __init__(self, start_date, end_date, currency, payer_account, usage_accounts, attributes=None, tag_cols=None):
         """Initialize the S3 generator."""
         super().__init__(start_date, end_date, currency, payer_account, usage_accounts, attributes, tag_cols)
-        self._amount = uniform(0.2, 6000.99)
-        self._rate = round(uniform(0.02, 0.06), 3)
+        self._amount = self.random.uniform(0.2, 6000.99)
+        self._rate = round(self.random.uniform(0.02, 0.06), 3)
         self._product_sku = self.fake.pystr(min_chars=12, max_chars=12).upper()
         self._resource_id = self.fake.ean8()
         if self.attributes:
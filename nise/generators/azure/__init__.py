@@ -18,6 +18,7 @@
 
 from nise.generators.azure.azure_generator import AZURE_COLUMNS_V2_RESOURCE_GROUP
 from nise.generators.azure.azure_generator import AZURE_COLUMNS_V2_SUBSCRIPTION
+from nise.generators.azure.azure_generator import AZURE_RESOURCE_GROUP_TO_SUBSCRIPTION_COLUMNS
 from nise.generators.azure.azure_generator import AzureGenerator
 from nise.generators.azure.bandwidth_generator import BandwidthGenerator
 from nise.generators.azure.ccsp_generator import CCSPGenerator
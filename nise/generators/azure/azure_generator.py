@@ -19,12 +19,10 @@
 import calendar
 import datetime
 import json
-import uuid
-from random import choice
-from random import randint
-from random import uniform
+from functools import lru_cache
 
 from nise.generators.generator import AbstractGenerator
+from nise.util import random_uuid4
 
 AZURE_COLUMNS_V2_SUBSCRIPTION = (
     "InvoiceSectionName",
@@ -168,9 +166,28 @@ AZURE_COLUMNS_V2_RESOURCE_GROUP = (
     "exchangeRateDate",
 )
 
+# Resource group export columns that hold the value of a differently named subscription export column.
+AZURE_RESOURCE_GROUP_TO_SUBSCRIPTION_COLUMNS = {
+    "SubscriptionGuid": "SubscriptionId",
+    "ResourceGroup": "ResourceGroupName",
+    "BillingCurrencyCode": "BillingCurrency",
+    "InstanceName": "ResourceId",
+    "MarketPrice": "PayGPrice",
+    "Product": "ProductName",
+    "pricingCurrencyCode": "pricingCurrency",
+    "exchangeRate": "exchangeRatePricingToBilling",
+}
+
 DATE_FMT = "%Y-%m-%d"
 
 
+@lru_cache(maxsize=128)
+def _report_dates(day):
+    """Return the Date, BillingPeriodStartDate and BillingPeriodEndDate strings of a day."""
+    _, num_days = calendar.monthrange(day.year, day.month)
+    return day.strftime(DATE_FMT), day.replace(day=1).strftime(DATE_FMT), day.replace(day=num_days).strftime(DATE_FMT)
+
+
 class AzureGenerator(AbstractGenerator):
     """Defines an abstract class for generators."""
 
@@ -214,7 +231,7 @@ class AzureGenerator(AbstractGenerator):
     @property
     def meter_id(self):
         if self._meter_id is None:
-            self._meter_id = uuid.uuid4()
+            self._meter_id = random_uuid4(self.random)
         return self._meter_id
 
     @property
@@ -232,7 +249,7 @@ class AzureGenerator(AbstractGenerator):
         self.usage_accounts = account_info.get("usage_accounts")
         self.attributes = attributes
         self._tags = None
-        self.num_instances = 1 if attributes else randint(2, 60)
+        self.num_instances = 1 if attributes else self.random.randint(2, 60)
         self._usage_quantity = None
         self._resource_rate = None
         self._pre_tax_cost = None
@@ -249,6 +266,7 @@ class AzureGenerator(AbstractGenerator):
         self._data_direction = None
         self._invoice_section_id = None
         self._invoice_section_name = None
+        self._serialized = {}
 
         if attributes:
             for key, value in attributes.items():
@@ -267,23 +285,34 @@ class AzureGenerator(AbstractGenerator):
         _, num_days = calendar.monthrange(in_date.year, in_date.month)
         return in_date.replace(day=num_days).date()
 
+    def _serialize(self, field, value, serializer=json.dumps):
+        """Return value serialized for field, reusing the last result while field keeps the same value."""
+        last = self._serialized.get(field)
+        if last is None or last[0] is not value:
+            last = self._serialized[field] = (value, serializer(value))
+        return last[1]
+
     def _get_accts_str(self, service_name):
         """Return instance idea fields."""
         if service_name == "Bandwidth":
-            service_name = choice(self.SERVICE_NAMES)
+            service_name = self.random.choice(self.SERVICE_NAMES)
         return self.ACCTS_STR[service_name]
 
+    def _meter_cache_key(self, meter_id):
+        """Return the meter cache key of meter_id."""
+        return meter_id
+
     def _get_cached_meter_values(self, meter_id, service_meter):
         """Return meter cached meter data to ensure meter_id and values are consistent."""
         if not self._meter_cache.get(meter_id):
-            self._meter_cache[meter_id] = choice(service_meter)
+            self._meter_cache[meter_id] = self.random.choice(service_meter)
         return self._meter_cache.get(meter_id)
 
     def _get_resource_info(self, meter_id, service_meter, ex_resource, service_info):
         """Return resource information."""
         service_tier, meter_sub, meter_name, units_of_measure = self._get_cached_meter_values(meter_id, service_meter)
-        service_info_2 = choice(service_info)
-        resource_group, resource_name = choice(ex_resource)
+        service_info_2 = self.random.choice(service_info)
+        resource_group, resource_name = self.random.choice(ex_resource)
         additional_info = self._get_additional_info(meter_name)
         if self._instance_id:
             self._consumed, second_part = accts_str = self._get_accts_str(self._service_name)
@@ -327,9 +356,9 @@ class AzureGenerator(AbstractGenerator):
         elif self.attributes and self.attributes.get("tags"):
             tags = None
         else:
-            init_tag = {key1: choice(val1), key2: choice(val2)}
+            init_tag = {key1: self.random.choice(val1), key2: self.random.choice(val2)}
             tag_choices = (init_tag, "")
-            tags = choice(tag_choices)
+            tags = self.random.choice(tag_choices)
         return tags
 
     def _init_data_row(self, start, end, **kwargs):  # noqa: C901
@@ -341,17 +370,16 @@ class AzureGenerator(AbstractGenerator):
         if not isinstance(end, datetime.datetime):
             raise ValueError("end must be a date object.")
 
-        row = {}
-        for column in self.azure_columns:
-            row[column] = ""
-        return row
+        return dict.fromkeys(self.azure_columns, "")
 
     def _get_location(self):
         """Pick resource location."""
         if self._resource_location:
-            location = choice([option for option in self.RESOURCE_LOCATION if self._resource_location in option])
+            location = self.random.choice(
+                [option for option in self.RESOURCE_LOCATION if self._resource_location in option]
+            )
         else:
-            location = choice(self.RESOURCE_LOCATION)
+            location = self.random.choice(self.RESOURCE_LOCATION)
         return location
 
     def _get_additional_info(self, meter_name=None):
@@ -359,7 +387,7 @@ class AzureGenerator(AbstractGenerator):
         if self._additional_info:
             return self._additional_info
         else:
-            return choice(self.ADDITIONAL_INFO)
+            return self.random.choice(self.ADDITIONAL_INFO)
 
     def _add_tag_data(self, row):
         """Add tag dictionary data options to the row."""
@@ -367,13 +395,13 @@ class AzureGenerator(AbstractGenerator):
             self._tags = self._pick_tag(
                 "environment", ("dev", "ci", "qa", "stage", "prod"), "project", ("p1", "p2", "p3")
             )
-        row["Tags"] = json.dumps(self._tags)
+        row["Tags"] = self._serialize("Tags", self._tags)
 
     def _update_data(self, row, start, end, **kwargs):
         """Update data with generator specific data."""
         meter_id = self._meter_id if self._meter_id else self.fake.uuid4()
-        rate = self._resource_rate if self._resource_rate else round(uniform(0.1, 0.50), 5)
-        amount = self._usage_quantity if self._usage_quantity else uniform(0.01, 1)
+        rate = self._resource_rate if self._resource_rate else round(self.random.uniform(0.1, 0.50), 5)
+        amount = self._usage_quantity if self._usage_quantity else self.random.uniform(0.01, 1)
         cost = self._pre_tax_cost if self._pre_tax_cost else amount * rate
         azure_region, meter_region = self._get_location_info()
         (
@@ -392,7 +420,7 @@ class AzureGenerator(AbstractGenerator):
             service_info_2 = ""
 
         if self.usage_accounts:
-            usage_account = choice(self.usage_accounts)
+            usage_account = self.random.choice(self.usage_accounts)
             row["AccountName"] = usage_account[0]
             row["AccountOwnerId"] = usage_account[1]
         row["SubscriptionName"] = self.account_info.get("subscription_name")
@@ -400,17 +428,15 @@ class AzureGenerator(AbstractGenerator):
         row["BillingAccountName"] = self.account_info.get("billing_account_name")
         row["BillingProfileId"] = self.account_info.get("billing_account_id")
         row["BillingProfileName"] = self.account_info.get("billing_account_name")
-        row["Date"] = start.date().strftime(DATE_FMT)
-        row["BillingPeriodStartDate"] = self.first_day_of_month(start).strftime(DATE_FMT)
-        row["BillingPeriodEndDate"] = self.last_day_of_month(start).strftime(DATE_FMT)
+        row["Date"], row["BillingPeriodStartDate"], row["BillingPeriodEndDate"] = _report_dates(start.date())
         row["ResourceLocation"] = azure_region
         row["MeterCategory"] = self._service_name
-        row["MeterId"] = str(self.meter_id)
+        row["MeterId"] = self._serialize("MeterId", self.meter_id, str)
         row["MeterName"] = self.meter_name
         row["MeterRegion"] = meter_region
         row["ConsumedService"] = self._consumed
         row["OfferId"] = ""
-        row["AdditionalInfo"] = json.dumps(additional_info)
+        row["AdditionalInfo"] = self._serialize("AdditionalInfo", additional_info)
         row["ServiceInfo1"] = ""
         row["ServiceInfo2"] = service_info_2
         row["UnitOfMeasure"] = units_of_measure
@@ -440,16 +466,16 @@ class AzureGenerator(AbstractGenerator):
                 row["MeterCategory"] = "Virtual Machine Licenses"
             else:
                 publisher_name = "Red Hat Enterprise Linux"
-                service_family = choice(self.SERVICE_FAMILIES + ("Azure Marketplace Services",))
+                service_family = self.random.choice(self.SERVICE_FAMILIES + ("Azure Marketplace Services",))
             publisher_type = "Marketplace"
         else:
-            service_family = choice(self.SERVICE_FAMILIES)
+            service_family = self.random.choice(self.SERVICE_FAMILIES)
             publisher_name = ""
             publisher_type = "Azure"
 
         row["InvoiceSectionId"] = self._invoice_section_id if self._invoice_section_id else self.fake.ean(length=8)
         row["InvoiceSectionName"] = (
-            self._invoice_section_name if self._invoice_section_id else choice(self.INVOICE_SECTION_NAMES)
+            self._invoice_section_name if self._invoice_section_id else self.random.choice(self.INVOICE_SECTION_NAMES)
         )
 
         # NOTE: Commented out columns exist in the report, but we don't have enough
@@ -520,15 +546,12 @@ class AzureGenerator(AbstractGenerator):
         return []
 
     def _generate_daily_data(self):
-        """Create daily data."""
-        data = []
+        """Create daily data, one row at a time."""
         for day in self.days:
             start = day.get("start")
             end = day.get("end")
             row = self._init_data_row(start, end)
-            row = self._update_data(row, start, end)
-            data.append(row)
-        return data
+            yield self._update_data(row, start, end)
 
     def generate_data(self, report_type=None):
         """Responsible for generating data."""
@@ -537,3 +560,10 @@ class AzureGenerator(AbstractGenerator):
     def get_meter_cache(self):
         """Return the meter cache for cross month generation."""
         return self._meter_cache
+
+    def get_meter(self):
+        """Return the reported meter id with its meter cache key and values, or None if no row was generated."""
+        if self._meter_id is None:
+            return None
+        cache_key = self._meter_cache_key(self._meter_id)
+        return str(self._meter_id), str(cache_key), self._meter_cache.get(cache_key)
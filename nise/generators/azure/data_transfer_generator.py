@@ -16,8 +16,6 @@
 #
 """Module for azure bandwidth data generation."""
 
-from random import choice
-
 from nise.generators.azure.azure_generator import AzureGenerator
 
 
@@ -70,11 +68,16 @@ class DTGenerator(AzureGenerator):
         """Pick additional info."""
         return self.ADDITIONAL_INFO.get(meter_name, {})
 
+    def _meter_cache_key(self, meter_id):
+        """Return the meter cache key of meter_id, which depends on the data direction."""
+        return f"{meter_id}_{self._data_direction}"
+
     def _get_cached_meter_values(self, meter_id, service_meter):
         """Return meter cached meter data to ensure meter_id and values are consistent."""
-        if not self._meter_cache.get(f"{meter_id}_{self._data_direction}"):
+        cache_key = self._meter_cache_key(meter_id)
+        if not self._meter_cache.get(cache_key):
             if self._data_direction:
-                self._meter_cache[f"{meter_id}_{self._data_direction}"] = service_meter.get(self._data_direction)
+                self._meter_cache[cache_key] = service_meter.get(self._data_direction)
             else:
-                self._meter_cache[f"{meter_id}_{self._data_direction}"] = service_meter.get(choice(list(service_meter)))
-        return self._meter_cache.get(f"{meter_id}_{self._data_direction}")
+                self._meter_cache[cache_key] = service_meter.get(self.random.choice(list(service_meter)))
+        return self._meter_cache.get(cache_key)
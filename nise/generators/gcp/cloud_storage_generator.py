@@ -17,7 +17,6 @@
 """Generator for GCP storage cost."""
 
 from datetime import datetime
-from random import choice
 
 from nise.generators.gcp.gcp_generator import GCP_REPORT_COLUMNS_JSONL
 from nise.generators.gcp.gcp_generator import GCPGenerator
@@ -49,9 +48,9 @@ class CloudStorageGenerator(GCPGenerator):
     def _update_data(self, row):  # noqa: C901
         """Update a data row with compute values."""
 
-        service = choice(self.SERVICES)
+        service = self.random.choice(self.SERVICES)
         sku_options = self.SKU_MAPPING[service[0]]
-        sku = choice(sku_options)
+        sku = self.random.choice(sku_options)
         row["service.description"] = service[0]
         row["service.id"] = service[1]
         row["sku.id"] = sku[0]
@@ -77,7 +76,7 @@ class CloudStorageGenerator(GCPGenerator):
 
         row["currency"] = self._currency
         row["labels"] = self.determine_labels(self.LABELS)
-        row["system_labels"] = choice(self.SYSTEM_LABELS)
+        row["system_labels"] = self.random.choice(self.SYSTEM_LABELS)
         if self.resource_level:
             resource = self._generate_resource(self.project.get("region"))
             row["resource.name"] = resource.get("name")
@@ -104,9 +103,9 @@ class JSONLCloudStorageGenerator(CloudStorageGenerator):
 
     def _update_data(self, row):  # noqa: C901
         """Update a data row with compute values."""
-        service_choice = choice(self.SERVICES)
+        service_choice = self.random.choice(self.SERVICES)
         sku_options = self.SKU_MAPPING[service_choice[0]]
-        sku_choice = choice(sku_options)
+        sku_choice = self.random.choice(sku_options)
         service = {}
         service["description"] = service_choice[0]
         service["id"] = service_choice[1]
@@ -147,7 +146,7 @@ class JSONLCloudStorageGenerator(CloudStorageGenerator):
 
         row["currency"] = self._currency
         row["labels"] = self.determine_labels(self.LABELS)
-        row["system_labels"] = choice(self.SYSTEM_LABELS)
+        row["system_labels"] = self.random.choice(self.SYSTEM_LABELS)
 
         return row
 
@@ -17,7 +17,6 @@
 """Module for gcp compute engine data generation."""
 
 from datetime import datetime
-from random import choice
 
 from nise.generators.gcp.gcp_generator import GCP_REPORT_COLUMNS_JSONL
 from nise.generators.gcp.gcp_generator import GCPGenerator
@@ -76,7 +75,7 @@ class ComputeEngineGenerator(GCPGenerator):
 
     def _update_data(self, row):  # noqa: C901
         """Update a data row with compute values."""
-        sku = choice(self.SKU)
+        sku = self.random.choice(self.SKU)
         if self._sku:
             sku = self._sku
         row["service.description"] = self.SERVICE[0]
@@ -132,7 +131,7 @@ class JSONLComputeEngineGenerator(ComputeEngineGenerator):
 
     def _update_data(self, row):  # noqa: C901
         """Update a data row with compute values."""
-        sku_choice = choice(self.SKU)
+        sku_choice = self.random.choice(self.SKU)
         if self._sku:
             sku_choice = self._sku
         service = {}
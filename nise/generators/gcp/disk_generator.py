@@ -16,15 +16,13 @@
 #
 """Module for gcp persistent disk."""
 
-import uuid
 from datetime import datetime
-from random import choice
-from random import uniform
 
 from nise.generators.gcp.gcp_generator import GCP_REPORT_COLUMNS_JSONL
 from nise.generators.gcp.gcp_generator import GCPGenerator
 from functools import cached_property
 from nise.helpers import gcp_calculate_persistent_disk_usage_amount
+from nise.util import random_uuid4
 from nise.helpers import gcp_calculate_usage_amount_in_pricing
 
 
@@ -61,7 +59,7 @@ class PersistentDiskGenerator(GCPGenerator):
         if not self._resource_name:
             self._resource_name = self.fake.word()
         if not self._price:
-            self._price = round(uniform(0, 0.01), 7)
+            self._price = round(self.random.uniform(0, 0.01), 7)
         self.validate_attributes()
 
     def validate_attributes(self):
@@ -76,28 +74,28 @@ class PersistentDiskGenerator(GCPGenerator):
             return region
         if region := self.project.get("region"):
             return region
-        return choice(self.DEFAULT_REGIONS)
+        return self.random.choice(self.DEFAULT_REGIONS)
 
     @cached_property
     def disk_id(self):
         if disk_id := self.attributes.get("disk_id"):
             return disk_id
-        return f"pvc-{uuid.uuid4()}"
+        return f"pvc-{random_uuid4(self.random)}"
 
     @cached_property
     def capacity(self):
         if capacity := self.attributes.get("capacity"):
             return int(capacity)
 
-        return choice(self.DEFAULT_CAPACITIES)
+        return self.random.choice(self.DEFAULT_CAPACITIES)
 
     @cached_property
     def sku_id(self):
-        return self.attributes.get("sku_id", choice(list(self.SKU_DESCRIPTION.keys())))
+        return self.attributes.get("sku_id", self.random.choice(list(self.SKU_DESCRIPTION.keys())))
 
     @cached_property
     def sku_description(self):
-        return self.SKU_DESCRIPTION.get(self.sku_id, choice(list(self.SKU_DESCRIPTION.values())))
+        return self.SKU_DESCRIPTION.get(self.sku_id, self.random.choice(list(self.SKU_DESCRIPTION.values())))
 
     @cached_property
     def usage_amount(self):
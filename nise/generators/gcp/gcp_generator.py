@@ -21,13 +21,15 @@ import json
 import string
 from abc import abstractmethod
 from dateutil.relativedelta import relativedelta
-from random import choice
-from random import randint
-from random import uniform
 import calendar
 from nise.util.constants import SECONDS_IN_HOUR
 
 from nise.generators.generator import AbstractGenerator
+from nise.generators.time_axis import TIMESTAMPS
+
+# can't use tz info - local reports doesn't work with "UTC",
+# BigQuery doesn't support UTC offset in the form of +HHMM
+GCP_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S"
 
 GCP_REPORT_COLUMNS = (
     "billing_account_id",
@@ -155,7 +157,7 @@ class GCPGenerator(AbstractGenerator):
         """
         super().__init__(start_date, end_date)
         self.project = project
-        self.num_instances = 1 if attributes else randint(2, 60)
+        self.num_instances = 1 if attributes else self.random.randint(2, 60)
         self.attributes = attributes or {}
         self.resource_level = self.attributes.get("resource_level", False)
         self.column_labels = GCP_REPORT_COLUMNS + GCP_RESOURCE_COLUMNS if self.resource_level else GCP_REPORT_COLUMNS
@@ -169,7 +171,7 @@ class GCPGenerator(AbstractGenerator):
         self._resource_global_name = self.attributes.get("resource.global_name")
         self._service = self.attributes.get("service.description")
         self._cross_over_metadata = self.attributes.get("cross_over", {})
-        self._instance_type = self.attributes.get("instance_type", choice(GCP_INSTANCE_TYPES))
+        self._instance_type = self.attributes.get("instance_type", self.random.choice(GCP_INSTANCE_TYPES))
         self._currency = self.attributes.get("currency", currency)
         self._sku = None
 
@@ -198,9 +200,7 @@ class GCPGenerator(AbstractGenerator):
         """Provide timestamp for a date."""
         if not in_date or not isinstance(in_date, datetime.datetime):
             raise ValueError("in_date must be a date object.")
-        # can't use tz info - local reports doesn't work with "UTC",
-        # BigQuery doesn't support UTC offset in the form of +HHMM
-        return in_date.strftime("%Y-%m-%dT%H:%M:%S")
+        return TIMESTAMPS.format(in_date, GCP_TIMESTAMP_FORMAT)
 
     @abstractmethod
     def generate_data(self, report_type=None):
@@ -227,11 +227,14 @@ class GCPGenerator(AbstractGenerator):
                 row[column] = GCPGenerator.timestamp(time_bill_end)
             elif column == "export_time":
                 export_time = time_bill_end + datetime.timedelta(
-                    hours=randint(1, 5), minutes=randint(1, 59), seconds=randint(1, 59)
+                    hours=self.random.randint(1, 5),
+                    minutes=self.random.randint(1, 59),
+                    seconds=self.random.randint(1, 59),
                 )
-                row[column] = GCPGenerator.timestamp(export_time)
+                # export times are random, so caching them would only evict the interval timestamps
+                row[column] = export_time.strftime(GCP_TIMESTAMP_FORMAT)
             elif column == "partition_date":
-                row[column] = time_bill_start.strftime("%Y-%m-%d")
+                row[column] = TIMESTAMPS.format(time_bill_start, "%Y-%m-%d")
         row.update(self.project)
         return row
 
@@ -267,7 +270,7 @@ class GCPGenerator(AbstractGenerator):
         if self._price:
             return pricing_amount * self._price
         else:
-            return round(uniform(0, 0.01), 7)
+            return round(self.random.uniform(0, 0.01), 7)
 
     def _gen_credit(self, credit_amount, json_return=False):
         """Generate the credit dict based off the hourly credit_amount."""
@@ -314,9 +317,9 @@ class GCPGenerator(AbstractGenerator):
         """Determine the labels based on tags param."""
         if not self._labels:
             if self.return_list:
-                return choice(labels)
+                return self.random.choice(labels)
             else:
-                return json.dumps(choice(labels))
+                return json.dumps(self.random.choice(labels))
         label_format = []
         for label in self._labels:
             if "key" not in label and "value" not in label:
@@ -337,7 +340,7 @@ class GCPGenerator(AbstractGenerator):
             name = self.fake.word()
             name = f"projects/{self.project_id}/instances/{name}"
         if not self._resource_global_name:
-            id = "".join([choice(string.digits) for _ in range(19)])
+            id = "".join([self.random.choice(string.digits) for _ in range(19)])
             global_name = f"//compute.googleapis.com/projects/{self.project_id}/zones/{region}/instances/{id}"
         return {"name": name, "global_name": global_name}
 
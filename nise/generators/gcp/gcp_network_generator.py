@@ -17,7 +17,6 @@
 """Module for gcp network data generation."""
 
 from datetime import datetime
-from random import choice
 
 from nise.generators.gcp.gcp_generator import GCP_REPORT_COLUMNS_JSONL
 from nise.generators.gcp.gcp_generator import GCPGenerator
@@ -58,10 +57,10 @@ class GCPNetworkGenerator(GCPGenerator):
 
     def _update_data(self, row):  # noqa: C901
         """Update a data row with compute values."""
-        service = choice(self.SERVICE)
+        service = self.random.choice(self.SERVICE)
         if self._service:
             service = self._service
-        sku = choice(self.SKU)
+        sku = self.random.choice(self.SKU)
         row["system_labels"] = "[]"
         row["service.description"] = service[0]
         row["service.id"] = service[1]
@@ -114,10 +113,10 @@ class JSONLGCPNetworkGenerator(GCPNetworkGenerator):
 
     def _update_data(self, row):  # noqa: C901
         """Update a data row with compute values."""
-        service_choice = choice(self.SERVICE)
+        service_choice = self.random.choice(self.SERVICE)
         if self._service:
             service_choice = self._service
-        sku_choice = choice(self.SKU)
+        sku_choice = self.random.choice(self.SKU)
         row["system_labels"] = []
         service = {}
         service["description"] = service_choice[0]
@@ -24,28 +24,28 @@ from faker import Faker
 class ProjectGenerator:
     """Generator for GCP Compute Engine data."""
 
-    fake_words = [Faker().word() for i in range(6)]
-    PROJECT_INFO = (  # id -  name, labels, ancestry_numbers
-        (
-            f"{fake_words[0]}-{fake_words[1]}-{fake_words[2]}",
-            f"{fake_words[0]}-{fake_words[1]}-{fake_words[2]}",
-            "[]",
-            "",
-        ),
-        (
-            f"{fake_words[3]}-{fake_words[4]}-{fake_words[5]}",
-            f"{fake_words[3]}-{fake_words[4]}-{fake_words[5]}",
-            "[{'key': 'foo', 'value': 'bar'}]",
-            "",
-        ),
-    )
-
     LOCATION = (("us-central1", "US", "us-central1", ""),)  # (Location, Country, Region, Zone)
 
     def __init__(self, account):
         """Initialize GCP Project Generator."""
         self.account = account
         self.fake = Faker()
+        # Drawn per instance rather than at import time so the names follow --seed.
+        fake_words = [self.fake.word() for i in range(6)]
+        self.PROJECT_INFO = (  # id -  name, labels, ancestry_numbers
+            (
+                f"{fake_words[0]}-{fake_words[1]}-{fake_words[2]}",
+                f"{fake_words[0]}-{fake_words[1]}-{fake_words[2]}",
+                "[]",
+                "",
+            ),
+            (
+                f"{fake_words[3]}-{fake_words[4]}-{fake_words[5]}",
+                f"{fake_words[3]}-{fake_words[4]}-{fake_words[5]}",
+                "[{'key': 'foo', 'value': 'bar'}]",
+                "",
+            ),
+        )
 
     def generate_projects(self, num_projects=2):
         """Generate GCP project information."""
@@ -76,28 +76,28 @@ class ProjectGenerator:
 class JSONLProjectGenerator:
     """Generator for GCP Compute Engine data."""
 
-    fake_words = [Faker().word() for i in range(6)]
-    PROJECT_INFO = (  # id -  name, labels, ancestry_numbers
-        (
-            f"{fake_words[0]}-{fake_words[1]}-{fake_words[2]}",
-            f"{fake_words[0]}-{fake_words[1]}-{fake_words[2]}",
-            [],
-            "",
-        ),
-        (
-            f"{fake_words[3]}-{fake_words[4]}-{fake_words[5]}",
-            f"{fake_words[3]}-{fake_words[4]}-{fake_words[5]}",
-            [{"key": "foo", "value": "bar"}],
-            "",
-        ),
-    )
-
     LOCATION = (("us-central1", "US", "us-central1", ""),)  # (Location, Country, Region, Zone)
 
     def __init__(self, account):
         """Initialize GCP Project Generator."""
         self.account = account
         self.fake = Faker()
+        # Drawn per instance rather than at import time so the names follow --seed.
+        fake_words = [self.fake.word() for i in range(6)]
+        self.PROJECT_INFO = (  # id -  name, labels, ancestry_numbers
+            (
+                f"{fake_words[0]}-{fake_words[1]}-{fake_words[2]}",
+                f"{fake_words[0]}-{fake_words[1]}-{fake_words[2]}",
+                [],
+                "",
+            ),
+            (
+                f"{fake_words[3]}-{fake_words[4]}-{fake_words[5]}",
+                f"{fake_words[3]}-{fake_words[4]}-{fake_words[5]}",
+                [{"key": "foo", "value": "bar"}],
+                "",
+            ),
+        )
 
     def generate_projects(self, num_projects=2):
         """Generate GCP project information."""
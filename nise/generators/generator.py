@@ -19,10 +19,19 @@
 import datetime
 from abc import ABC
 from abc import abstractmethod
+from functools import cached_property
+from random import getrandbits
+from random import Random
 
 from faker import Faker
 
+from nise.generators.time_axis import time_axis
+
 REPORT_TYPE = "report_type"
+ONE_SECOND = datetime.timedelta(seconds=1)
+ONE_QUARTER_HOUR = datetime.timedelta(minutes=15)
+ONE_HOUR = datetime.timedelta(minutes=60)
+ONE_DAY = datetime.timedelta(hours=24)
 
 
 class AbstractGenerator(ABC):
@@ -33,15 +42,30 @@ class AbstractGenerator(ABC):
         self.start_date = start_date
         self.end_date = end_date
         self.hour_delta = hour_delta
-        self.hours = self._set_hours()
-        self.quarter_hours = self._set_quarter_hours()
-        self.days = self._set_days()
-        self.fake = Faker()
+        self._validate_dates()
+        # seeds the generator's own streams, unless a subclass already drew from them
+        self.fake
         super().__init__()
 
-    def _set_hours(self):
-        """Create a list of hours between the start and end dates for hourly aws data."""
-        hours = []
+    @cached_property
+    def random(self):
+        """The generator's own random stream.
+
+        It is seeded from the ``random`` module while the generator is built, so ``seed_random``
+        right before building a generator decides everything it draws, however its rows are
+        interleaved with those of other generators.
+        """
+        return Random(getrandbits(64))
+
+    @cached_property
+    def fake(self):
+        """The generator's own Faker, seeded from its random stream."""
+        fake = Faker()
+        fake.seed_instance(self.random.getrandbits(64))
+        return fake
+
+    def _validate_dates(self):
+        """Check that the start and end dates form a valid range."""
         if not self.start_date or not self.end_date:
             raise ValueError("start_date and end_date must be date objects.")
         if not isinstance(self.start_date, datetime.datetime):
@@ -51,53 +75,29 @@ class AbstractGenerator(ABC):
         if self.end_date < self.start_date:
             raise ValueError("start_date must be a date object less than end_date.")
 
-        cur_date = self.start_date
-        while (cur_date + self.hour_delta) <= self.end_date:
-            cur_hours = {"start": cur_date, "end": cur_date + self.hour_delta}
-            hours.append(cur_hours)
-            cur_date = cur_date + datetime.timedelta(minutes=60)
-        return hours
+    def set_date_range(self, start_date, end_date):
+        """Move the generator to a new date range, keeping the resources it has already generated.
 
-    def _set_quarter_hours(self):
-        """Create a list of times between the start and end dates for 15 min intervals data."""
-        quarter_hours = []
-        if not self.start_date or not self.end_date:
-            raise ValueError("start_date and end_date must be date objects.")
-        if not isinstance(self.start_date, datetime.datetime):
-            raise ValueError("start_date must be a date object.")
-        if not isinstance(self.end_date, datetime.datetime):
-            raise ValueError("end_date must be a date object.")
-        if self.end_date < self.start_date:
-            raise ValueError("start_date must be a date object less than end_date.")
-
-        one_quarter_hour = datetime.timedelta(minutes=15)
-        one_second = datetime.timedelta(seconds=1)
-        cur_date = self.start_date
-        while (cur_date + one_quarter_hour) <= self.end_date:
-            cur_quarter_hours = {"start": cur_date + one_second, "end": cur_date + one_quarter_hour}
-            quarter_hours.append(cur_quarter_hours)
-            cur_date = cur_date + one_quarter_hour
-        return quarter_hours
-
-    def _set_days(self):
-        """Create a list of days between the start and end dates for daily azure data."""
-        days = []
-        if not self.start_date or not self.end_date:
-            raise ValueError("start_date and end_date must be date objects.")
-        if not isinstance(self.start_date, datetime.datetime):
-            raise ValueError("start_date must be a date object.")
-        if not isinstance(self.end_date, datetime.datetime):
-            raise ValueError("end_date must be a date object.")
-        if self.end_date < self.start_date:
-            raise ValueError("start_date must be a date object less than end_date.")
-
-        one_day = datetime.timedelta(hours=24)
-        cur_date = self.start_date
-        while (cur_date + one_day) <= self.end_date:
-            cur_days = {"start": cur_date, "end": cur_date + one_day}
-            days.append(cur_days)
-            cur_date = cur_date + one_day
-        return days
+        Hourly data generated afterwards only covers the new range.
+        """
+        self.start_date = start_date
+        self.end_date = end_date
+        self._validate_dates()
+
+    @property
+    def hours(self):
+        """The hours between the start and end dates for hourly data."""
+        return time_axis(self.start_date, self.end_date, ONE_HOUR, self.hour_delta)
+
+    @property
+    def quarter_hours(self):
+        """The 15 minute intervals between the start and end dates, each starting one second in."""
+        return time_axis(self.start_date, self.end_date, ONE_QUARTER_HOUR, start_offset=ONE_SECOND)
+
+    @property
+    def days(self):
+        """The days between the start and end dates for daily data."""
+        return time_axis(self.start_date, self.end_date, ONE_DAY)
 
     @staticmethod
     def next_month(in_date):
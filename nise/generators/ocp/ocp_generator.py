@@ -17,24 +17,27 @@
 """Defines the abstract generator."""
 
 import datetime
+import random
+from collections import Counter
 from collections import defaultdict
 from copy import deepcopy
-from random import choice
-from random import choices
-from random import randint
-from random import uniform
+from functools import partial
 from string import ascii_lowercase
+from types import MappingProxyType
+from typing import NamedTuple
 from uuid import NAMESPACE_DNS
-from uuid import uuid4
 from uuid import uuid5
 
 from dateutil import parser
-from faker import Faker
 
 from nise.generators.generator import AbstractGenerator
 from nise.generators.generator import REPORT_TYPE
-
-FAKER = Faker()
+from nise.generators.ocp import ros_numpy
+from nise.generators.row import render_csv
+from nise.generators.row import RenderedRow
+from nise.generators.time_axis import TIMESTAMPS
+from nise.util import derive_seed
+from nise.util import random_uuid4
 
 GIGABYTE = 1024 * 1024 * 1024
 HOUR = 60 * 60
@@ -389,9 +392,86 @@ GPU_MEMORY_CAPACITY = {
 
 GPU_VENDOR = "nvidia_com_gpu"
 
+# Pod and VM keys that drive the usage calculations and are not copied into report rows.
+POD_SETTINGS = (
+    "cpu_limit",
+    "mem_limit_gig",
+    "cpu_request",
+    "mem_request_gig",
+    "cpu_usage",
+    "mem_usage_gig",
+    "pod_seconds",
+)
+ROS_CPU_METRICS = (
+    "cpu_usage_container_avg",
+    "cpu_usage_container_min",
+    "cpu_usage_container_max",
+    "cpu_usage_container_sum",
+    "cpu_throttle_container_avg",
+    "cpu_throttle_container_max",
+    "cpu_throttle_container_sum",
+)
+ROS_MEMORY_METRICS = (
+    "memory_usage_container_avg",
+    "memory_usage_container_min",
+    "memory_usage_container_max",
+    "memory_usage_container_sum",
+    "memory_rss_usage_container_avg",
+    "memory_rss_usage_container_min",
+    "memory_rss_usage_container_max",
+    "memory_rss_usage_container_sum",
+)
+VM_SETTINGS = ("cpu_usage", "mem_usage_gig", "vm_seconds", "vc_capacity")
+
+
+class FrozenRecord(NamedTuple):
+    """A pod or VM split into the columns copied to every row and the settings used to compute usage."""
+
+    columns: MappingProxyType
+    settings: MappingProxyType
+
+
+def freeze_record(record, settings_keys):
+    """Freeze a pod or VM dict once so hourly rows can be built from it without copying."""
+    columns = {key: value for key, value in record.items() if key not in settings_keys}
+    settings = {key: record.get(key) for key in settings_keys}
+    return FrozenRecord(MappingProxyType(columns), MappingProxyType(settings))
+
+
+class HourSlot(NamedTuple):
+    """An hour of the time axis and the quarter hours starting in it, as (start, end, interval columns)."""
+
+    hours: tuple
+    quarter_hours: list
+
+
+class DailyUsage(dict):
+    """A usage map keyed by date strings and "full_period", indexed by date for hourly lookups.
+
+    The keys are parsed once, when the map is built. Like the linear search it replaces, a date
+    listed after "full_period" is never used and the first entry for a repeated date wins.
+    """
+
+    __slots__ = ("_by_date", "_full_period")
+
+    def __init__(self, usage):
+        """Initialize the map and index it by date."""
+        super().__init__(usage)
+        self._by_date = {}
+        self._full_period = None
+        for key, value in self.items():
+            if key == "full_period":
+                self._full_period = value
+                break
+            self._by_date.setdefault(parser.parse(str(key)).date(), value)
+
+    def for_date(self, day):
+        """Return the usage for a date, falling back to the full period usage."""
+        return self._by_date.get(day, self._full_period)
+
 
-def get_storage_class_and_driver():
-    return choice(
+def get_storage_class_and_driver(rng=random):
+    return rng.choice(
         (
             ("gp3-csi", "ebs.csi.aws.com"),
             ("fast", "disk.csi.azure.com"),
@@ -401,12 +481,14 @@ def get_storage_class_and_driver():
     )
 
 
-def get_owner_workload(pod, workload=None):
+def get_owner_workload(pod, workload=None, rng=random):
     if not workload:
-        workload = choice(list(OCP_OWNER_WORKLOAD_CHOICES.keys())[:-2])  # omit job and manual_pod from random choices
+        workload = rng.choice(
+            list(OCP_OWNER_WORKLOAD_CHOICES.keys())[:-2]
+        )  # omit job and manual_pod from random choices
     on, ok, wl, wt = OCP_OWNER_WORKLOAD_CHOICES.get(
         workload.lower(),
-        choice(list(OCP_OWNER_WORKLOAD_CHOICES.values())[:-2]),  # omit job and manual_pod from random choices
+        rng.choice(list(OCP_OWNER_WORKLOAD_CHOICES.values())[:-2]),  # omit job and manual_pod from random choices
     )
     if on == "<none>" and wl == "<none>":  # manually created Pod
         return on, ok, wl, wt
@@ -415,13 +497,13 @@ def get_owner_workload(pod, workload=None):
     return pod, ok, pod, wt
 
 
-def generate_randomized_ros_usage(usage_dict, limit_value, generate_constant_value=False):
+def generate_randomized_ros_usage(usage_dict, limit_value, generate_constant_value=False, rng=random):
     if generate_constant_value:
         # will generate constant values
         if usage_value := usage_dict.get("full_period"):
             avg_value = min(round(usage_value, 5), limit_value)
         else:
-            avg_value = round(uniform(limit_value * 0.1, limit_value), 5)
+            avg_value = round(rng.uniform(limit_value * 0.1, limit_value), 5)
 
         min_value = avg_value
         max_value = avg_value
@@ -429,26 +511,26 @@ def generate_randomized_ros_usage(usage_dict, limit_value, generate_constant_val
         # This will generate randomised values
         # if usage value is provided in yaml -> avg_value = +- 5% of that specified usage value
         if usage_value := usage_dict.get("full_period"):
-            avg_value = min(round(uniform(usage_value * 0.95, usage_value * 1.05), 5), limit_value)
+            avg_value = min(round(rng.uniform(usage_value * 0.95, usage_value * 1.05), 5), limit_value)
         # if usage value is not specified in yaml -> random avg_usage from 10% to 100% of the limit
         else:
-            avg_value = round(uniform(limit_value * 0.1, limit_value), 5)
+            avg_value = round(rng.uniform(limit_value * 0.1, limit_value), 5)
 
         # min value - random float derived from avg_value,
-        min_value = round(uniform(avg_value * 0.8, avg_value), 5)
+        min_value = round(rng.uniform(avg_value * 0.8, avg_value), 5)
         # max_value - random float derived from avg_value, but max of limit_value
-        max_value = min(round(uniform(avg_value, avg_value * 1.2), 5), limit_value)
+        max_value = min(round(rng.uniform(avg_value, avg_value * 1.2), 5), limit_value)
     return avg_value, min_value, max_value
 
 
-def get_vm_instance(vm=None):
+def get_vm_instance(vm=None, rng=random):
     vm = vm or {}
     return {
-        "vm_instance_type": vm.get("instance_type") or choice(VM_INSTANCE_TYPES),
-        "vm_os": vm.get("os") or choice(VM_OS_TYPES),
-        "vm_guest_os_arch": vm.get("guest_os_arch") or choice(VM_GUEST_ARCH),
-        "vm_guest_os_name": vm.get("guest_os_name") or choice(VM_GUEST_OS),
-        "vm_guest_os_version": vm.get("guest_os_version") or choice(VM_GUEST_VERSION),
+        "vm_instance_type": vm.get("instance_type") or rng.choice(VM_INSTANCE_TYPES),
+        "vm_os": vm.get("os") or rng.choice(VM_OS_TYPES),
+        "vm_guest_os_arch": vm.get("guest_os_arch") or rng.choice(VM_GUEST_ARCH),
+        "vm_guest_os_name": vm.get("guest_os_name") or rng.choice(VM_GUEST_OS),
+        "vm_guest_os_version": vm.get("guest_os_version") or rng.choice(VM_GUEST_VERSION),
     }
 
 
@@ -465,13 +547,28 @@ class OCPGenerator(AbstractGenerator):
     """Defines a abstract class for generators."""
 
     def __init__(
-        self, start_date, end_date, attributes, ros_ocp_info=False, constant_values_ros_ocp=False, ros_only=False
+        self,
+        start_date,
+        end_date,
+        attributes,
+        ros_ocp_info=False,
+        constant_values_ros_ocp=False,
+        ros_only=False,
+        ros_ocp_numpy=False,
+        node_shard=None,
     ):
-        """Initialize the generator."""
+        """Initialize the generator.
+
+        node_shard is an optional (index, count) pair. The generator then only keeps every
+        count-th node name, starting at index, and generates data for those nodes alone. The
+        rows of a node are the same whichever shard it is in.
+        """
         self._nodes = None
+        self._row_templates = {}
         self.ros_ocp_info = ros_ocp_info
         self.constant_values_ros_ocp = constant_values_ros_ocp
         self.ros_only = ros_only
+        self.ros_ocp_numpy = ros_ocp_numpy
         if attributes:
             self._nodes = attributes.get("nodes")
 
@@ -502,22 +599,30 @@ class OCPGenerator(AbstractGenerator):
             self.fake.word(),
         ]
         self.pod_pvc_map = {}
+        self._mapped_pvcs = Counter()
+        self._volume_claims = None
         self.vm_pod_map = {}
         self.nodes = self._gen_nodes()
         self.namespaces = self._gen_namespaces(self.nodes)
         self.pods, self.namespace2pods, self.ros_data = self._gen_pods(self.namespaces)
+        self._ros_namespace_cache = None
 
         self.volumes = self._gen_volumes(self.namespaces, self.namespace2pods)
         self.vms, self.namespace2vm = self._gen_virtual_machines(self.namespaces)
         self.gpus = self._gen_gpus()
+        if node_shard:
+            # every shard draws the whole cluster, so what a node gets does not depend on the shard layout
+            self._keep_node_shard(*node_shard)
 
         ros_reports = {
             OCP_ROS_USAGE: {
                 "_generate_hourly_data": self._gen_quarter_hourly_ros_ocp_pods_usage,
+                "_hour_rows": self._ros_pod_usage_hour_rows,
                 "_update_data": self._update_ros_ocp_pod_data,
             },
             OCP_ROS_NAMESPACE_USAGE: {
                 "_generate_hourly_data": self._gen_quarter_hourly_ros_ocp_namespace_usage,
+                "_hour_rows": self._ros_namespace_usage_hour_rows,
                 "_update_data": self._update_ros_ocp_namespace_data,
             },
         }
@@ -529,26 +634,32 @@ class OCPGenerator(AbstractGenerator):
             self.ocp_report_generation = {
                 OCP_POD_USAGE: {
                     "_generate_hourly_data": self._gen_hourly_pods_usage,
+                    "_hour_rows": self._pod_usage_hour_rows,
                     "_update_data": self._update_pod_data,
                 },
                 OCP_STORAGE_USAGE: {
                     "_generate_hourly_data": self._gen_hourly_storage_usage,
+                    "_hour_rows": self._storage_usage_hour_rows,
                     "_update_data": self._update_storage_data,
                 },
                 OCP_NODE_LABEL: {
                     "_generate_hourly_data": self._gen_hourly_node_label_usage,
+                    "_hour_rows": self._node_label_hour_rows,
                     "_update_data": self._update_node_label_data,
                 },
                 OCP_NAMESPACE_LABEL: {
                     "_generate_hourly_data": self._gen_hourly_namespace_label_usage,
+                    "_hour_rows": self._namespace_label_hour_rows,
                     "_update_data": self._update_namespace_label_data,
                 },
                 OCP_VM_USAGE: {
                     "_generate_hourly_data": self._gen_hourly_vm_usage,
+                    "_hour_rows": self._vm_usage_hour_rows,
                     "_update_data": self._update_vm_data,
                 },
                 OCP_GPU_USAGE: {
                     "_generate_hourly_data": self._gen_hourly_gpu_usage,
+                    "_hour_rows": self._gpu_usage_hour_rows,
                     "_update_data": self._update_gpu_data,
                 },
             }
@@ -556,21 +667,25 @@ class OCPGenerator(AbstractGenerator):
             if self.ros_ocp_info:
                 self.ocp_report_generation.update(ros_reports)
 
+        # every report type draws its rows from a stream of its own, see _walk_hours
+        self._report_seed = self.random.getrandbits(64)
+        self._report_randoms = {}
+
     @staticmethod
     def timestamp(in_date):
         """Provide timestamp for a date."""
         if not (in_date and isinstance(in_date, datetime.datetime)):
             raise ValueError("in_date must be a date object.")
-        return in_date.strftime("%Y-%m-%d %H:%M:%S +0000 UTC")
+        return TIMESTAMPS.format(in_date, "%Y-%m-%d %H:%M:%S +0000 UTC")
 
     def _gen_nodes(self):
         """Create nodes for report."""
         nodes = []
         if self._nodes:
             for item in self._nodes:
-                memory_gig = item.get("memory_gig", randint(2, 8))
+                memory_gig = item.get("memory_gig", self.random.randint(2, 8))
                 memory_bytes = memory_gig * GIGABYTE
-                resource_id = str(item.get("resource_id", uuid4().hex[:AWS_RESID_LENGTH]))
+                resource_id = str(item.get("resource_id", random_uuid4(self.random).hex[:AWS_RESID_LENGTH]))
                 # Handle empty namespaces
                 raw_namespaces = item.get("namespaces", {})
                 if raw_namespaces is None:
@@ -581,7 +696,7 @@ class OCPGenerator(AbstractGenerator):
                 }
                 node = {
                     "name": item.get("node_name", "node_" + self.fake.word()),
-                    "cpu_cores": item.get("cpu_cores", randint(2, 16)),
+                    "cpu_cores": item.get("cpu_cores", self.random.randint(2, 16)),
                     "memory_bytes": memory_bytes,
                     "resource_id": "i-" + resource_id,
                     "namespaces": processed_namespaces,
@@ -589,21 +704,35 @@ class OCPGenerator(AbstractGenerator):
                 }
                 nodes.append(node)
         else:
-            num_nodes = randint(2, 6)
+            num_nodes = self.random.randint(2, 6)
             seeded_labels = {"node-role.kubernetes.io/master": [""], "node-role.kubernetes.io/infra": [""]}
             for _ in range(num_nodes):
-                memory_gig = randint(2, 8)
+                memory_gig = self.random.randint(2, 8)
                 memory_bytes = memory_gig * GIGABYTE
                 node = {
                     "name": "node_" + self.fake.word(),
-                    "cpu_cores": randint(2, 16),
+                    "cpu_cores": self.random.randint(2, 16),
                     "memory_bytes": memory_bytes,
-                    "resource_id": "i-" + uuid4().hex[:AWS_RESID_LENGTH],
+                    "resource_id": "i-" + random_uuid4(self.random).hex[:AWS_RESID_LENGTH],
                     "node_labels": self._gen_openshift_labels(seeding=seeded_labels),
                 }
                 nodes.append(node)
         return nodes
 
+    def _keep_node_shard(self, shard_index, shard_count):
+        """Drop everything that does not run on every shard_count-th node name, starting at shard_index."""
+        node_names = list(dict.fromkeys(node.get("name") for node in self.nodes))
+        shard = set(node_names[shard_index::shard_count])
+        self.nodes = [node for node in self.nodes if node.get("name") in shard]
+        self.namespaces = {name: node for name, node in self.namespaces.items() if node.get("name") in shard}
+        self.namespace2pods = {name: pods for name, pods in self.namespace2pods.items() if name in self.namespaces}
+        self.namespace2vm = {name: vms for name, vms in self.namespace2vm.items() if name in self.namespaces}
+        self.pods = {name: pod for name, pod in self.pods.items() if pod.get("node") in shard}
+        self.ros_data = {name: ros_pod for name, ros_pod in self.ros_data.items() if name in self.pods}
+        self.vms = {name: vm for name, vm in self.vms.items() if vm.get("node") in shard}
+        self.volumes = [volume for volume in self.volumes if all(vol.get("node") in shard for vol in volume.values())]
+        self.gpus = {name: gpus for name, gpus in self.gpus.items() if name in self.pods}
+
     def _gen_namespaces(self, nodes):
         """Create namespaces on specific nodes and keep relationship."""
         namespaces = {}
@@ -613,9 +742,9 @@ class OCPGenerator(AbstractGenerator):
                     namespace = name
                     namespaces[namespace] = node
             else:
-                num_namespaces = randint(2, 12)
+                num_namespaces = self.random.randint(2, 12)
                 for _ in range(num_namespaces):
-                    namespace_suffix = choice(("ci", "qa", "prod", "proj", "dev", "staging"))
+                    namespace_suffix = self.random.choice(("ci", "qa", "prod", "proj", "dev", "staging"))
                     namespace = self.fake.word() + "_" + namespace_suffix
                     namespaces[namespace] = node
         return namespaces
@@ -640,14 +769,14 @@ class OCPGenerator(AbstractGenerator):
             self.fake.word(),
         ]
         all_label_keys = list(seeded_labels.keys()) + gen_label_keys
-        num_labels = randint(2, len(all_label_keys))
-        chosen_label_keys = choices(all_label_keys, k=num_labels)
+        num_labels = self.random.randint(2, len(all_label_keys))
+        chosen_label_keys = self.random.choices(all_label_keys, k=num_labels)
 
         labels = {}
         for label_key in chosen_label_keys:
             label_value = self.fake.word()
             if label_key in seeded_labels:
-                label_value = choice(seeded_labels[label_key])
+                label_value = self.random.choice(seeded_labels[label_key])
             labels[f"label_{label_key}"] = label_value
 
         return "|".join(f"{key}:{value}" for key, value in labels.items())
@@ -659,7 +788,7 @@ class OCPGenerator(AbstractGenerator):
         memory_bytes = node.get("memory_bytes")
 
         cpu_limit = min(specified_pod.get("cpu_limit", cpu_cores), cpu_cores)
-        cpu_request = min(specified_pod.get("cpu_request", round(uniform(0.02, cpu_limit), 5)), cpu_limit)
+        cpu_request = min(specified_pod.get("cpu_request", round(self.random.uniform(0.02, cpu_limit), 5)), cpu_limit)
         cpu_usage = specified_pod.get("cpu_usage", {})
         for key, value in cpu_usage.items():
             if value > cpu_limit:
@@ -667,7 +796,9 @@ class OCPGenerator(AbstractGenerator):
 
         memory_gig = memory_bytes / GIGABYTE
         mem_limit_gig = min(specified_pod.get("mem_limit_gig", memory_gig), memory_gig)
-        mem_request_gig = min(specified_pod.get("mem_request_gig", round(uniform(25.0, 80.0), 2)), mem_limit_gig)
+        mem_request_gig = min(
+            specified_pod.get("mem_request_gig", round(self.random.uniform(25.0, 80.0), 2)), mem_limit_gig
+        )
         memory_usage_gig = specified_pod.get("mem_usage_gig", {})
         for key, value in memory_usage_gig.items():
             if value > mem_limit_gig:
@@ -687,24 +818,28 @@ class OCPGenerator(AbstractGenerator):
             "mem_request_gig": mem_request_gig,
             "mem_limit_gig": mem_limit_gig,
             "pod_labels": specified_pod.get("labels", None),
-            "cpu_usage": cpu_usage,
-            "mem_usage_gig": memory_usage_gig,
+            "cpu_usage": DailyUsage(cpu_usage),
+            "mem_usage_gig": DailyUsage(memory_usage_gig),
             "pod_seconds": specified_pod.get("pod_seconds"),
         }
 
-        owner_name, owner_kind, workload, workload_type = get_owner_workload(pod_name, specified_pod.get("workload"))
+        owner_name, owner_kind, workload, workload_type = get_owner_workload(
+            pod_name, specified_pod.get("workload"), rng=self.random
+        )
 
         cpu_usage_avg, cpu_usage_min, cpu_usage_max = generate_randomized_ros_usage(
-            cpu_usage, cpu_limit, generate_constant_value=self.constant_values_ros_ocp
+            cpu_usage, cpu_limit, generate_constant_value=self.constant_values_ros_ocp, rng=self.random
         )
         memory_usage_gig_avg, memory_usage_gig_min, memory_usage_gig_max = generate_randomized_ros_usage(
-            memory_usage_gig, mem_limit_gig, generate_constant_value=self.constant_values_ros_ocp
+            memory_usage_gig, mem_limit_gig, generate_constant_value=self.constant_values_ros_ocp, rng=self.random
         )
         if self.constant_values_ros_ocp:
             memory_rss_ratio = 1 / round(1, 2)
         else:
-            memory_rss_ratio = 1 / round(uniform(1.01, 1.9), 2)
-        cpu_throttle = choices([0, round(cpu_usage_avg / randint(10, 20), 5)], weights=(3, 1))[0]
+            memory_rss_ratio = 1 / round(self.random.uniform(1.01, 1.9), 2)
+        cpu_throttle = self.random.choices([0, round(cpu_usage_avg / self.random.randint(10, 20), 5)], weights=(3, 1))[
+            0
+        ]
 
         ros_pod = {
             "namespace": namespace,
@@ -752,6 +887,7 @@ class OCPGenerator(AbstractGenerator):
             namespace2pod[namespace] = []
             if node.get("namespaces"):
                 specified_pods = node.get("namespaces").get(namespace).get("pods") or []
+                vm_names = None
                 for specified_pod in specified_pods:
                     pod_name, pod, ros_pod = self._gen_specific_pod(node, namespace, specified_pod)
                     namespace2pod[namespace].append(pod_name)
@@ -761,7 +897,8 @@ class OCPGenerator(AbstractGenerator):
                     # add pods that are labeled as a VM to the list of VMs
                     if vm := get_vm_from_label(specified_pod.get("labels", "")):
                         vms = node["namespaces"][namespace].get("virtual_machines") or []
-                        vm_names = {v.get("vm_name") for v in vms}
+                        if vm_names is None:
+                            vm_names = {v.get("vm_name") for v in vms}
                         if vm not in self.vm_pod_map:
                             self.vm_pod_map[vm] = pod_name
                         if vm in vm_names:
@@ -771,21 +908,22 @@ class OCPGenerator(AbstractGenerator):
                         if vm_seconds := pod_copy.get("pod_seconds"):
                             pod_copy["vm_seconds"] = vm_seconds
                         vms.append(pod_copy)
+                        vm_names.add(vm)
                         node["namespaces"][namespace]["virtual_machines"] = vms
             else:
-                num_pods = randint(2, 20)
+                num_pods = self.random.randint(2, 20)
                 for _ in range(num_pods):
-                    pod_suffix = "".join(choices(ascii_lowercase, k=5))
-                    pod_type = choice(("build", "deploy", pod_suffix))
+                    pod_suffix = "".join(self.random.choices(ascii_lowercase, k=5))
+                    pod_type = self.random.choice(("build", "deploy", pod_suffix))
                     pod_name = f"{self.fake.word()}_{pod_type}"
                     namespace2pod[namespace].append(pod_name)
                     cpu_cores = node.get("cpu_cores")
-                    cpu_limit = round(uniform(0.02, cpu_cores), 5)
-                    cpu_request = round(uniform(0.02, cpu_limit), 5)
+                    cpu_limit = round(self.random.uniform(0.02, cpu_cores), 5)
+                    cpu_request = round(self.random.uniform(0.02, cpu_limit), 5)
                     memory_bytes = node.get("memory_bytes")
                     memory_gig = memory_bytes / GIGABYTE
-                    mem_limit_gig = round(uniform(25.0, memory_gig), 2)
-                    mem_request_gig = round(uniform(25.0, mem_limit_gig), 2)
+                    mem_limit_gig = round(self.random.uniform(25.0, memory_gig), 2)
+                    mem_request_gig = round(self.random.uniform(25.0, mem_limit_gig), 2)
 
                     pods[pod_name] = {
                         "namespace": namespace,
@@ -802,15 +940,17 @@ class OCPGenerator(AbstractGenerator):
                         "mem_limit_gig": mem_limit_gig,
                         "pod_labels": self._gen_openshift_labels(),
                     }
-                    owner_name, owner_kind, workload, workload_type = get_owner_workload(pod_name)
+                    owner_name, owner_kind, workload, workload_type = get_owner_workload(pod_name, rng=self.random)
                     cpu_usage_avg, cpu_usage_min, cpu_usage_max = generate_randomized_ros_usage(
-                        {}, cpu_limit, generate_constant_value=self.constant_values_ros_ocp
+                        {}, cpu_limit, generate_constant_value=self.constant_values_ros_ocp, rng=self.random
                     )
                     memory_usage_gig_avg, memory_usage_gig_min, memory_usage_gig_max = generate_randomized_ros_usage(
-                        {}, mem_limit_gig, generate_constant_value=self.constant_values_ros_ocp
+                        {}, mem_limit_gig, generate_constant_value=self.constant_values_ros_ocp, rng=self.random
                     )
-                    memory_rss_ratio = 1 / round(uniform(1.01, 1.9), 2)
-                    cpu_throttle = choices([0, round(cpu_usage_avg / randint(10, 20), 5)], weights=(3, 1))[0]
+                    memory_rss_ratio = 1 / round(self.random.uniform(1.01, 1.9), 2)
+                    cpu_throttle = self.random.choices(
+                        [0, round(cpu_usage_avg / self.random.randint(10, 20), 5)], weights=(3, 1)
+                    )[0]
 
                     ros_ocp_data_pods[pod_name] = {
                         "namespace": namespace,
@@ -851,7 +991,7 @@ class OCPGenerator(AbstractGenerator):
         return pods, namespace2pod, ros_ocp_data_pods
 
     def _gen_specific_volume(self, node, namespace, specified_volume):
-        storage_class_default, csi_default = get_storage_class_and_driver()
+        storage_class_default, csi_default = get_storage_class_and_driver(rng=self.random)
         volume = specified_volume.get("volume_name", f"pv-{self.fake.word()}")
         volume_request_gig = specified_volume.get("volume_request_gig") or 100
         volume_request = volume_request_gig * GIGABYTE
@@ -875,19 +1015,21 @@ class OCPGenerator(AbstractGenerator):
                 "labels": specified_vc.get("labels", None),
                 "capacity": claim_capacity,
                 "pod": pod,
-                "volume_claim_usage_gig": usage_gig,
+                "volume_claim_usage_gig": DailyUsage(usage_gig) if usage_gig else usage_gig,
             }
             total_claims += claim_capacity
             if total_claims > volume_request:
                 raise ValueError(f"Total claims {total_claims} is greater than volume request {volume_request}")
-            self.pod_pvc_map[pod] = vol_claim
+            self._map_pod_to_pvc(pod, vol_claim)
         return volume, {
             "node": node.get("name"),
             "namespace": namespace,
             "volume": volume,
             "storage_class": specified_volume.get("storage_class", storage_class_default),
             "csi_driver": specified_volume.get("csi_driver", csi_default),
-            "csi_volume_handle": specified_volume.get("csi_volume_handle", f"vol-{uuid4().hex[:AWS_RESID_LENGTH]}"),
+            "csi_volume_handle": specified_volume.get(
+                "csi_volume_handle", f"vol-{random_uuid4(self.random).hex[:AWS_RESID_LENGTH]}"
+            ),
             "volume_request": volume_request,
             "labels": specified_volume.get("labels", None),
             "volume_claims": volume_claims,
@@ -903,12 +1045,12 @@ class OCPGenerator(AbstractGenerator):
                     volume_name, volume = self._gen_specific_volume(node, namespace, specified_volume)
                     volumes.append({volume_name: volume})
             else:
-                num_volumes = randint(1, 3)
-                num_vol_claims = randint(1, 2)
+                num_volumes = self.random.randint(1, 3)
+                num_vol_claims = self.random.randint(1, 2)
                 for _ in range(num_volumes):
-                    vol_suffix = "".join(choices(ascii_lowercase, k=10))
+                    vol_suffix = "".join(self.random.choices(ascii_lowercase, k=10))
                     volume = "pv" + "-" + vol_suffix
-                    vol_request_gig = round(uniform(25.0, 80.0), 2)
+                    vol_request_gig = round(self.random.uniform(25.0, 80.0), 2)
                     vol_request = vol_request_gig * GIGABYTE
                     volume_claims = {}
                     total_claims = 0
@@ -916,8 +1058,10 @@ class OCPGenerator(AbstractGenerator):
                         if vol_request - total_claims <= GIGABYTE:
                             break
                         vol_claim = self.fake.word()
-                        pod = choice(namespace2pods[namespace])
-                        claim_capacity = round(uniform(1.0, (vol_request_gig - total_claims / GIGABYTE)), 2) * GIGABYTE
+                        pod = self.random.choice(namespace2pods[namespace])
+                        claim_capacity = (
+                            round(self.random.uniform(1.0, (vol_request_gig - total_claims / GIGABYTE)), 2) * GIGABYTE
+                        )
                         volume_claims[vol_claim] = {
                             "namespace": namespace,
                             "volume": volume,
@@ -926,8 +1070,8 @@ class OCPGenerator(AbstractGenerator):
                             "pod": pod,
                         }
                         total_claims += claim_capacity
-                        self.pod_pvc_map[pod] = vol_claim
-                    storage_class_default, csi_default = get_storage_class_and_driver()
+                        self._map_pod_to_pvc(pod, vol_claim)
+                    storage_class_default, csi_default = get_storage_class_and_driver(rng=self.random)
                     volumes.append(
                         {
                             volume: {
@@ -936,7 +1080,7 @@ class OCPGenerator(AbstractGenerator):
                                 "volume": volume,
                                 "storage_class": storage_class_default,
                                 "csi_driver": csi_default,
-                                "csi_volume_handle": f"vol-{uuid4().hex[:AWS_RESID_LENGTH]}",
+                                "csi_volume_handle": f"vol-{random_uuid4(self.random).hex[:AWS_RESID_LENGTH]}",
                                 "volume_request": vol_request,
                                 "labels": self._gen_openshift_labels(),
                                 "volume_claims": volume_claims,
@@ -945,13 +1089,35 @@ class OCPGenerator(AbstractGenerator):
                     )
         return volumes
 
+    def _map_pod_to_pvc(self, pod_name, pvc_name):
+        """Record the PVC of a pod, keeping count of how many pods map to each PVC."""
+        if pod_name in self.pod_pvc_map:
+            self._mapped_pvcs[self.pod_pvc_map[pod_name]] -= 1
+        self.pod_pvc_map[pod_name] = pvc_name
+        self._mapped_pvcs[pvc_name] += 1
+
+    def _volume_claim_index(self):
+        """Return the volume claims by name, where the first volume listing a claim name wins.
+
+        Volumes appended to self.volumes since the last call are indexed on the way, so the
+        index keeps up while volumes for VMs are being added.
+        """
+        if self._volume_claims is None or self._volume_claims[0] is not self.volumes:
+            self._volume_claims = [self.volumes, 0, {}]
+        volumes, indexed, claims = self._volume_claims
+        for volume in volumes[indexed:]:
+            for vol in volume.values():
+                for pvc, specific_pvc in vol["volume_claims"].items():
+                    if specific_pvc:
+                        claims.setdefault(pvc, specific_pvc)
+        self._volume_claims[1] = len(volumes)
+        return claims
+
     def get_specific_pvc_from_pod(self, pod_name):
         if not (pvc := self.pod_pvc_map.get(pod_name)):
             return "", {}
-        for volume in self.volumes:
-            for vol_name, vol in volume.items():
-                if specific_pvc := vol["volume_claims"].get(pvc):
-                    return pvc, specific_pvc
+        if specific_pvc := self._volume_claim_index().get(pvc):
+            return pvc, specific_pvc
         return "", {}
 
     def get_vm_disk(self, *, specified_vc=None, pod_name="", static_report=False):
@@ -971,8 +1137,8 @@ class OCPGenerator(AbstractGenerator):
             if static_report:
                 return {}
         vm_disk |= {
-            "vm_persistentvolumeclaim_name": specified_vc.get("volume_claim_name", FAKER.word()),
-            "vc_capacity": specified_vc.get("capacity_gig", randint(30, 50)) * GIGABYTE,
+            "vm_persistentvolumeclaim_name": specified_vc.get("volume_claim_name", self.fake.word()),
+            "vc_capacity": specified_vc.get("capacity_gig", self.random.randint(30, 50)) * GIGABYTE,
         }
         return vm_disk
 
@@ -992,15 +1158,15 @@ class OCPGenerator(AbstractGenerator):
 
                     cpu_limit_cores = min(specified_vm.get("cpu_limit", cpu_cores), cpu_cores)
                     cpu_request_cores = min(
-                        specified_vm.get("cpu_request", round(uniform(0.02, cpu_limit_cores), 5)),
+                        specified_vm.get("cpu_request", round(self.random.uniform(0.02, cpu_limit_cores), 5)),
                         cpu_limit_cores,
                     )
                     cpu_request_sockets = min(
-                        specified_vm.get("cpu_request_sockets", round(uniform(0.02, cpu_limit_cores), 5)),
+                        specified_vm.get("cpu_request_sockets", round(self.random.uniform(0.02, cpu_limit_cores), 5)),
                         cpu_limit_cores,
                     )
                     cpu_request_threads = min(
-                        specified_vm.get("cpu_request_threads", round(uniform(0.02, cpu_limit_cores), 5)),
+                        specified_vm.get("cpu_request_threads", round(self.random.uniform(0.02, cpu_limit_cores), 5)),
                         cpu_limit_cores,
                     )
                     cpu_usage = specified_vm.get("cpu_usage", {})
@@ -1011,7 +1177,7 @@ class OCPGenerator(AbstractGenerator):
                     memory_gig = memory_bytes / GIGABYTE
                     mem_limit_gig = min(specified_vm.get("mem_limit_gig", memory_gig), memory_gig)
                     mem_request_gig = min(
-                        specified_vm.get("mem_request_gig", round(uniform(25.0, 80.0), 2)), mem_limit_gig
+                        specified_vm.get("mem_request_gig", round(self.random.uniform(25.0, 80.0), 2)), mem_limit_gig
                     )
                     memory_usage_gig = specified_vm.get("mem_usage_gig", {})
                     for key, value in memory_usage_gig.items():
@@ -1028,33 +1194,33 @@ class OCPGenerator(AbstractGenerator):
                             "vm_cpu_request_cores": cpu_request_cores,
                             "vm_cpu_request_sockets": cpu_request_sockets,
                             "vm_cpu_request_threads": cpu_request_threads,
-                            "cpu_usage": cpu_usage,
+                            "cpu_usage": DailyUsage(cpu_usage),
                             "vm_memory_request_bytes": mem_request_gig * GIGABYTE,
                             "vm_memory_limit_bytes": mem_limit_gig * GIGABYTE,
-                            "mem_usage_gig": memory_usage_gig,
+                            "mem_usage_gig": DailyUsage(memory_usage_gig),
                             "vm_labels": specified_vm.get("labels", None),
                             "vm_seconds": specified_vm.get("vm_seconds"),
                         }
-                        | get_vm_instance(vm=specified_vm)
+                        | get_vm_instance(vm=specified_vm, rng=self.random)
                         | self.get_vm_disk(specified_vc=specified_vm, static_report=True)
                     )
 
             else:
-                num_vms = randint(2, 20)
+                num_vms = self.random.randint(2, 20)
                 for _ in range(num_vms):
-                    vm_suffix = "".join(choices(ascii_lowercase, k=5))
-                    vm_type = choice(("build", "deploy", vm_suffix))
+                    vm_suffix = "".join(self.random.choices(ascii_lowercase, k=5))
+                    vm_type = self.random.choice(("build", "deploy", vm_suffix))
                     vm = f"{self.fake.word()}_{vm_type}"
                     namespace2vm[namespace].append(vm)
                     cpu_cores = node.get("cpu_cores")
-                    cpu_limit_cores = round(uniform(0.02, cpu_cores), 5)
-                    cpu_request_cores = round(uniform(0.02, cpu_limit_cores), 5)
-                    cpu_request_sockets = round(uniform(0.02, cpu_limit_cores), 5)
-                    cpu_request_threads = round(uniform(0.02, cpu_limit_cores), 5)
+                    cpu_limit_cores = round(self.random.uniform(0.02, cpu_cores), 5)
+                    cpu_request_cores = round(self.random.uniform(0.02, cpu_limit_cores), 5)
+                    cpu_request_sockets = round(self.random.uniform(0.02, cpu_limit_cores), 5)
+                    cpu_request_threads = round(self.random.uniform(0.02, cpu_limit_cores), 5)
                     memory_bytes = node.get("memory_bytes")
                     memory_gig = memory_bytes / GIGABYTE
-                    mem_limit_gig = round(uniform(25.0, memory_gig), 2)
-                    mem_request_gig = round(uniform(25.0, mem_limit_gig), 2)
+                    mem_limit_gig = round(self.random.uniform(25.0, memory_gig), 2)
+                    mem_request_gig = round(self.random.uniform(25.0, mem_limit_gig), 2)
 
                     vms[vm] = (
                         {
@@ -1070,7 +1236,7 @@ class OCPGenerator(AbstractGenerator):
                             "vm_memory_limit_bytes": mem_limit_gig * GIGABYTE,
                             "vm_labels": self._gen_openshift_labels(),
                         }
-                        | get_vm_instance()
+                        | get_vm_instance(rng=self.random)
                         | self.get_vm_disk(pod_name=vm)
                     )
 
@@ -1089,7 +1255,7 @@ class OCPGenerator(AbstractGenerator):
                     self.ros_data[pod_name] = ros_pod
                     self.namespace2pods[namespace].append(pod_name)
                 vcm = vm_copy.get("vm_persistentvolumeclaim_name")
-                if vcm and vcm not in self.pod_pvc_map.values():
+                if vcm and not self._mapped_pvcs[vcm]:
                     specified_volume = {
                         "volume_claims": [
                             {
@@ -1113,17 +1279,22 @@ class OCPGenerator(AbstractGenerator):
         if not isinstance(end, datetime.datetime):
             raise ValueError("end must be a date object.")
 
-        bill_begin = start.replace(microsecond=0, second=0, minute=0, hour=0, day=1)
-        bill_end = AbstractGenerator.next_month(bill_begin)
-        row = {}
+        # rows only depend on the report type and the month, so each combination is built once
         report_type = kwargs.get(REPORT_TYPE)
-        for column in OCP_REPORT_TYPE_TO_COLS[report_type]:
-            row[column] = ""
-            if column == "report_period_end":
-                row[column] = OCPGenerator.timestamp(bill_end)
-            elif column == "report_period_start":
-                row[column] = OCPGenerator.timestamp(bill_begin)
-        return row
+        key = (report_type, start.year, start.month)
+        template = self._row_templates.get(key)
+        if template is None:
+            bill_begin = start.replace(microsecond=0, second=0, minute=0, hour=0, day=1)
+            bill_end = AbstractGenerator.next_month(bill_begin)
+            template = {}
+            for column in OCP_REPORT_TYPE_TO_COLS[report_type]:
+                template[column] = ""
+                if column == "report_period_end":
+                    template[column] = OCPGenerator.timestamp(bill_end)
+                elif column == "report_period_start":
+                    template[column] = OCPGenerator.timestamp(bill_begin)
+            self._row_templates[key] = template
+        return template.copy()
 
     def _add_common_usage_info(self, row, start, end, **kwargs):
         """Add common usage information."""
@@ -1134,110 +1305,96 @@ class OCPGenerator(AbstractGenerator):
     @staticmethod
     def _get_usage_for_date(usage_dict, start):
         """Return usage for specified hour."""
-        if usage_dict:
-            for date, usage in usage_dict.items():
-                if date == "full_period":
-                    return usage
-                if parser.parse(date).date() == start.date():
-                    return usage
-        return None
+        if not usage_dict:
+            return None
+        if not isinstance(usage_dict, DailyUsage):
+            usage_dict = DailyUsage(usage_dict)
+        return usage_dict.for_date(start.date())
 
     def _update_pod_data(self, row, start, end, **kwargs):
         """Update data with generator specific data."""
         user_pod_seconds = kwargs.get("pod_seconds")
-        pod_seconds = user_pod_seconds or randint(2, HOUR)
+        pod_seconds = user_pod_seconds or self.random.randint(2, HOUR)
         pod = kwargs.get("pod")
-        cpu_limit = pod.pop("cpu_limit")
-        mem_limit_gig = pod.pop("mem_limit_gig")
+        if not isinstance(pod, FrozenRecord):
+            pod = freeze_record(pod, POD_SETTINGS)
+        cpu_limit = pod.settings["cpu_limit"]
+        mem_limit_gig = pod.settings["mem_limit_gig"]
 
-        cpu_request = min(pod.pop("cpu_request"), cpu_limit)
-        mem_request_gig = min(pod.pop("mem_request_gig"), mem_limit_gig)
+        cpu_request = min(pod.settings["cpu_request"], cpu_limit)
+        mem_request_gig = min(pod.settings["mem_request_gig"], mem_limit_gig)
         cpu_usage = self._get_usage_for_date(kwargs.get("cpu_usage"), start)
-        cpu = round(uniform(0.02, cpu_limit), 5)
+        cpu = round(self.random.uniform(0.02, cpu_limit), 5)
         # ensure that cpu usage is not higher than cpu_limit
         if cpu_usage:
             cpu = min(cpu_limit, cpu_usage)
 
         mem_usage_gig = self._get_usage_for_date(kwargs.get("mem_usage_gig"), start)
-        mem = round(uniform(1, mem_limit_gig), 2)
+        mem = round(self.random.uniform(1, mem_limit_gig), 2)
         # ensure that mem usage is not higher than mem_limit
         if mem_usage_gig:
             mem = min(mem_limit_gig, mem_usage_gig)
 
-        pod["pod_usage_cpu_core_seconds"] = pod_seconds * cpu
-        pod["pod_request_cpu_core_seconds"] = pod_seconds * cpu_request
-        pod["pod_limit_cpu_core_seconds"] = pod_seconds * cpu_limit
-        pod["pod_usage_memory_byte_seconds"] = pod_seconds * mem * GIGABYTE
-        pod["pod_request_memory_byte_seconds"] = pod_seconds * mem_request_gig * GIGABYTE
-        pod["pod_limit_memory_byte_seconds"] = pod_seconds * mem_limit_gig * GIGABYTE
-        row.update(pod)
+        row.update(pod.columns)
+        row["pod_usage_cpu_core_seconds"] = pod_seconds * cpu
+        row["pod_request_cpu_core_seconds"] = pod_seconds * cpu_request
+        row["pod_limit_cpu_core_seconds"] = pod_seconds * cpu_limit
+        row["pod_usage_memory_byte_seconds"] = pod_seconds * mem * GIGABYTE
+        row["pod_request_memory_byte_seconds"] = pod_seconds * mem_request_gig * GIGABYTE
+        row["pod_limit_memory_byte_seconds"] = pod_seconds * mem_limit_gig * GIGABYTE
         return row
 
     def _update_vm_data(self, row, start, end, **kwargs):
         """Update data with generator specific data."""
         user_vm_seconds = kwargs.get("vm_seconds")
-        vm_seconds = user_vm_seconds or randint(2, HOUR)
+        vm_seconds = user_vm_seconds or self.random.randint(2, HOUR)
         vm = kwargs.get("vm")
-        cpu_limit = vm.get("vm_cpu_limit_cores")
-        mem_limit_bytes = vm.get("vm_memory_limit_bytes")
-
-        cpu_request_cores = min(vm.get("vm_cpu_request_cores"), cpu_limit)
-        cpu_request_sockets = min(vm.get("vm_cpu_request_sockets"), cpu_limit)
-        cpu_request_threads = min(vm.get("vm_cpu_request_threads"), cpu_limit)
-        mem_request_bytes = min(vm.get("vm_memory_request_bytes"), mem_limit_bytes)
+        if not isinstance(vm, FrozenRecord):
+            vm = freeze_record(vm, VM_SETTINGS)
+        cpu_limit = vm.columns.get("vm_cpu_limit_cores")
+        mem_limit_bytes = vm.columns.get("vm_memory_limit_bytes")
+
+        cpu_request_cores = min(vm.columns.get("vm_cpu_request_cores"), cpu_limit)
+        cpu_request_sockets = min(vm.columns.get("vm_cpu_request_sockets"), cpu_limit)
+        cpu_request_threads = min(vm.columns.get("vm_cpu_request_threads"), cpu_limit)
+        mem_request_bytes = min(vm.columns.get("vm_memory_request_bytes"), mem_limit_bytes)
         cpu_usage = self._get_usage_for_date(kwargs.get("cpu_usage"), start)
-        cpu = round(uniform(0.02, cpu_limit), 5)
+        cpu = round(self.random.uniform(0.02, cpu_limit), 5)
         # ensure that cpu usage is not higher than cpu_limit
         if cpu_usage:
             cpu = min(cpu_limit, cpu_usage)
 
         mem_usage_gig = self._get_usage_for_date(kwargs.get("mem_usage_gig"), start)
-        mem = round(uniform(1024, mem_limit_bytes), 2)
+        mem = round(self.random.uniform(1024, mem_limit_bytes), 2)
         # ensure that mem usage is not higher than mem_limit
         if mem_usage_gig:
             mem = min(mem_limit_bytes, mem_usage_gig)
 
-        vm["vm_cpu_usage_total_seconds"] = vm_seconds * cpu
-        vm["vm_cpu_request_core_seconds"] = vm_seconds * cpu_request_cores
-        vm["vm_cpu_request_socket_seconds"] = vm_seconds * cpu_request_sockets
-        vm["vm_cpu_request_thread_seconds"] = vm_seconds * cpu_request_threads
+        row.update(vm.columns)
+        row["vm_cpu_usage_total_seconds"] = vm_seconds * cpu
+        row["vm_cpu_request_core_seconds"] = vm_seconds * cpu_request_cores
+        row["vm_cpu_request_socket_seconds"] = vm_seconds * cpu_request_sockets
+        row["vm_cpu_request_thread_seconds"] = vm_seconds * cpu_request_threads
 
-        vm["vm_cpu_limit_core_seconds"] = vm_seconds * cpu_limit
+        row["vm_cpu_limit_core_seconds"] = vm_seconds * cpu_limit
 
-        vm["vm_memory_usage_byte_seconds"] = vm_seconds * mem
-        vm["vm_memory_request_byte_seconds"] = vm_seconds * mem_request_bytes
-        vm["vm_memory_limit_byte_seconds"] = vm_seconds * mem_limit_bytes
+        row["vm_memory_usage_byte_seconds"] = vm_seconds * mem
+        row["vm_memory_request_byte_seconds"] = vm_seconds * mem_request_bytes
+        row["vm_memory_limit_byte_seconds"] = vm_seconds * mem_limit_bytes
 
-        vm["vm_uptime_total_seconds"] = vm_seconds
+        row["vm_uptime_total_seconds"] = vm_seconds
 
         if vc_capacity := kwargs.get("vc_capacity"):
-            vm["vm_disk_allocated_size_byte_seconds"] = vc_capacity * HOUR
+            row["vm_disk_allocated_size_byte_seconds"] = vc_capacity * HOUR
 
-        row.update(vm)
         return row
 
     def _randomize_ros_ocp_line_values(self, pod_in):
         """Randomize usage values for each line item or ROS report"""
-        values_to_randomize = [
-            "cpu_usage_container_avg",
-            "cpu_usage_container_min",
-            "cpu_usage_container_max",
-            "cpu_usage_container_sum",
-            "cpu_throttle_container_avg",
-            "cpu_throttle_container_max",
-            "cpu_throttle_container_sum",
-            "memory_usage_container_avg",
-            "memory_usage_container_min",
-            "memory_usage_container_max",
-            "memory_usage_container_sum",
-            "memory_rss_usage_container_avg",
-            "memory_rss_usage_container_min",
-            "memory_rss_usage_container_max",
-            "memory_rss_usage_container_sum",
-        ]
-        randomization_value = uniform(0.9, 1.1)
-        cpu_limit = pod_in.get("cpu_limit_container_avg", 1000000)
-        memory_limit = pod_in.get("memory_limit_container_avg", 1e20)
+        values_to_randomize = ROS_CPU_METRICS + ROS_MEMORY_METRICS
+        randomization_value = self.random.uniform(0.9, 1.1)
+        cpu_limit = pod_in.get("cpu_limit_container_avg", ros_numpy.DEFAULT_CPU_LIMIT)
+        memory_limit = pod_in.get("memory_limit_container_avg", ros_numpy.DEFAULT_MEMORY_LIMIT)
 
         pod_out = pod_in.copy()
         for pod_key in values_to_randomize:
@@ -1251,9 +1408,12 @@ class OCPGenerator(AbstractGenerator):
     def _update_ros_ocp_pod_data(self, row, start, end, **kwargs):
         """Update data with generator specific data."""
         pod = kwargs.get("pod")
-        if pod and not self.constant_values_ros_ocp:
+        ros_values = kwargs.get("ros_values")
+        if pod and ros_values is None and not self.constant_values_ros_ocp:
             pod = self._randomize_ros_ocp_line_values(pod)
         row.update(pod)
+        if ros_values is not None:
+            row.update(ros_values)
         return row
 
     def _update_storage_data(self, row, start, end, **kwargs):
@@ -1265,7 +1425,7 @@ class OCPGenerator(AbstractGenerator):
         volume_request_storage_byte_seconds = volume_request * HOUR if volume_request > 0 else None
         vc_capacity_gig = kwargs["vc_capacity"] / GIGABYTE
 
-        vc_usage_gig = round(uniform(2.0, vc_capacity_gig), 2)
+        vc_usage_gig = round(self.random.uniform(2.0, vc_capacity_gig), 2)
         if volume_claim_usage_gig:
             vc_usage_gig = min(volume_claim_usage_gig, vc_capacity_gig)
         # persistentvolumeclaim_usage_byte_seconds is empty for claimless PersistentVolumes
@@ -1311,118 +1471,165 @@ class OCPGenerator(AbstractGenerator):
             row = method(row, start, end, **kwargs)
         return row
 
+    def _per_node(self, node_hour_rows, entities, **kwargs):
+        """Group (node name, entity) pairs by node and return a (node name, row builder setup) pair for each node.
+
+        Each setup returns the function yielding the rows of its node's entities for an hour slot.
+        """
+        nodes = defaultdict(list)
+        for node, entity in entities:
+            nodes[node].append(entity)
+        return [(node, partial(node_hour_rows, node_entities, **kwargs)) for node, node_entities in nodes.items()]
+
+    def _pod_usage_hour_rows(self, **kwargs):
+        """Return the row builder setups of the pod usage rows of each node."""
+        return self._per_node(
+            self._node_pod_usage_hour_rows, ((pod.get("node"), pod) for pod in self.pods.values()), **kwargs
+        )
+
+    def _node_pod_usage_hour_rows(self, pods, **kwargs):
+        """Return a function yielding the pod usage rows of the pods of a node for an hour slot."""
+        pods = [freeze_record(pod, POD_SETTINGS) for pod in pods]
+
+        def hour_rows(slot):
+            for start, end, interval in slot.hours:
+                template = self._interval_row(start, end, interval, **kwargs)
+                if self._nodes:
+                    for pod in pods:
+                        yield self._update_pod_data(
+                            template.copy(),
+                            start,
+                            end,
+                            pod=pod,
+                            cpu_usage=pod.settings["cpu_usage"],
+                            mem_usage_gig=pod.settings["mem_usage_gig"],
+                            pod_seconds=pod.settings["pod_seconds"],
+                            **kwargs,
+                        )
+                else:
+                    num_pods = self.random.randint(2, len(pods))
+                    pod_choices = list(set(self.random.choices(range(len(pods)), k=num_pods)))
+                    for pod_choice in pod_choices:
+                        yield self._update_pod_data(template.copy(), start, end, pod=pods[pod_choice], **kwargs)
+
+        return hour_rows
+
     def _gen_hourly_pods_usage(self, **kwargs):
         """Create hourly data for pod usage."""
-        for hour in self.hours:
-            start = hour.get("start")
-            end = hour.get("end")
-
-            if self._nodes:
-                for pod_name, _ in self.pods.items():
-                    cpu_usage = self.pods[pod_name].get("cpu_usage", None)
-                    mem_usage_gig = self.pods[pod_name].get("mem_usage_gig", None)
-                    pod_seconds = self.pods[pod_name].get("pod_seconds", None)
-                    pod = deepcopy(self.pods[pod_name])
-                    row = self._init_data_row(start, end, **kwargs)
-                    row = self._update_data(
-                        row,
-                        start,
-                        end,
-                        pod=pod,
-                        cpu_usage=cpu_usage,
-                        mem_usage_gig=mem_usage_gig,
-                        pod_seconds=pod_seconds,
-                        **kwargs,
-                    )
-                    row.pop("cpu_usage", None)
-                    row.pop("mem_usage_gig", None)
-                    row.pop("pod_seconds", None)
-                    yield row
-            else:
-                pod_count = len(self.pods)
-                num_pods = randint(2, pod_count)
-                pod_index_list = range(pod_count)
-                pod_choices = list(set(choices(pod_index_list, k=num_pods)))
-                pod_keys = list(self.pods.keys())
-                for pod_choice in pod_choices:
-                    pod_name = pod_keys[pod_choice]
-                    pod = deepcopy(self.pods[pod_name])
-                    row = self._init_data_row(start, end, **kwargs)
-                    yield self._update_data(row, start, end, pod=pod, **kwargs)
+        return self._report_rows({OCP_POD_USAGE: self._pod_usage_hour_rows}, **kwargs)
+
+    def _vm_usage_hour_rows(self, **kwargs):
+        """Return the row builder setups of the vm usage rows of each node."""
+        return self._per_node(
+            self._node_vm_usage_hour_rows, ((vm.get("node"), vm) for vm in self.vms.values()), **kwargs
+        )
+
+    def _node_vm_usage_hour_rows(self, vms, **kwargs):
+        """Return a function yielding the vm usage rows of the vms of a node for an hour slot."""
+        vms = [freeze_record(vm, VM_SETTINGS) for vm in vms]
+
+        def hour_rows(slot):
+            for start, end, interval in slot.hours:
+                template = self._interval_row(start, end, interval, **kwargs)
+                if self._nodes:
+                    for vm in vms:
+                        yield self._update_vm_data(
+                            template.copy(),
+                            start,
+                            end,
+                            vm=vm,
+                            cpu_usage=vm.settings["cpu_usage"],
+                            mem_usage_gig=vm.settings["mem_usage_gig"],
+                            vm_seconds=vm.settings["vm_seconds"],
+                            vc_capacity=vm.settings["vc_capacity"],
+                            **kwargs,
+                        )
+                else:
+                    num_vms = self.random.randint(2, len(vms))
+                    vm_choices = list(set(self.random.choices(range(len(vms)), k=num_vms)))
+                    for vm_choice in vm_choices:
+                        vm = vms[vm_choice]
+                        yield self._update_vm_data(
+                            template.copy(), start, end, vm=vm, vc_capacity=vm.settings["vc_capacity"], **kwargs
+                        )
+
+        return hour_rows
 
     def _gen_hourly_vm_usage(self, **kwargs):
         """Create hourly data for vm usage."""
-        for hour in self.hours:
-            start = hour.get("start")
-            end = hour.get("end")
-
-            if self._nodes:
-                for vm_name, _ in self.vms.items():
-                    cpu_usage = self.vms[vm_name].get("cpu_usage", None)
-                    mem_usage_gig = self.vms[vm_name].get("mem_usage_gig", None)
-                    vm_seconds = self.vms[vm_name].get("vm_seconds", None)
-                    vc_capacity = self.vms[vm_name].get("vc_capacity", None)
-                    vm = deepcopy(self.vms[vm_name])
-                    row = self._init_data_row(start, end, **kwargs)
-                    row = self._update_data(
-                        row,
-                        start,
-                        end,
-                        vm=vm,
-                        cpu_usage=cpu_usage,
-                        mem_usage_gig=mem_usage_gig,
-                        vm_seconds=vm_seconds,
-                        vc_capacity=vc_capacity,
-                        **kwargs,
-                    )
-                    row.pop("cpu_usage", None)
-                    row.pop("mem_usage_gig", None)
-                    row.pop("vm_seconds", None)
-                    row.pop("vc_capacity", None)
-                    yield row
-            else:
-                vm_count = len(self.vms)
-                num_vms = randint(2, vm_count)
-                vm_index_list = range(vm_count)
-                vm_choices = list(set(choices(vm_index_list, k=num_vms)))
-                vm_keys = list(self.vms.keys())
-                for vm_choice in vm_choices:
-                    vm_name = vm_keys[vm_choice]
-                    vm = deepcopy(self.vms[vm_name])
-                    vc_capacity = vm.get("vc_capacity", None)
-                    row = self._init_data_row(start, end, **kwargs)
-                    row = self._update_data(row, start, end, vm=vm, vc_capacity=vc_capacity, **kwargs)
-                    row.pop("vc_capacity", None)
-                    yield row
+        return self._report_rows({OCP_VM_USAGE: self._vm_usage_hour_rows}, **kwargs)
+
+    def _ros_pod_usage_hour_rows(self, **kwargs):
+        """Return the row builder setups of the ROS pod usage rows of each node."""
+        # ROS pod data is only read while building rows, so it is passed along without copying.
+        ros_pods = [self.ros_data[pod_name] for pod_name in self.pods]
+        return self._per_node(
+            self._node_ros_pod_usage_hour_rows, ((ros_pod.get("node"), ros_pod) for ros_pod in ros_pods), **kwargs
+        )
+
+    def _node_ros_pod_usage_hour_rows(self, ros_pods, **kwargs):
+        """Return a function yielding the ROS pod usage rows of the pods of a node for the quarter hours of a slot."""
+        ros_metrics = None
+        if self.ros_ocp_numpy and not self.constant_values_ros_ocp and ros_numpy.numpy is not None:
+            ros_metrics = ros_numpy.ROSContainerMetrics(
+                ros_pods,
+                ROS_CPU_METRICS,
+                ROS_MEMORY_METRICS,
+                seed=self.random.getrandbits(64),
+            )
+            intervals = ros_metrics.intervals(len(self.quarter_hours))
+
+        def hour_rows(slot):
+            for start, end, interval in slot.quarter_hours:
+                if self._nodes:
+                    pod_choices = range(len(ros_pods))
+                else:
+                    num_pods = self.random.randint(2, len(ros_pods))
+                    pod_choices = list(set(self.random.choices(range(len(ros_pods)), k=num_pods)))
+                # the rows of an interval only differ by pod, so they are built from one template
+                template = self._interval_row(start, end, interval, **kwargs)
+                if ros_metrics:
+                    ros_interval = next(intervals)
+                    for pod_choice in pod_choices:
+                        yield self._update_ros_ocp_pod_data(
+                            template.copy(),
+                            start,
+                            end,
+                            pod=ros_pods[pod_choice],
+                            ros_values=ros_metrics.updates(ros_interval, pod_choice),
+                        )
+                    continue
+                for pod_choice in pod_choices:
+                    yield self._update_ros_ocp_pod_data(template.copy(), start, end, pod=ros_pods[pod_choice], **kwargs)
+
+        return hour_rows
 
     def _gen_quarter_hourly_ros_ocp_pods_usage(self, **kwargs):
         """Create hourly data for pod usage."""
-        for quarter_hour in self.quarter_hours:
-            start = quarter_hour.get("start")
-            end = quarter_hour.get("end")
-            if self._nodes:
-                for pod_name, _ in self.pods.items():
-                    pod = deepcopy(self.ros_data[pod_name])
-                    row = self._init_data_row(start, end, **kwargs)
-                    yield self._update_data(row, start, end, pod=pod, **kwargs)
-            else:
-                pod_count = len(self.pods)
-                num_pods = randint(2, pod_count)
-                pod_index_list = range(pod_count)
-                pod_choices = list(set(choices(pod_index_list, k=num_pods)))
-                pod_keys = list(self.pods.keys())
-                for pod_choice in pod_choices:
-                    pod_name = pod_keys[pod_choice]
-                    pod = deepcopy(self.ros_data[pod_name])
-                    row = self._init_data_row(start, end, **kwargs)
-                    yield self._update_data(row, start, end, pod=pod, **kwargs)
+        return self._report_rows({OCP_ROS_USAGE: self._ros_pod_usage_hour_rows}, **kwargs)
+
+    def _ros_namespace_index(self):
+        """Return the ROS pods grouped by namespace and the namespace aggregates computed so far.
+
+        Both are built from self.ros_data, which does not change while rows are generated, so
+        they are kept until ros_data is replaced.
+        """
+        if self._ros_namespace_cache is None or self._ros_namespace_cache[0] is not self.ros_data:
+            namespace_pods = {}
+            for pod_data in self.ros_data.values():
+                namespace_pods.setdefault(pod_data.get("namespace"), []).append(pod_data)
+            self._ros_namespace_cache = (self.ros_data, namespace_pods, {})
+        return self._ros_namespace_cache[1:]
 
     def _aggregate_namespace_data(self, namespace, start, end):
         """Aggregate container data into namespace-level data."""
-        namespace_pods = [
-            pod_name for pod_name, pod_data in self.ros_data.items() if pod_data.get("namespace") == namespace
-        ]
+        namespace_pods, aggregates = self._ros_namespace_index()
+        if namespace not in aggregates:
+            aggregates[namespace] = self._compute_namespace_data(namespace, namespace_pods.get(namespace))
+        return aggregates[namespace]
 
+    def _compute_namespace_data(self, namespace, namespace_pods):
+        """Compute the namespace-level data for the ROS pods of a namespace."""
         if not namespace_pods:
             return {}
         cpu_request_sum = 0
@@ -1444,8 +1651,7 @@ class OCPGenerator(AbstractGenerator):
         total_pods = len(namespace_pods)
         running_pods = total_pods  # Assuming all pods are running
 
-        for pod_name in namespace_pods:
-            pod_data = self.ros_data[pod_name]
+        for pod_data in namespace_pods:
             cpu_request_sum += pod_data.get("cpu_request_container_sum", 0)
             cpu_limit_sum += pod_data.get("cpu_limit_container_sum", 0)
             cpu_usage_avgs.append(pod_data.get("cpu_usage_container_avg", 0))
@@ -1497,119 +1703,136 @@ class OCPGenerator(AbstractGenerator):
 
         return namespace_data
 
-    def _gen_quarter_hourly_ros_ocp_namespace_usage(self, **kwargs):
-        """Create quarter-hourly namespace aggregated data from container data."""
-        for quarter_hour in self.quarter_hours:
-            start = quarter_hour.get("start")
-            end = quarter_hour.get("end")
-            unique_namespaces = set()
-            for pod_data in self.ros_data.values():
-                if namespace := pod_data.get("namespace"):
-                    unique_namespaces.add(namespace)
+    def _ros_namespace_usage_hour_rows(self, **kwargs):
+        """Return the row builder setup of the ROS namespace rows, which do not draw random values."""
+        return [(None, partial(self._namespace_ros_usage_hour_rows, **kwargs))]
+
+    def _namespace_ros_usage_hour_rows(self, **kwargs):
+        """Return a function yielding the ROS namespace rows of the quarter hours of an hour slot."""
+        # namespaces in first seen order so that rows come out in the same order from run to run
+        namespaces = [namespace for namespace in self._ros_namespace_index()[0] if namespace]
+
+        def hour_rows(slot):
+            for start, end, interval in slot.quarter_hours:
+                template = self._interval_row(start, end, interval, **kwargs)
+                for namespace in namespaces:
+                    namespace_data = self._aggregate_namespace_data(namespace, start, end)
+                    if namespace_data and namespace_data.get("namespace"):
+                        yield self._update_ros_ocp_namespace_data(
+                            template.copy(), start, end, namespace=namespace, namespace_data=namespace_data
+                        )
 
-            # Generate data for each namespace
-            for namespace in unique_namespaces:
-                namespace_data = self._aggregate_namespace_data(namespace, start, end)
-                if namespace_data and namespace_data.get("namespace"):
-                    namespace_kwargs = kwargs.copy()
-                    namespace_kwargs[REPORT_TYPE] = OCP_ROS_NAMESPACE_USAGE
-                    namespace_kwargs["namespace"] = namespace
+        return hour_rows
 
-                    row = self._init_data_row(start, end, **namespace_kwargs)
-                    yield self._update_data(row, start, end, **namespace_kwargs)
+    def _gen_quarter_hourly_ros_ocp_namespace_usage(self, **kwargs):
+        """Create quarter-hourly namespace aggregated data from container data."""
+        return self._report_rows({OCP_ROS_NAMESPACE_USAGE: self._ros_namespace_usage_hour_rows}, **kwargs)
 
     def _update_ros_ocp_namespace_data(self, row, start, end, **kwargs):
         """Update the data row with aggregated namespace data."""
-        namespace = kwargs.get("namespace", "")
-        aggregated_data = self._aggregate_namespace_data(namespace, start, end)
+        aggregated_data = kwargs.get("namespace_data")
+        if aggregated_data is None:
+            aggregated_data = self._aggregate_namespace_data(kwargs.get("namespace", ""), start, end)
         row.update(aggregated_data)
         return row
 
+    def _storage_usage_hour_rows(self, **kwargs):
+        """Return the row builder setups of the storage usage rows of each node."""
+        volume_rows = []
+        for volume_dict in self.volumes:
+            for volume_name, volume in volume_dict.items():
+                volume_row = {
+                    "storage_class": volume.get("storage_class", None),
+                    "csi_driver": volume.get("csi_driver", None),
+                    "csi_volume_handle": volume.get("csi_volume_handle", None),
+                    "volume_name": volume_name,
+                    "volume_labels": volume.get("labels", None),
+                }
+                volume_claims = volume.get("volume_claims", [])
+                for vc_name, volume_claim in volume_claims.items():
+                    volume_rows.append(
+                        (
+                            volume.get("node"),
+                            volume_row
+                            | {
+                                "volume_claim": vc_name,
+                                "pod": volume_claim.get("pod"),
+                                "node": volume.get("node"),
+                                "volume_claim_labels": volume_claim.get("labels"),
+                                "vc_capacity": volume_claim.get("capacity"),
+                                "volume_claim_usage_gig": volume_claim.get("volume_claim_usage_gig", None),
+                                "volume_request": volume.get("volume_request", None),
+                                "namespace": volume.get("namespace", None),
+                            },
+                        )
+                    )
+                if not volume_claims:
+                    volume_rows.append(
+                        (volume.get("node"), volume_row | {"vc_capacity": volume.get("volume_request", None)})
+                    )
+        return self._per_node(self._node_storage_usage_hour_rows, volume_rows, **kwargs)
+
+    def _node_storage_usage_hour_rows(self, volume_rows, **kwargs):
+        """Return a function yielding the storage usage rows of the volumes of a node for an hour slot."""
+
+        def hour_rows(slot):
+            for start, end, interval in slot.hours:
+                template = self._interval_row(start, end, interval, **kwargs)
+                for volume_row in volume_rows:
+                    yield self._update_storage_data(template.copy(), start, end, **volume_row, **kwargs)
+
+        return hour_rows
+
     def _gen_hourly_storage_usage(self, **kwargs):
         """Create hourly data for storage usage."""
-        for hour in self.hours:
-            start = hour.get("start")
-            end = hour.get("end")
-            for volume_dict in self.volumes:
-                for volume_name, volume in volume_dict.items():
-                    node = volume.get("node")
-                    namespace = volume.get("namespace", None)
-                    storage_class = volume.get("storage_class", None)
-                    csi_driver = volume.get("csi_driver", None)
-                    csi_volume_handle = volume.get("csi_volume_handle", None)
-                    volume_request = volume.get("volume_request", None)
-                    vol_labels = volume.get("labels", None)
-                    volume_claims = volume.get("volume_claims", [])
-                    for vc_name, volume_claim in volume_claims.items():
-                        pod = volume_claim.get("pod")
-                        vc_labels = volume_claim.get("labels")
-                        capacity = volume_claim.get("capacity")
-                        volume_claim_usage_gig = volume_claim.get("volume_claim_usage_gig", None)
-                        row = self._init_data_row(start, end, **kwargs)
-                        yield self._update_data(
-                            row,
-                            start,
-                            end,
-                            volume_claim=vc_name,
-                            pod=pod,
-                            node=node,
-                            volume_claim_labels=vc_labels,
-                            vc_capacity=capacity,
-                            volume_claim_usage_gig=volume_claim_usage_gig,
-                            storage_class=storage_class,
-                            csi_driver=csi_driver,
-                            csi_volume_handle=csi_volume_handle,
-                            volume_name=volume_name,
-                            volume_request=volume_request,
-                            volume_labels=vol_labels,
-                            namespace=namespace,
-                            **kwargs,
-                        )
-                    if not volume_claims:
-                        row = self._init_data_row(start, end, **kwargs)
-                        yield self._update_data(
-                            row,
-                            start,
-                            end,
-                            storage_class=storage_class,
-                            csi_driver=csi_driver,
-                            csi_volume_handle=csi_volume_handle,
-                            volume_name=volume_name,
-                            vc_capacity=volume_request,
-                            volume_labels=vol_labels,
-                            **kwargs,
-                        )
+        return self._report_rows({OCP_STORAGE_USAGE: self._storage_usage_hour_rows}, **kwargs)
+
+    def _constant_hour_rows(self, entity_columns, entities, **kwargs):
+        """Return a function yielding a row for each entity every hour, where only the interval changes.
+
+        Each entity is a dict of the entity_columns, which end the report columns. The CSV fragment
+        of each entity is rendered once, so the line of every row is just the fragment rendered for
+        the hour followed by the one for the entity.
+        """
+        columns = OCP_REPORT_TYPE_TO_COLS[kwargs.get(REPORT_TYPE)]
+        head_columns = columns[: len(columns) - len(entity_columns)]
+        fragments = [(entity, render_csv(entity.get(column) for column in entity_columns)) for entity in entities]
+
+        def hour_rows(slot):
+            for start, end, interval in slot.hours:
+                row = self._interval_row(start, end, interval, **kwargs)
+                head = render_csv(row[column] for column in head_columns)
+                for entity, fragment in fragments:
+                    rendered = RenderedRow(row)
+                    rendered.update(entity)
+                    rendered.header = columns
+                    rendered.line = f"{head},{fragment}\r\n"
+                    yield rendered
+
+        return hour_rows
+
+    def _node_label_hour_rows(self, **kwargs):
+        """Return the row builder setup of the node label rows, which do not draw random values."""
+        nodes = [{"node": node.get("name"), "node_labels": node.get("node_labels")} for node in self.nodes]
+        return [(None, partial(self._constant_hour_rows, ("node", "node_labels"), nodes, **kwargs))]
 
     def _gen_hourly_node_label_usage(self, **kwargs):
         """Create hourly data for nodel label report."""
-        for hour in self.hours:
-            start = hour.get("start")
-            end = hour.get("end")
-            for node in self.nodes:
-                row = self._init_data_row(start, end, **kwargs)
-                row = self._update_data(
-                    row, start, end, node_labels=node.get("node_labels"), node=node.get("name"), **kwargs
-                )
-                yield row
+        return self._report_rows({OCP_NODE_LABEL: self._node_label_hour_rows}, **kwargs)
+
+    def _namespace_label_hour_rows(self, **kwargs):
+        """Return the row builder setup of the namespace label rows, which do not draw random values."""
+        namespaces = [
+            {"namespace": name, "namespace_labels": namespace.get("namespace_labels")}
+            for node in self.nodes
+            if node.get("namespaces")
+            for name, namespace in node.get("namespaces").items()
+        ]
+        return [(None, partial(self._constant_hour_rows, ("namespace", "namespace_labels"), namespaces, **kwargs))]
 
     def _gen_hourly_namespace_label_usage(self, **kwargs):
         """Create hourly data for nodel label report."""
-        for hour in self.hours:
-            start = hour.get("start")
-            end = hour.get("end")
-            for node in self.nodes:
-                if node.get("namespaces"):
-                    for name, _ in node.get("namespaces").items():
-                        row = self._init_data_row(start, end, **kwargs)
-                        row = self._update_data(
-                            row,
-                            start,
-                            end,
-                            namespace_labels=node.get("namespaces").get(name).get("namespace_labels"),
-                            namespace=name,
-                            **kwargs,
-                        )
-                        yield row
+        return self._report_rows({OCP_NAMESPACE_LABEL: self._namespace_label_hour_rows}, **kwargs)
 
     @staticmethod
     def _resolve_mig_partition_id(pod_name, mig_name, raw_mig_id):
@@ -1630,15 +1853,25 @@ class OCPGenerator(AbstractGenerator):
     def _gen_gpus(self):  # noqa: C901
         """Create GPUs for pods and nodes that need them."""
         gpus = {}
+        # the first node with a name, and the first pod spec with a name in each of its namespaces, win
+        nodes_by_name = {}
+        pod_specs = {}
+        if self._nodes:
+            for node in self.nodes:
+                nodes_by_name.setdefault(node.get("name"), node)
+            for node_name, node in nodes_by_name.items():
+                for namespace, ns_data in (node.get("namespaces") or {}).items():
+                    for pod_spec in ns_data.get("pods") or []:
+                        pod_specs.setdefault((node_name, namespace, pod_spec.get("pod_name")), pod_spec)
         for pod_name, pod_data in self.pods.items():
             if not self._nodes:
                 # Random generation: 10% of pods get GPUs - stable UUID per (node, pod, index)
-                if randint(1, 10) == 1:
+                if self.random.randint(1, 10) == 1:
                     node_name = pod_data.get("node") or "random"
-                    num_gpus = choice([1, 2, 4, 8])
+                    num_gpus = self.random.choice([1, 2, 4, 8])
                     pod_gpus = []
                     for gpu_idx in range(num_gpus):
-                        gpu_model = choice(GPU_MODELS)
+                        gpu_model = self.random.choice(GPU_MODELS)
                         name = f"nise.ocp.gpu.{node_name}.{pod_name}.{gpu_idx}"
                         gpu_uuid = f"GPU-{uuid5(NAMESPACE_DNS, name)}"
                         pod_gpus.append(
@@ -1652,19 +1885,18 @@ class OCPGenerator(AbstractGenerator):
                     gpus[pod_name] = pod_gpus
                 continue
 
-            node = next((n for n in self.nodes if n.get("name") == pod_data.get("node")), None)
+            node = nodes_by_name.get(pod_data.get("node"))
             if not node or not node.get("namespaces"):
                 continue
 
-            ns_data = node.get("namespaces", {}).get(pod_data.get("namespace"), {})
-            pod_spec = next((p for p in ns_data.get("pods", []) if p.get("pod_name") == pod_name), None)
+            pod_spec = pod_specs.get((pod_data.get("node"), pod_data.get("namespace"), pod_name))
             if not pod_spec or not pod_spec.get("gpus"):
                 continue
 
             node_name = node.get("name", "")
             pod_gpus = []
             for gpu_idx, gpu_spec in enumerate(pod_spec.get("gpus")):
-                gpu_model = gpu_spec.get("gpu_model", choice(GPU_MODELS))
+                gpu_model = gpu_spec.get("gpu_model", self.random.choice(GPU_MODELS))
                 name = f"nise.ocp.gpu.{node_name}.{pod_name}.{gpu_idx}"
                 parent_gpu_uuid = f"GPU-{uuid5(NAMESPACE_DNS, name)}"
                 gpu_memory = gpu_spec.get("gpu_memory_capacity_mib", GPU_MEMORY_CAPACITY.get(gpu_model, 15360))
@@ -1710,45 +1942,49 @@ class OCPGenerator(AbstractGenerator):
 
         return gpus
 
-    def _gen_hourly_gpu_usage(self, **kwargs):
-        """Create hourly data for GPU usage."""
-        for hour in self.hours:
-            start = hour.get("start")
-            end = hour.get("end")
+    def _gpu_usage_hour_rows(self, **kwargs):
+        """Return the row builder setups of the GPU usage rows of each node."""
+        pod_gpus = [(pod_name, self.pods.get(pod_name), gpus) for pod_name, gpus in self.gpus.items()]
+        return self._per_node(
+            self._node_gpu_usage_hour_rows,
+            ((pod_data.get("node"), pod_gpu) for pod_gpu in pod_gpus if (pod_data := pod_gpu[1])),
+            **kwargs,
+        )
 
-            for pod_name, pod_gpus in self.gpus.items():
-                pod_data = self.pods.get(pod_name)
-                if not pod_data:
-                    continue
+    def _node_gpu_usage_hour_rows(self, pod_gpus, **kwargs):
+        """Return a function yielding the GPU usage rows of the pods of a node for an hour slot."""
+
+        def hour_rows(slot):
+            for start, end, interval in slot.hours:
+                template = self._interval_row(start, end, interval, **kwargs)
+                for pod_name, pod_data, gpus in pod_gpus:
+                    pod_seconds = pod_data.get("pod_seconds")
+                    # gpu_pod_uptime matches pod uptime (all GPUs in a pod have same uptime)
+                    gpu_pod_uptime = pod_seconds if pod_seconds else self.random.randint(2, HOUR)
+                    for gpu in gpus:
+                        yield self._update_gpu_data(
+                            template.copy(),
+                            start,
+                            end,
+                            node=pod_data.get("node"),
+                            namespace=pod_data.get("namespace"),
+                            pod=pod_name,
+                            gpu_uuid=gpu["gpu_uuid"],
+                            gpu_model_name=gpu["gpu_model_name"],
+                            gpu_vendor_name=gpu["gpu_vendor_name"],
+                            gpu_memory_capacity_mib=gpu["gpu_memory_capacity_mib"],
+                            gpu_pod_uptime=gpu_pod_uptime,
+                            mig_instance_id=gpu.get("mig_instance_id"),
+                            mig_profile=gpu.get("mig_profile"),
+                            mig_strategy=gpu.get("mig_strategy"),
+                            **kwargs,
+                        )
 
-                node = pod_data.get("node")
-                namespace = pod_data.get("namespace")
-                pod_seconds = pod_data.get("pod_seconds")
-
-                # gpu_pod_uptime matches pod uptime (all GPUs in a pod have same uptime)
-                gpu_pod_uptime = pod_seconds if pod_seconds else randint(2, HOUR)
-
-                for gpu in pod_gpus:
-                    row = self._init_data_row(start, end, **kwargs)
-
-                    row = self._update_data(
-                        row,
-                        start,
-                        end,
-                        node=node,
-                        namespace=namespace,
-                        pod=pod_name,
-                        gpu_uuid=gpu["gpu_uuid"],
-                        gpu_model_name=gpu["gpu_model_name"],
-                        gpu_vendor_name=gpu["gpu_vendor_name"],
-                        gpu_memory_capacity_mib=gpu["gpu_memory_capacity_mib"],
-                        gpu_pod_uptime=gpu_pod_uptime,
-                        mig_instance_id=gpu.get("mig_instance_id"),
-                        mig_profile=gpu.get("mig_profile"),
-                        mig_strategy=gpu.get("mig_strategy"),
-                        **kwargs,
-                    )
-                    yield row
+        return hour_rows
+
+    def _gen_hourly_gpu_usage(self, **kwargs):
+        """Create hourly data for GPU usage."""
+        return self._report_rows({OCP_GPU_USAGE: self._gpu_usage_hour_rows}, **kwargs)
 
     def _update_gpu_data(self, row, start, end, **kwargs):
         """Update data with GPU specific data."""
@@ -1778,3 +2014,93 @@ class OCPGenerator(AbstractGenerator):
         """Responsibile for generating data."""
         meta = {REPORT_TYPE: report_type}
         return self._generate_hourly_data(**meta)
+
+    def _hour_slots(self, quarter_hours=False):
+        """Walk the time axis hour by hour, sharing the interval columns of every hour between report types.
+
+        Each slot holds its hour and, when quarter_hours is set, the quarter hours that start in it.
+        Quarter hours that start after the last hour are put in its slot, so none is left out when
+        the time axis ends part way through an hour. Slots are built as they are walked, so only
+        one hour of intervals is held at a time.
+        """
+        quarters = iter(self.quarter_hours if quarter_hours else ())
+        quarter = next(quarters, None)
+        hours = iter(self.hours)
+        hour = next(hours, None)
+        if hour is None:
+            if quarter_hours:
+                yield HourSlot((), [self._quarter_interval(quarter) for quarter in (quarter, *quarters) if quarter])
+            return
+        while hour is not None:
+            next_hour = next(hours, None)
+            start, end = hour["start"], hour["end"]
+            slot = HourSlot(((start, end, self._add_common_usage_info({}, start, end)),), [])
+            while quarter is not None and (next_hour is None or quarter["start"] < next_hour["start"]):
+                slot.quarter_hours.append(self._quarter_interval(quarter))
+                quarter = next(quarters, None)
+            yield slot
+            hour = next_hour
+
+    def _quarter_interval(self, quarter_hour):
+        """Return a quarter hour of the time axis as (start, end, interval columns)."""
+        start, end = quarter_hour["start"], quarter_hour["end"]
+        return start, end, self._add_common_usage_info({}, start, end)
+
+    def _interval_row(self, start, end, interval, **kwargs):
+        """Return an empty row of a report type with the interval columns of an hour slot filled in."""
+        row = self._init_data_row(start, end, **kwargs)
+        row.update(interval)
+        return row
+
+    def _report_random(self, report_type, node):
+        """Return the random stream that the rows of report_type for a node are drawn from."""
+        key = (report_type, node)
+        stream = self._report_randoms.get(key)
+        if stream is None:
+            stream = self._report_randoms[key] = random.Random(derive_seed(self._report_seed, report_type, node))
+        return stream
+
+    def _drawing_from(self, stream, func, *args, **kwargs):
+        """Call func with self.random switched to stream."""
+        generator_random = self.random
+        self.random = stream
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.random = generator_random
+
+    def _walk_hours(self, hour_rows, **kwargs):
+        """Yield (report_type, row) pairs for several report types in a single pass over the hour slots.
+
+        hour_rows maps each report type to the method returning the row builder setups of its nodes.
+        The rows of every node of a report type are drawn from a random stream of their own, so they
+        are the same whether the report type is generated alone or along with other report types,
+        and whichever node shard the node is in.
+        """
+        builders = []
+        for report_type, node_setups in hour_rows.items():
+            for node, setup in node_setups(**{**kwargs, REPORT_TYPE: report_type}):
+                stream = self._report_random(report_type, node)
+                builders.append((report_type, stream, self._drawing_from(stream, setup)))
+        for slot in self._hour_slots(any(report_type in ROS_OCP_REPORT_TYPE_TO_COLS for report_type in hour_rows)):
+            for report_type, stream, builder in builders:
+                rows = builder(slot)
+                while (row := self._drawing_from(stream, next, rows, None)) is not None:
+                    yield report_type, row
+
+    def _report_rows(self, hour_rows, **kwargs):
+        """Yield the rows of the single report type in hour_rows."""
+        for _, row in self._walk_hours(hour_rows, **kwargs):
+            yield row
+
+    def generate_fused_data(self, report_types=None):
+        """Generate the data of several report types in a single pass over the time axis.
+
+        Yields (report_type, row) pairs hour by hour: all rows of every report type for one
+        hour, including its quarter hours, come out before any row of the next hour. The
+        rows of each report type are the same as generate_data gives.
+        """
+        report_types = report_types or self.ocp_report_generation
+        return self._walk_hours(
+            {report_type: self.ocp_report_generation[report_type]["_hour_rows"] for report_type in report_types}
+        )
@@ -0,0 +1,95 @@
+#
+# Copyright 2026 Red Hat, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+"""Randomizes ROS for OpenShift container metrics in bulk with NumPy, when it is installed."""
+
+from operator import itemgetter
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional
+    numpy = None
+
+INTERVAL_BATCH_SIZE = 96
+DEFAULT_CPU_LIMIT = 1000000
+DEFAULT_MEMORY_LIMIT = 1e20
+
+
+def _getter(positions):
+    """Return a function picking the values at positions from a list, always as a tuple."""
+    if len(positions) > 1:
+        return itemgetter(*positions)
+    if positions:
+        position = positions[0]
+        return lambda values: (values[position],)
+    return lambda values: ()
+
+
+class ROSContainerMetrics:
+    """The randomized container metrics of a set of ROS pods, computed a batch of intervals at a time.
+
+    Metrics are laid out as (intervals × pods × metrics) arrays. Every pod gets one random factor
+    per interval. The values are scaled by it, clamped to the container limits and rounded in the
+    same way as OCPGenerator._randomize_ros_ocp_line_values. Metrics that are zero or missing for
+    a pod are left alone.
+    """
+
+    def __init__(self, ros_pods, cpu_metrics, memory_metrics, seed=None, batch_size=INTERVAL_BATCH_SIZE):
+        """Initialize the metric arrays."""
+        if numpy is None:
+            raise RuntimeError("NumPy is required to generate ROS metrics in bulk.")
+        self._rng = numpy.random.default_rng(seed)
+        self._batch_size = batch_size
+        self._pod_count = len(ros_pods)
+        self._cpu = self._metric_array(ros_pods, cpu_metrics)
+        self._memory = self._metric_array(ros_pods, memory_metrics)
+        self._cpu_limit = numpy.array(
+            [[pod.get("cpu_limit_container_avg", DEFAULT_CPU_LIMIT)] for pod in ros_pods], dtype=float
+        ).reshape(self._pod_count, 1)
+        self._memory_limit = numpy.array(
+            [[pod.get("memory_limit_container_avg", DEFAULT_MEMORY_LIMIT)] for pod in ros_pods], dtype=float
+        ).reshape(self._pod_count, 1)
+
+        metrics = tuple(cpu_metrics) + tuple(memory_metrics)
+        self._keys = []
+        self._getters = []
+        for pod in ros_pods:
+            positions = [position for position, metric in enumerate(metrics) if pod.get(metric)]
+            self._keys.append(tuple(metrics[position] for position in positions))
+            self._getters.append(_getter(positions))
+
+    def _metric_array(self, ros_pods, metrics):
+        """Return a (pods × metrics) array of the pod values, with missing values as zero."""
+        return numpy.array([[pod.get(metric) or 0 for metric in metrics] for pod in ros_pods], dtype=float).reshape(
+            self._pod_count, len(metrics)
+        )
+
+    def intervals(self, count):
+        """Yield the randomized values of every pod for count intervals.
+
+        Each item is passed to updates() together with a pod position.
+        """
+        for offset in range(0, count, self._batch_size):
+            size = min(self._batch_size, count - offset)
+            factors = self._rng.uniform(0.9, 1.1, size=(size, self._pod_count, 1))
+            cpu = numpy.round(numpy.minimum(factors * self._cpu, self._cpu_limit), 5).tolist()
+            memory = numpy.rint(numpy.minimum(factors * self._memory, self._memory_limit)).astype(numpy.int64).tolist()
+            yield from zip(cpu, memory)
+
+    def updates(self, interval, position):
+        """Return the (metric, value) pairs to apply to the row of the pod at position."""
+        cpu, memory = interval
+        return zip(self._keys[position], self._getters[position](cpu[position] + memory[position]))
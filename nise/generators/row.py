@@ -0,0 +1,157 @@
+#
+# Copyright 2026 Red Hat, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+"""Defines the compact, list backed rows used by generators."""
+
+import csv
+import io
+from collections.abc import MutableMapping
+from functools import lru_cache
+
+
+class RowSchema:
+    """The fixed column order shared by the compact rows of one report type."""
+
+    __slots__ = ("columns", "index")
+
+    def __init__(self, columns):
+        """Initialize the schema."""
+        self.columns = tuple(columns)
+        self.index = {column: position for position, column in enumerate(self.columns)}
+
+    def __repr__(self):
+        """Return a short description of the schema."""
+        return f"<RowSchema {len(self.columns)} columns>"
+
+    def row(self, default=""):
+        """Return a new row with every column set to default."""
+        return Row(self, [default] * len(self.columns))
+
+    def projection(self, header):
+        """Return the schema position of each header column, or None if the header matches the schema.
+
+        Header columns that are not in the schema map to None.
+        """
+        header = tuple(header)
+        if header == self.columns:
+            return None
+        return tuple((column, self.index.get(column)) for column in header)
+
+
+@lru_cache(maxsize=128)
+def row_schema(columns):
+    """Return the shared schema for a tuple of columns."""
+    return RowSchema(columns)
+
+
+class Row(MutableMapping):
+    """A report row stored as a list of values in schema order.
+
+    Rows behave like the dicts generators have always produced, so ``row[column] = value``
+    and ``row.get(column)`` keep working. Values for columns that are not part of the schema
+    are kept in a side dict and, like extra keys given to ``csv.DictWriter``, are only written
+    when the output header asks for them.
+    """
+
+    __slots__ = ("schema", "cells", "extra")
+
+    def __init__(self, schema, cells):
+        """Initialize the row."""
+        self.schema = schema
+        self.cells = cells
+        self.extra = None
+
+    def __getitem__(self, column):
+        """Return the value of a column."""
+        position = self.schema.index.get(column)
+        if position is not None:
+            return self.cells[position]
+        if self.extra and column in self.extra:
+            return self.extra[column]
+        raise KeyError(column)
+
+    def __setitem__(self, column, value):
+        """Set the value of a column."""
+        position = self.schema.index.get(column)
+        if position is not None:
+            self.cells[position] = value
+        elif self.extra is None:
+            self.extra = {column: value}
+        else:
+            self.extra[column] = value
+
+    def __delitem__(self, column):
+        """Remove a column that is not part of the schema."""
+        if self.extra and column in self.extra:
+            del self.extra[column]
+        elif column in self.schema.index:
+            raise TypeError(f"{column} is part of the row schema and cannot be removed.")
+        else:
+            raise KeyError(column)
+
+    def __contains__(self, column):
+        """Return whether the row has a value for column."""
+        return column in self.schema.index or bool(self.extra and column in self.extra)
+
+    def __iter__(self):
+        """Iterate over the schema columns, then any extra columns."""
+        yield from self.schema.columns
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self):
+        """Return the number of columns."""
+        return len(self.cells) + len(self.extra or ())
+
+    def __repr__(self):
+        """Return the row as a dict."""
+        return f"Row({dict(self)!r})"
+
+    def copy(self):
+        """Return a shallow copy of the row."""
+        row = Row(self.schema, self.cells.copy())
+        if self.extra:
+            row.extra = self.extra.copy()
+        return row
+
+    def project(self, projection):
+        """Return the row values laid out by a projection from RowSchema.projection."""
+        if projection is None:
+            return self.cells
+        cells = self.cells
+        extra = self.extra or {}
+        return [cells[position] if position is not None else extra.get(column, "") for column, position in projection]
+
+
+def render_csv(values):
+    """Return values as a CSV fragment in the default dialect, without a line terminator.
+
+    Fragments of two or more values can be joined with commas into a full line.
+    """
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="").writerow(values)
+    return buffer.getvalue()
+
+
+class RenderedRow(dict):
+    """A dict row that also carries its CSV line, pre-rendered for a header.
+
+    Sinks writing the same header may write the line as is instead of laying the row out
+    again. The line is not kept in sync with the dict, so the row must not be changed once
+    it is built.
+    """
+
+    __slots__ = ("header", "line")
@@ -0,0 +1,148 @@
+#
+# Copyright 2026 Red Hat, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+"""Defines the shared time axis used by generators."""
+
+import datetime
+from collections.abc import Sequence
+from functools import lru_cache
+
+ZERO = datetime.timedelta(0)
+
+
+class TimeAxis(Sequence):
+    """An immutable sequence of {"start", "end"} intervals between two dates.
+
+    Interval ``i`` begins ``i * step`` after the start date and lasts ``length``. Only the start
+    date, the step and the number of intervals are stored, so an axis takes the same memory however
+    long its range is. Each interval is computed when it is accessed, so each caller gets its own copy.
+    """
+
+    __slots__ = ("start_date", "step", "length", "start_offset", "count", "_utc_start")
+
+    def __init__(self, start_date, end_date, step, length=None, start_offset=ZERO):
+        """Initialize the time axis."""
+        length = step if length is None else length
+        self.start_date = start_date
+        self.step = step
+        self.length = length
+        self.start_offset = start_offset
+        self.count = 0
+        if start_date + length <= end_date:
+            self.count = (end_date - start_date - length) // step + 1
+        # steps are added in UTC unless the offset of the start date never changes
+        self._utc_start = None
+        if start_date.tzinfo is not None and not isinstance(start_date.tzinfo, datetime.timezone):
+            self._utc_start = start_date.astimezone(datetime.UTC)
+
+    def _interval(self, index):
+        """Build the interval dict for an index."""
+        if self._utc_start is None:
+            cur_date = self.start_date + index * self.step
+        else:
+            cur_date = (self._utc_start + index * self.step).astimezone(self.start_date.tzinfo)
+        return {"start": cur_date + self.start_offset, "end": cur_date + self.length}
+
+    def __len__(self):
+        """Return the number of intervals."""
+        return self.count
+
+    def __getitem__(self, index):
+        """Return the interval (or list of intervals) at index."""
+        indexes = range(self.count)[index]
+        if isinstance(index, slice):
+            return [self._interval(i) for i in indexes]
+        return self._interval(indexes)
+
+    def __iter__(self):
+        """Iterate over the intervals."""
+        for index in range(self.count):
+            yield self._interval(index)
+
+    def __eq__(self, other):
+        """Compare to another sequence of intervals."""
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __repr__(self):
+        """Return a short description of the axis."""
+        return f"<TimeAxis {len(self)} intervals of {self.length}>"
+
+
+class TimestampCache:
+    """Cache of formatted timestamps shared by every generator in a run.
+
+    Report rows format the same few thousand interval boundaries over and over, so each
+    instant is formatted once per format string and reused. ``hits`` and ``misses`` count
+    lookups; the cache is cleared if it grows past ``max_size`` entries.
+    """
+
+    def __init__(self, max_size=65536):
+        """Initialize the cache."""
+        self.max_size = max_size
+        self._cache = {}
+        self.hits = 0
+        self.misses = 0
+
+    def format(self, in_date, date_format):
+        """Return in_date formatted with date_format."""
+        key = (date_format, in_date, in_date.utcoffset())
+        try:
+            value = self._cache[key]
+        except KeyError:
+            self.misses += 1
+            if len(self._cache) >= self.max_size:
+                self._cache.clear()
+            value = self._cache[key] = in_date.strftime(date_format)
+        else:
+            self.hits += 1
+        return value
+
+    @property
+    def hit_rate(self):
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self):
+        """Empty the cache and reset the counters."""
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __str__(self):
+        """Summarize the cache counters."""
+        return f"{self.hits} hits, {self.misses} misses ({self.hit_rate:.1%} hit rate)"
+
+
+TIMESTAMPS = TimestampCache()
+
+
+@lru_cache(maxsize=128)
+def _time_axis(start_date, end_date, step, length, start_offset, tzinfo):
+    """Build and cache a time axis."""
+    return TimeAxis(start_date, end_date, step, length, start_offset)
+
+
+def time_axis(start_date, end_date, step, length=None, start_offset=ZERO):
+    """Return the shared time axis for the given range and step.
+
+    Axes are cached by their arguments, so generators that cover the same range share one instance.
+    """
+    return _time_axis(start_date, end_date, step, length, start_offset, start_date.tzinfo)
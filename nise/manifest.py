@@ -78,10 +78,12 @@ def aws_generate_manifest(fake, template_data):
     report_keys = []
     for file_name in file_names:
         file_base_name = os.path.basename(file_name)
+        if not file_base_name.endswith(".gz"):
+            file_base_name = f"{file_base_name}.gz"
         if prefix_name:
-            report_key = f"{prefix_name}/{report_name}/{range_str}/{assembly_id}/{file_base_name}.gz"
+            report_key = f"{prefix_name}/{report_name}/{range_str}/{assembly_id}/{file_base_name}"
         else:
-            report_key = f"/{report_name}/{range_str}/{assembly_id}/{file_base_name}.gz"
+            report_key = f"/{report_name}/{range_str}/{assembly_id}/{file_base_name}"
         report_keys.append(report_key)
 
     render_data = {
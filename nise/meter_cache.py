@@ -0,0 +1,109 @@
+#
+# Copyright 2026 Red Hat, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+"""Keeps the Azure meter cache on disk between runs.
+
+The file holds the meters of each subscription as a JSON document::
+
+    {"version": 2, "subscriptions": {"<subscription guid>": {"<meter key>": [meter id, cache key, values]}}}
+
+A meter key identifies the generator that reported a meter (see meter_key), so the next run reports
+the same meter id with the same values. Meters and subscriptions are kept in the order they were last
+used, and the least recently used are dropped once there are more than MAX_METERS or MAX_SUBSCRIPTIONS.
+"""
+
+import json
+import os
+import stat
+from tempfile import NamedTemporaryFile
+
+from nise.util import LOG
+
+METER_CACHE_VERSION = 2
+MAX_METERS = 10000
+MAX_SUBSCRIPTIONS = 100
+
+
+def meter_key(index, generator_cls, attributes):
+    """Return the key of the meter reported by the generator at index of a report's generator list."""
+    return ":".join(
+        str(part)
+        for part in (
+            index,
+            generator_cls.__name__,
+            attributes.get("meter_id", ""),
+            attributes.get("data_direction", ""),
+        )
+    )
+
+
+def _read(path):
+    """Return the subscriptions in a cache file, or an empty dict if the file is missing or unusable."""
+    try:
+        with open(path) as cache_file:
+            data = json.load(cache_file)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as err:
+        LOG.warning(f"Ignoring unreadable meter cache {path}: {err}")
+        return {}
+    if not isinstance(data, dict) or data.get("version") != METER_CACHE_VERSION:
+        LOG.warning(f"Ignoring meter cache {path} written with another version.")
+        return {}
+    return data.get("subscriptions") or {}
+
+
+def _file_mode(path):
+    """Return the mode of the file at path, or the mode a new file gets under the current umask."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def load_meter_cache(path, subscription_guid):
+    """Return the meters of a subscription from path, as meter key: (meter id, cache key, values)."""
+    meters = _read(path).get(str(subscription_guid)) or {}
+    return {
+        key: (meter_id, cache_key, tuple(values) if isinstance(values, list) else values)
+        for key, (meter_id, cache_key, values) in meters.items()
+    }
+
+
+def save_meter_cache(path, subscription_guid, meters):
+    """Write the meters of a subscription to path, keeping those of other subscriptions.
+
+    meters is ordered from least to most recently used. The file is replaced atomically, so
+    readers and interrupted runs never see a partial cache.
+    """
+    subscriptions = _read(path)
+    subscriptions.pop(str(subscription_guid), None)
+    subscriptions[str(subscription_guid)] = dict(list(meters.items())[-MAX_METERS:])
+    subscriptions = dict(list(subscriptions.items())[-MAX_SUBSCRIPTIONS:])
+
+    directory = os.path.dirname(os.path.abspath(path))
+    with NamedTemporaryFile("w", dir=directory, prefix=".meter-cache-", suffix=".json", delete=False) as cache_file:
+        try:
+            json.dump({"version": METER_CACHE_VERSION, "subscriptions": subscriptions}, cache_file)
+            cache_file.flush()
+            os.fsync(cache_file.fileno())
+            os.chmod(cache_file.name, _file_mode(path))
+        except BaseException:
+            os.remove(cache_file.name)
+            raise
+    os.replace(cache_file.name, path)
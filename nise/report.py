@@ -28,17 +28,21 @@ import random
 import shutil
 import string
 import tarfile
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from contextlib import nullcontext
 from datetime import datetime
+from datetime import timedelta
 from datetime import UTC
 from random import randint
-from tempfile import gettempdir
 from tempfile import NamedTemporaryFile
 from tempfile import TemporaryDirectory
 from uuid import uuid4
 import logging
 
-import boto3
 import requests
 from dateutil import parser
 from dateutil.relativedelta import relativedelta
@@ -47,6 +51,7 @@ from faker import Faker
 from nise import __version__
 from nise.copy_to_local_dir import copy_to_local_dir
 from nise.extract import extract_payload
+from nise.generators.aws import AWSGenerator
 from nise.generators.aws import DataTransferGenerator
 from nise.generators.aws import EBSGenerator
 from nise.generators.aws import EC2Generator
@@ -55,6 +60,9 @@ from nise.generators.aws import RDSGenerator
 from nise.generators.aws import Route53Generator
 from nise.generators.aws import S3Generator
 from nise.generators.aws import VPCGenerator
+from nise.generators.azure import AZURE_COLUMNS_V2_RESOURCE_GROUP
+from nise.generators.azure import AZURE_COLUMNS_V2_SUBSCRIPTION
+from nise.generators.azure import AZURE_RESOURCE_GROUP_TO_SUBSCRIPTION_COLUMNS
 from nise.generators.azure import BandwidthGenerator
 from nise.generators.azure import CCSPGenerator
 from nise.generators.azure import DTGenerator
@@ -85,27 +93,35 @@ from nise.generators.ocp import ROS_OCP_REPORT_TYPE_TO_COLS
 from nise.generators.ocp import OCP_ROS_USAGE
 from nise.generators.ocp import OCP_ROS_NAMESPACE_USAGE
 from nise.generators.ocp import OCPGenerator
+from nise.generators.ocp import ros_numpy
+from nise.generators.row import Row
+from nise.generators.row import row_schema
+from nise.generators.time_axis import TIMESTAMPS
 from nise.manifest import aws_generate_manifest
 from nise.manifest import ocp_generate_manifest
+from nise.meter_cache import load_meter_cache
+from nise.meter_cache import meter_key
+from nise.meter_cache import save_meter_cache
+from nise.sink import CSVSink
+from nise.upload import azure_blob_service_client
 from nise.upload import gcp_bucket_to_dataset
 from nise.upload import upload_to_azure_container
 from nise.upload import upload_to_gcp_storage
 from nise.upload import upload_to_s3
 from nise.util import LOG
+from nise.util import ParallelGzipWriter
+from nise.util import seed_random
 
-
-def create_temporary_copy(path, temp_file_name, temp_dir_name="None"):
-    """Create temporary copy of a file."""
-    temp_dir = gettempdir()
-    if temp_dir_name:
-        new_dir = os.path.join(temp_dir, temp_dir_name)
-        if not os.path.exists(new_dir):
-            os.mkdir(new_dir)
-        temp_path = os.path.join(new_dir, temp_file_name)
-    else:
-        temp_path = os.path.join(temp_dir, temp_file_name)
-    shutil.copy2(path, temp_path)
-    return temp_path
+# Minutes between the uploads of the Cost Management Metrics Operator
+OCP_UPLOAD_CYCLE = 360
+# Payloads uploaded to Ingress at the same time
+INGRESS_UPLOAD_WORKERS = 4
+# Seconds before its expiry that a cached OAuth token is fetched again
+OAUTH_TOKEN_EXPIRY_MARGIN = 30
+# Report files uploaded to Azure Blob Storage at the same time
+AZURE_UPLOAD_WORKERS = 4
+# Blocks of one report file uploaded to Azure Blob Storage at the same time
+AZURE_UPLOAD_CONCURRENCY = 4
 
 
 def _write_csv(output_file, data, header):
@@ -152,35 +168,39 @@ def _generate_azure_date_range(month):
     return start.strftime("%Y%m%d") + "-" + end.strftime("%Y%m%d")
 
 
-def _gzip_report(report_path):
+def _compression_level(options):
+    """Return the gzip compression level requested with --compression-level."""
+    level = options.get("compression_level")
+    return 9 if level is None else level
+
+
+def _gzip_report(report_path, compresslevel=9):
     """Compress the report."""
     t_file = NamedTemporaryFile(mode="wb", suffix=".csv.gz", delete=False)
-    with open(report_path, "rb") as f_in, gzip.open(t_file.name, "wb") as f_out:
-        f_out.write(f_in.read())
+    with open(report_path, "rb") as f_in, gzip.open(t_file.name, "wb", compresslevel) as f_out:
+        shutil.copyfileobj(f_in, f_out)
     return t_file.name
 
 
-def _tar_gzip_report(temp_dir):
-    """Compress the report and manifest to tarfile."""
+def _tar_gzip_report_files(file_list, compresslevel=9):
+    """Compress the files to a tarfile.
+
+    file_list is either a list of paths, archived under their base names, or a dict of archive
+    names to paths. Files are read in place and compressed on a pool of threads.
+    """
+    if isinstance(file_list, dict):
+        members = file_list.items()
+    else:
+        members = [(os.path.basename(report_file), report_file) for report_file in file_list]
     t_file = NamedTemporaryFile(mode="w", suffix=".tar.gz", delete=False)
 
-    with tarfile.open(t_file.name, "w:gz") as tar:
-        tar.add(temp_dir, arcname=os.path.sep)
+    with ParallelGzipWriter(t_file.name, compresslevel) as f_out, tarfile.open(fileobj=f_out, mode="w|") as tar:
+        for arcname, report_file in members:
+            tar.add(report_file, arcname=arcname)
 
     return t_file.name
 
 
-def _tar_gzip_report_files(file_list):
-    """Compress the file list to a tarfile."""
-    with TemporaryDirectory() as t_directory:
-        for report_file in file_list:
-            temp_path = os.path.join(t_directory, os.path.basename(report_file))
-            shutil.copy2(report_file, temp_path)
-        fname = _tar_gzip_report(t_directory)
-
-    return fname
-
-
 def _write_manifest(data):
     """Write manifest file to temp location.
 
@@ -218,13 +238,17 @@ def ocp_route_file(insights_upload, local_path):
     if os.path.isdir(insights_upload):
         extract_payload(insights_upload, local_path)
     else:
-        response = post_payload_to_ingest_service(insights_upload, local_path)
-        if response.status_code == 202:
-            LOG.info("File uploaded successfully.")
-        else:
-            LOG.error(f"{response.status_code} File upload failed.")
+        _log_ingest_response(post_payload_to_ingest_service(insights_upload, local_path))
 
-        LOG.info(response.text)
+
+def _log_ingest_response(response):
+    """Log the outcome of a payload upload to Ingress."""
+    if response.status_code == 202:
+        LOG.info("File uploaded successfully.")
+    else:
+        LOG.error(f"{response.status_code} File upload failed.")
+
+    LOG.info(response.text)
 
 
 def ocp_route_file_minio(minio_upload, local_path, key):  # pragma: no cover
@@ -239,6 +263,8 @@ def ocp_route_file_minio(minio_upload, local_path, key):  # pragma: no cover
 
 
 def get_s3_signature(url, file_name):  # pragma: no cover
+    import boto3
+
     s3 = boto3.client(
         "s3",
         endpoint_url=url,
@@ -276,8 +302,40 @@ def _convert_bytes(num):
     return None
 
 
-def post_payload_to_ingest_service(insights_upload, local_path, max_retries=3, initial_backoff=2):  # noqa: C901
-    """POST the payload to Insights via header or basic auth with retry logic"""
+class OAuthToken:
+    """A service account OAuth token, fetched once and reused until shortly before it expires.
+
+    Tokens without an expiry are fetched again every time.
+    """
+
+    def __init__(self):
+        """Initialize the token."""
+        self._lock = threading.Lock()
+        self._token = None
+        self._expires = 0
+
+    def get(self, http, token_url, token_data, token_headers):
+        """Return the token, fetching a new one with http if there is none or it is about to expire."""
+        with self._lock:
+            if self._token is None or time.monotonic() >= self._expires:
+                token_resp = http.post(token_url, data=token_data, headers=token_headers)
+                token_resp.raise_for_status()
+                token_json = token_resp.json()
+                self._token = token_json.get("access_token")
+                expires_in = token_json.get("expires_in") or 0
+                self._expires = time.monotonic() + expires_in - OAUTH_TOKEN_EXPIRY_MARGIN
+            return self._token
+
+
+def post_payload_to_ingest_service(  # noqa: C901
+    insights_upload, local_path, max_retries=3, initial_backoff=2, session=None, oauth_token=None
+):
+    """POST the payload to Insights via header or basic auth with retry logic
+
+    Requests go through session when one is given, and a service account token is taken
+    from oauth_token, an OAuthToken, so that it can be shared between uploads.
+    """
+    http = session or requests
     insights_account_id = os.environ.get("INSIGHTS_ACCOUNT_ID")
     insights_org_id = os.environ.get("INSIGHTS_ORG_ID")
     insights_user = os.environ.get("INSIGHTS_USER")
@@ -326,10 +384,7 @@ def post_payload_to_ingest_service(insights_upload, local_path, max_retries=3, i
         token_data += f"&grant_type=client_credentials&scope={hcc_token_scope}"
 
         try:
-            token_resp = requests.post(hcc_token_url, data=token_data, headers=token_headers)
-            token_resp.raise_for_status()
-            token_json = token_resp.json()
-            token = token_json.get("access_token")
+            token = (oauth_token or OAuthToken()).get(http, hcc_token_url, token_data, token_headers)
             headers = {"Authorization": f"Bearer {token}"}
         except requests.exceptions.RequestException as e:
             LOG.error(f"Failed to obtain OAuth token: {e}")
@@ -345,14 +400,14 @@ def post_payload_to_ingest_service(insights_upload, local_path, max_retries=3, i
 
                 # Make the POST request based on auth method
                 if auth_method == "identity_header":
-                    response = requests.post(
+                    response = http.post(
                         insights_upload,
                         data={},
                         files={"file": ("payload.tar.gz", upload_file, content_type)},
                         headers=headers,
                     )
                 elif auth_method == "basic_auth":
-                    response = requests.post(
+                    response = http.post(
                         insights_upload,
                         data={},
                         files={"file": ("payload.tar.gz", upload_file, content_type)},
@@ -360,7 +415,7 @@ def post_payload_to_ingest_service(insights_upload, local_path, max_retries=3, i
                         verify=False,
                     )
                 else:  # bearer_token
-                    response = requests.post(
+                    response = http.post(
                         insights_upload,
                         data={},
                         files={"file": ("payload.tar.gz", upload_file, content_type)},
@@ -391,6 +446,128 @@ def post_payload_to_ingest_service(insights_upload, local_path, max_retries=3, i
             raise
 
 
+class IngressUploader:
+    """Upload payloads to Ingress from a pool of threads sharing one HTTP session.
+
+    upload() returns as soon as a payload is queued, so later payloads can be built while
+    earlier ones are uploading. At most twice max_workers payloads are queued or uploading
+    at a time; upload() waits for a free slot beyond that. Each payload is removed once it
+    has been uploaded. Leaving the context manager waits for every upload and raises the
+    first error any of them hit.
+    """
+
+    def __init__(self, insights_upload, max_workers=INGRESS_UPLOAD_WORKERS):
+        """Initialize the session and the upload threads."""
+        self.insights_upload = insights_upload
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.oauth_token = OAuthToken()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._slots = threading.BoundedSemaphore(2 * max_workers)
+        self._futures = []
+
+    def _upload(self, local_path):
+        """Upload a payload and remove it."""
+        try:
+            response = post_payload_to_ingest_service(
+                self.insights_upload, local_path, session=self.session, oauth_token=self.oauth_token
+            )
+            _log_ingest_response(response)
+            return response
+        finally:
+            os.remove(local_path)
+            self._slots.release()
+
+    def upload(self, local_path):
+        """Queue a payload for upload."""
+        self._slots.acquire()
+        self._futures.append(self._executor.submit(self._upload, local_path))
+
+    def close(self):
+        """Wait for every upload, then raise the first error if any of them failed."""
+        try:
+            for future in self._futures:
+                future.result()
+        finally:
+            self._executor.shutdown()
+            self.session.close()
+
+    def __enter__(self):
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *exc):
+        """Wait for the uploads when leaving the context manager."""
+        self.close()
+
+
+class AzureBlobUploader:
+    """Upload report files to an Azure Blob Storage container from a pool of threads sharing one client.
+
+    upload() returns as soon as a file is queued, so the next month can be generated while
+    earlier files are uploading. Each file is uploaded max_concurrency blocks at a time, in
+    blocks of max_block_size bytes when given. At most twice max_workers files are queued or
+    uploading at a time; upload() waits for a free slot beyond that. Leaving the context
+    manager waits for every upload.
+    """
+
+    def __init__(
+        self,
+        container_name,
+        max_workers=AZURE_UPLOAD_WORKERS,
+        max_concurrency=AZURE_UPLOAD_CONCURRENCY,
+        max_block_size=None,
+    ):
+        """Initialize the client and the upload threads."""
+        self.container_name = container_name
+        self.max_concurrency = max_concurrency
+        self.client = azure_blob_service_client(
+            os.getenv("AZURE_STORAGE_CONNECTION_STRING"), max_block_size, pool_size=max_workers * max_concurrency
+        )
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._slots = threading.BoundedSemaphore(2 * max_workers)
+        self._futures = []
+
+    def _upload(self, local_path, storage_file_path, remove):
+        """Upload a file and remove it if asked to."""
+        try:
+            return upload_to_azure_container(
+                self.container_name,
+                local_path,
+                storage_file_path,
+                blob_service_client=self.client,
+                max_concurrency=self.max_concurrency,
+            )
+        finally:
+            if remove:
+                os.remove(local_path)
+            self._slots.release()
+
+    def upload(self, local_path, storage_file_path, remove=False):
+        """Queue a file for upload to storage_file_path within the container."""
+        self._slots.acquire()
+        self._futures.append(self._executor.submit(self._upload, local_path, storage_file_path, remove))
+
+    def close(self):
+        """Wait for every upload, then raise the first error if any of them failed."""
+        try:
+            for future in self._futures:
+                future.result()
+        finally:
+            self._executor.shutdown()
+            self.client.close()
+
+    def __enter__(self):
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *exc):
+        """Wait for the uploads when leaving the context manager."""
+        self.close()
+
+
 def post_payload_to_minio(minio_upload, local_path, key):  # pragma: no cover
     """Upload the payload to Minio (or S3)."""
     signature = get_s3_signature(minio_upload, key)
@@ -430,20 +607,15 @@ def _create_month_list(start_date, end_date):
     return months
 
 
-def _aws_finalize_report(data, static_data=None):
-    """Populate invoice id for data."""
-    data = copy.deepcopy(data)
-
+def _aws_invoice_id(static_data=None):
+    """Return the invoice id for a finalized report."""
     invoice_id = None
     if static_data and static_data.get("finalized_report"):
         invoice_id = static_data.get("finalized_report").get("invoice_id")
 
     if not invoice_id:
         invoice_id = "".join([random.choice(string.digits) for _ in range(9)])
-    for row in data:
-        row["bill/InvoiceId"] = invoice_id
-
-    return data
+    return invoice_id
 
 
 def _generate_aws_account_info(static_report_data=None):
@@ -590,29 +762,77 @@ def _create_generator_dates_from_yaml(attributes, month):
     return gen_start_date, gen_end_date
 
 
-def write_aws_file(
-    file_number, aws_report_name, month_name, year, data, aws_finalize_report, static_report_data, headers
+def _aws_generator_rows(
+    seed_keys, generator_cls, start_date, end_date, currency_code, payer_account, usage_accounts, attributes, tag_cols
 ):
-    """Write AWS data to a file."""
-    headers = sorted(list(headers))
-    if file_number != 0:
-        file_name = f"{month_name}-{year}-{aws_report_name}-{str(file_number)}"
-    else:
-        file_name = f"{month_name}-{year}-{aws_report_name}"
-
-    if aws_finalize_report and aws_finalize_report == "overwrite":
-        data = _aws_finalize_report(data, static_report_data)
-    elif aws_finalize_report and aws_finalize_report == "copy":
-        # Currently only a local option as this does not simulate
-        finalized_data = _aws_finalize_report(data, static_report_data)
-        file_name_finalized = f"{file_name}-finalized"
-        full_file_name = f"{os.getcwd()}/{file_name_finalized}.csv"
-        _write_csv(full_file_name, finalized_data, headers)
+    """Yield every row produced by a single AWS generator entry."""
+    seed_random(*seed_keys)
+    gen = generator_cls(start_date, end_date, currency_code, payer_account, usage_accounts, attributes, tag_cols)
+    gen.compact_rows = True
+    num_instances = 1 if attributes else randint(2, 60)
+    for _ in range(num_instances):
+        yield from gen.generate_data()
+
+
+def _aws_write_shard(shard_path, headers, task):
+    """Write the rows of a single AWS generator entry to a shard file."""
+    with CSVSink(shard_path, headers) as sink:
+        for row in _aws_generator_rows(*task):
+            sink.write(row)
+    return sink.files[0]
+
+
+def _aws_report_columns(generators, tag_cols=None):
+    """Return the sorted header for an AWS report covering every generator."""
+    columns = set(AWSGenerator.AWS_COLUMNS)
+    if tag_cols:
+        columns.update(tag_cols)
+    for generator in generators:
+        attributes = generator.get("attributes") or {}
+        if cost_categories := attributes.get("cost_category"):
+            columns.update(cost_categories.keys())
+    return sorted(columns)
+
+
+def _aws_report_sink(aws_report_name, month_name, year, headers, aws_finalize_report, static_report_data, options):
+    """Open a streaming sink for a month of AWS report data."""
+    transform = None
+    variants = {}
+    if aws_finalize_report:
+        invoice_id = _aws_invoice_id(static_report_data)
+
+        def finalize_row(row):
+            row = row.copy()
+            row["bill/InvoiceId"] = invoice_id
+            return row
+
+        if aws_finalize_report == "overwrite":
+            transform = finalize_row
+        elif aws_finalize_report == "copy":
+            # Currently only a local option as this does not simulate
+            variants["-finalized"] = finalize_row
+
+    return CSVSink(
+        f"{os.getcwd()}/{month_name}-{year}-{aws_report_name}",
+        headers,
+        row_limit=options.get("row_limit"),
+        byte_limit=options.get("byte_limit"),
+        transform=transform,
+        variants=variants,
+        compresslevel=_compression_level(options) if options.get("gzip_output") else None,
+    )
 
-    full_file_name = f"{os.getcwd()}/{file_name}.csv"
-    _write_csv(full_file_name, data, headers)
 
-    return full_file_name
+def _aws_route_monthly_files(aws_bucket_name, s3_cur_path, monthly_files, options):
+    """Route the report files for a month, compressing any that were written as plain CSV."""
+    for monthly_file in monthly_files:
+        file_name = os.path.basename(monthly_file)
+        if monthly_file.endswith(".gz"):
+            aws_route_file(aws_bucket_name, f"{s3_cur_path}/{file_name}", monthly_file)
+        else:
+            temp_cur_zip = _gzip_report(monthly_file, _compression_level(options))
+            aws_route_file(aws_bucket_name, f"{s3_cur_path}/{file_name}.gz", temp_cur_zip)
+            os.remove(temp_cur_zip)
 
 
 def default_currency(currency, static_currency):
@@ -675,118 +895,161 @@ def aws_create_report(options):  # noqa: C901
 
     months = _create_month_list(start_date, end_date)
 
+    workers = options.get("workers") or 1
+    seed = options.get("seed")
+    if workers > 1 and seed is None:
+        # forked workers inherit the same random state, so each shard is seeded from a drawn seed instead
+        seed = random.getrandbits(64)
+    seed_random(seed, "aws", "accounts")
     payer_account, usage_accounts, currency_code = _generate_aws_account_info(accounts_list)
     currency_code = default_currency(options.get("currency"), currency_code)
 
     aws_bucket_name = options.get("aws_bucket_name")
     aws_report_name = options.get("aws_report_name")
     write_monthly = options.get("write_monthly", False)
-    for month in months:
-        data = []
-        file_number = 0
-        monthly_files = []
-        fake = Faker()
-        num_gens = len(generators)
-        ten_percent = int(num_gens * 0.1) if num_gens > 50 else 5
-        LOG.info(f"Producing data for {num_gens} generators for {month.get('start').strftime('%Y-%m')}.")
-        for count, generator in enumerate(generators):
-            generator_cls = generator.get("generator")
-            attributes = generator.get("attributes")
-            gen_start_date = month.get("start")
-            gen_end_date = month.get("end")
-            if attributes:
-                # Skip if generator usage is outside of current month
-                if attributes.get("end_date") < month.get("start"):
-                    continue
-                if attributes.get("start_date") > month.get("end"):
-                    continue
-
-                gen_start_date, gen_end_date = _create_generator_dates_from_yaml(attributes, month)
+    headers = _aws_report_columns(generators, options.get("aws_tags"))
+    shard_schema = row_schema(tuple(headers))
+    with ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext() as executor:
+        for month in months:
+            fake = Faker()
+            num_gens = len(generators)
+            ten_percent = int(num_gens * 0.1) if num_gens > 50 else 5
+            LOG.info(f"Producing data for {num_gens} generators for {month.get('start').strftime('%Y-%m')}.")
+            month_key = month.get("start").strftime("%Y-%m")
+            tasks = []
+            for index, generator in enumerate(generators):
+                generator_cls = generator.get("generator")
+                attributes = generator.get("attributes")
+                gen_start_date = month.get("start")
+                gen_end_date = month.get("end")
+                if attributes:
+                    # Skip if generator usage is outside of current month
+                    if attributes.get("end_date") < month.get("start"):
+                        continue
+                    if attributes.get("start_date") > month.get("end"):
+                        continue
+
+                    gen_start_date, gen_end_date = _create_generator_dates_from_yaml(attributes, month)
+
+                tasks.append(
+                    (
+                        (seed, "aws", index, month_key),
+                        generator_cls,
+                        gen_start_date,
+                        gen_end_date,
+                        currency_code,
+                        payer_account,
+                        usage_accounts,
+                        attributes,
+                        options.get("aws_tags"),
+                    )
+                )
 
-            gen = generator_cls(
-                gen_start_date,
-                gen_end_date,
-                currency_code,
-                payer_account,
-                usage_accounts,
-                attributes,
-                options.get("aws_tags"),
+            seed_random(seed, "aws", "invoice", month_key)
+            sink = _aws_report_sink(
+                aws_report_name,
+                month.get("name"),
+                month.get("start").year,
+                headers,
+                aws_finalize_report,
+                static_report_data,
+                options,
             )
-            num_instances = 1 if attributes else randint(2, 60)
-            for _ in range(num_instances):
-                for hour in gen.generate_data():
-                    data += [hour]
-                    if len(data) == options.get("row_limit"):
-                        file_number += 1
-                        month_output_file = write_aws_file(
-                            file_number,
-                            aws_report_name,
-                            month.get("name"),
-                            gen_start_date.year,
-                            data,
-                            aws_finalize_report,
-                            static_report_data,
-                            gen.AWS_COLUMNS,
-                        )
-                        monthly_files.append(month_output_file)
-                        data.clear()
+            with sink, TemporaryDirectory() as shard_dir:
+                if executor:
+                    # Each generator writes its own shard; shards are stitched back in order so the
+                    # month files match the serial output.
+                    shards = [
+                        executor.submit(_aws_write_shard, os.path.join(shard_dir, str(count)), headers, task)
+                        for count, task in enumerate(tasks)
+                    ]
+                else:
+                    shards = [None] * len(tasks)
+                for count, (task, shard) in enumerate(zip(tasks, shards)):
+                    if shard:
+                        shard_file = shard.result()
+                        with open(shard_file) as f:
+                            reader = csv.reader(f)
+                            next(reader)
+                            for values in reader:
+                                sink.write(Row(shard_schema, values))
+                        os.remove(shard_file)
+                    else:
+                        for row in _aws_generator_rows(*task):
+                            sink.write(row)
 
-            if count % ten_percent == 0:
-                LOG.info(f"Done with {count} of {num_gens} generators.")
+                    if count % ten_percent == 0:
+                        LOG.info(f"Done with {count} of {num_gens} generators.")
 
-        if file_number != 0:
-            file_number += 1
-        month_output_file = write_aws_file(
-            file_number,
-            aws_report_name,
-            month.get("name"),
-            gen_start_date.year,
-            data,
-            aws_finalize_report,
-            static_report_data,
-            gen.AWS_COLUMNS,
-        )
-        monthly_files.append(month_output_file)
-
-        if aws_bucket_name:
-            manifest_values = {"account": payer_account}
-            manifest_values.update(options)
-            manifest_values["start_date"] = gen_start_date
-            manifest_values["end_date"] = gen_end_date
-            manifest_values["file_names"] = monthly_files
-
-            if not manifest_gen:
-                s3_cur_path, _ = aws_generate_manifest(fake, manifest_values)
-                for monthly_file in monthly_files:
-                    temp_cur_zip = _gzip_report(monthly_file)
-                    destination_file = f"{s3_cur_path}/{os.path.basename(monthly_file)}.gz"
-                    aws_route_file(aws_bucket_name, destination_file, temp_cur_zip)
-                    os.remove(temp_cur_zip)
-            else:
-                s3_cur_path, manifest_data = aws_generate_manifest(fake, manifest_values)
-                s3_month_path = os.path.dirname(s3_cur_path)
-                s3_month_manifest_path = s3_month_path + "/" + aws_report_name + "-Manifest.json"
-                s3_assembly_manifest_path = s3_cur_path + "/" + aws_report_name + "-Manifest.json"
+            monthly_files = sink.files
 
-                temp_manifest = _write_manifest(manifest_data)
-                aws_route_file(aws_bucket_name, s3_month_manifest_path, temp_manifest)
-                aws_route_file(aws_bucket_name, s3_assembly_manifest_path, temp_manifest)
+            if aws_bucket_name:
+                manifest_values = {"account": payer_account}
+                manifest_values.update(options)
+                manifest_values["start_date"] = gen_start_date
+                manifest_values["end_date"] = gen_end_date
+                manifest_values["file_names"] = monthly_files
 
-                for monthly_file in monthly_files:
-                    temp_cur_zip = _gzip_report(monthly_file)
-                    destination_file = f"{s3_cur_path}/{os.path.basename(monthly_file)}.gz"
-                    aws_route_file(aws_bucket_name, destination_file, temp_cur_zip)
-                    os.remove(temp_cur_zip)
+                if not manifest_gen:
+                    s3_cur_path, _ = aws_generate_manifest(fake, manifest_values)
+                    _aws_route_monthly_files(aws_bucket_name, s3_cur_path, monthly_files, options)
+                else:
+                    s3_cur_path, manifest_data = aws_generate_manifest(fake, manifest_values)
+                    s3_month_path = os.path.dirname(s3_cur_path)
+                    s3_month_manifest_path = s3_month_path + "/" + aws_report_name + "-Manifest.json"
+                    s3_assembly_manifest_path = s3_cur_path + "/" + aws_report_name + "-Manifest.json"
 
-                os.remove(temp_manifest)
+                    temp_manifest = _write_manifest(manifest_data)
+                    aws_route_file(aws_bucket_name, s3_month_manifest_path, temp_manifest)
+                    aws_route_file(aws_bucket_name, s3_assembly_manifest_path, temp_manifest)
 
-        if not write_monthly:
-            _remove_files(monthly_files)
+                    _aws_route_monthly_files(aws_bucket_name, s3_cur_path, monthly_files, options)
+
+                    os.remove(temp_manifest)
+
+            if not write_monthly:
+                _remove_files(monthly_files)
+
+    LOG.debug(f"Timestamp cache: {TIMESTAMPS}")
+
+
+def _azure_report_sink(columns, options, row_columns=None):
+    """Open a streaming sink for a month of Azure data, split into costreport_<uuid>.csv parts by rows or bytes.
+
+    row_columns optionally names the row key each of the columns is read from.
+    """
+    return CSVSink(
+        None,
+        columns,
+        row_limit=options.get("row_limit"),
+        byte_limit=options.get("byte_limit"),
+        name_file=lambda: _generate_azure_filename()[0].removesuffix(".csv"),
+        columns=row_columns,
+    )
+
+
+def _azure_exports(options):
+    """Return the report name suffix, columns and row columns of each Azure export to write.
+
+    With azure_dual_export, rows are generated for the subscription export and the resource group export is
+    written from the same rows under its own column names, in a report name suffixed with -resource-group.
+    """
+    if options.get("azure_dual_export"):
+        row_columns = tuple(
+            AZURE_RESOURCE_GROUP_TO_SUBSCRIPTION_COLUMNS.get(column, column)
+            for column in AZURE_COLUMNS_V2_RESOURCE_GROUP
+        )
+        return [
+            ("", AZURE_COLUMNS_V2_SUBSCRIPTION, None),
+            ("-resource-group", AZURE_COLUMNS_V2_RESOURCE_GROUP, row_columns),
+        ]
+    if options.get("resource_group_export"):
+        return [("", AZURE_COLUMNS_V2_RESOURCE_GROUP, None)]
+    return [("", AZURE_COLUMNS_V2_SUBSCRIPTION, None)]
 
 
 def azure_create_report(options):  # noqa: C901
     """Create a cost usage report file."""
-    data = []
     start_date = options.get("start_date")
     end_date = options.get("end_date")
     static_report_data = options.get("static_report_data")
@@ -808,75 +1071,169 @@ def azure_create_report(options):  # noqa: C901
 
     months = _create_month_list(start_date, end_date)
 
+    seed = options.get("seed")
+    seed_random(seed, "azure", "accounts")
     account_info = _generate_azure_account_info(accounts_list)
     currency = default_currency(options.get("currency"), account_info["currency_code"])
 
+    meter_cache_file = options.get("azure_meter_cache")
     meter_cache = {}
+    meters = None
+    if meter_cache_file:
+        meters = load_meter_cache(meter_cache_file, account_info["subscription_guid"])
     # The options params are not going to change so we don't
     # have to keep resetting the var inside of the for loop
     azure_container_name = options.get("azure_container_name")
     storage_account_name = options.get("azure_account_name")
     azure_prefix_name = options.get("azure_prefix_name")
     azure_report_name = options.get("azure_report_name")
-    resource_group_export = options.get("resource_group_export", False)
+    exports = _azure_exports(options)
+    # dual exports are written from subscription export rows
+    resource_group_export = options.get("resource_group_export", False) and not options.get("azure_dual_export")
     write_monthly = options.get("write_monthly", False)
-    for month in months:
-        data = []
-        monthly_files = []
-        num_gens = len(generators)
-        ten_percent = int(num_gens * 0.1) if num_gens > 50 else 5
-        LOG.info(f"Producing data for {num_gens} generators for {month.get('start').strftime('%Y-%m')}.")
-        for count, generator in enumerate(generators):
-            generator_cls = generator.get("generator")
-            attributes = generator.get("attributes", {})
-            gen_start_date = month.get("start")
-            gen_end_date = month.get("end")
-            if attributes:
-                # Skip if generator usage is outside of current month
-                if attributes.get("end_date") < month.get("start"):
-                    continue
-                if attributes.get("start_date") > month.get("end"):
-                    continue
-            else:
-                attributes = {"end_date": end_date, "start_date": start_date}
+    uploader = None
+    if azure_container_name and storage_account_name and os.getenv("AZURE_STORAGE_CONNECTION_STRING"):
+        uploader = AzureBlobUploader(
+            azure_container_name,
+            options.get("upload_workers") or AZURE_UPLOAD_WORKERS,
+            options.get("azure_upload_concurrency") or AZURE_UPLOAD_CONCURRENCY,
+            options.get("azure_block_size"),
+        )
+    with uploader or nullcontext():
+        for month in months:
+            num_gens = len(generators)
+            ten_percent = int(num_gens * 0.1) if num_gens > 50 else 5
+            LOG.info(f"Producing data for {num_gens} generators for {month.get('start').strftime('%Y-%m')}.")
+            sinks = [
+                (suffix, _azure_report_sink(columns, options, row_columns)) for suffix, columns, row_columns in exports
+            ]
+            for count, generator in enumerate(generators):
+                generator_cls = generator.get("generator")
+                attributes = generator.get("attributes", {})
+                gen_start_date = month.get("start")
+                gen_end_date = month.get("end")
+                if attributes:
+                    # Skip if generator usage is outside of current month
+                    if attributes.get("end_date") < month.get("start"):
+                        continue
+                    if attributes.get("start_date") > month.get("end"):
+                        continue
+                else:
+                    attributes = {"end_date": end_date, "start_date": start_date}
 
-            gen_start_date, gen_end_date = _create_generator_dates_from_yaml(attributes, month)
+                gen_start_date, gen_end_date = _create_generator_dates_from_yaml(attributes, month)
 
-            if attributes.get("meter_cache"):
-                meter_cache.update(attributes.get("meter_cache"))  # needed so that meter_cache can be defined in yaml
-            attributes["meter_cache"] = meter_cache
-            attributes["resource_group_export"] = resource_group_export
-            gen = generator_cls(gen_start_date, gen_end_date, currency, account_info, attributes)
-            azure_columns = gen.azure_columns
-            data += gen.generate_data()
-            meter_cache = gen.get_meter_cache()
+                if attributes.get("meter_cache"):
+                    meter_cache.update(
+                        attributes.get("meter_cache")
+                    )  # needed so that meter_cache can be defined in yaml
+                attributes["meter_cache"] = meter_cache
+                attributes["resource_group_export"] = resource_group_export
+                key = meter_key(count, generator_cls, attributes)
+                if meters and key in meters:
+                    # report the meter this generator reported in an earlier run or month
+                    meter_id, cache_key, values = meters[key]
+                    meter_cache[cache_key] = values
+                    attributes = {**attributes, "meter_id": meter_id}
+                seed_random(seed, "azure", count, month.get("start").strftime("%Y-%m"))
+                gen = generator_cls(gen_start_date, gen_end_date, currency, account_info, attributes)
+                for row in gen.generate_data():
+                    for _, sink in sinks:
+                        sink.write(row)
+                meter_cache = gen.get_meter_cache()
+                meter = gen.get_meter()
+                if meters is not None and meter and meter[2]:
+                    # reinserted so that the least recently used meters are dropped first
+                    meters.pop(key, None)
+                    meters[key] = meter
+
+                if count % ten_percent == 0:
+                    LOG.info(f"Done with {count} of {num_gens} generators.")
+
+            date_range = _generate_azure_date_range(month)
+            for suffix, sink in sinks:
+                sink.close()
+                monthly_files = sink.files
+
+                if azure_container_name:
+                    # every part of the month goes in the same date range folder
+                    for local_path in monthly_files:
+                        file_path = ""
+                        if azure_prefix_name:
+                            file_path += azure_prefix_name + "/"
+                        file_path += azure_report_name + suffix + "/"
+                        file_path += date_range + "/"
+                        file_path += os.path.basename(local_path)
+
+                        # azure blob upload, queued so that the next month is generated while it uploads
+                        if uploader:
+                            uploader.upload(local_path, file_path, remove=not write_monthly)
+                        elif storage_account_name:
+                            azure_route_file(storage_account_name, azure_container_name, local_path, file_path)
+                        # local dir upload
+                        else:
+                            azure_route_file(azure_container_name, file_path, local_path)
+                if not (write_monthly or uploader):
+                    _remove_files(monthly_files)
+
+    if meter_cache_file:
+        save_meter_cache(meter_cache_file, account_info["subscription_guid"], meters)
+
+
+def _ocp_report_sink(cluster_id, month, report_type, options, part=None):
+    """Open a streaming sink for a month of one OCP report type, named like write_ocp_file names its files.
+
+    part, such as a node shard or an operator cycle, is added to the name of the files.
+    """
+    file_name = f"{month.get('name')}-{month.get('start').year}-{cluster_id}-{report_type}"
+    if part is not None:
+        file_name = f"{month.get('name')}-{month.get('start').year}-{cluster_id}-{part}-{report_type}"
+    return CSVSink(
+        f"{os.getcwd()}/{file_name}",
+        OCP_REPORT_TYPE_TO_COLS[report_type],
+        row_limit=options.get("row_limit"),
+    )
 
-            if count % ten_percent == 0:
-                LOG.info(f"Done with {count} of {num_gens} generators.")
 
-        local_path, output_file_name = _generate_azure_filename()
-        date_range = _generate_azure_date_range(month)
-
-        _write_csv(local_path, data, azure_columns)
-        monthly_files.append(local_path)
-
-        if azure_container_name:
-            file_path = ""
-            if azure_prefix_name:
-                file_path += azure_prefix_name + "/"
-            file_path += azure_report_name + "/"
-            file_path += date_range + "/"
-            file_path += output_file_name
-
-            # azure blob upload
-            storage_account_name = options.get("azure_account_name", None)
-            if storage_account_name:
-                azure_route_file(storage_account_name, azure_container_name, local_path, file_path)
-            # local dir upload
-            else:
-                azure_route_file(azure_container_name, file_path, local_path)
-        if not write_monthly:
-            _remove_files(monthly_files)
+def _ocp_write_reports(tasks, cluster_id, month, report_types, options, node_shard=None):
+    """Generate a month of OCP reports straight to disk and return the files written for each report type.
+
+    With node_shard, an (index, count) pair, only that shard of each generator's nodes is
+    generated, into files of its own.
+    """
+    shard = f"shard{node_shard[0]}" if node_shard else None
+    with ExitStack() as open_sinks:
+        sinks = {
+            report_type: open_sinks.enter_context(_ocp_report_sink(cluster_id, month, report_type, options, shard))
+            for report_type in report_types
+        }
+        for seed_keys, generator_cls, gen_start_date, gen_end_date, attributes in tasks:
+            seed_random(*seed_keys)
+            gen = generator_cls(
+                gen_start_date,
+                gen_end_date,
+                attributes,
+                options.get("ros_ocp_info"),
+                options.get("constant_values_ros_ocp"),
+                options.get("ros_only"),
+                ros_ocp_numpy=options.get("ros_ocp_numpy"),
+                node_shard=node_shard,
+            )
+            if not gen.nodes:
+                continue
+            LOG.info(f"Generating data for {', '.join(sinks)} for {month}")
+            _ocp_write_generator_rows(gen, sinks, options)
+    return {report_type: sink.files for report_type, sink in sinks.items()}
+
+
+def _ocp_write_generator_rows(gen, sinks, options):
+    """Write the rows of every report type with a sink, in a single pass if asked to."""
+    if options.get("single_pass"):
+        rows = gen.generate_fused_data(sinks)
+    else:
+        rows = ((report_type, row) for report_type in sinks for row in gen.generate_data(report_type))
+    for report_type, row in rows:
+        sinks[report_type].write(row)
 
 
 def write_ocp_file(file_number, cluster_id, month_name, year, report_type, data):
@@ -892,6 +1249,131 @@ def write_ocp_file(file_number, cluster_id, month_name, year, report_type, data)
     return full_file_name
 
 
+def _ocp_upload_payloads(  # noqa: C901
+    options, cluster_id, monthly_files, monthly_ros_files, gen_start_date, gen_end_date, report_datetime=None
+):
+    """Package OCP report files with a fresh manifest and route them to Ingress or Minio."""
+    insights_upload = options.get("insights_upload")
+    minio_upload = options.get("minio_upload")
+    # Generate manifest for all files
+    ocp_assembly_id = uuid4()
+    report_datetime = report_datetime or gen_start_date
+    # Payload names map to the monthly files, which are archived in place under those names.
+    payload_files = {}
+    payload_ros_files = {}
+    for num_file in range(len(monthly_files)):
+        temp_filename = f"{ocp_assembly_id}_openshift_report.{num_file}.csv"
+        payload_files[temp_filename] = monthly_files[num_file]
+
+    # Continue numbering from where regular files left off
+    total_file_count = len(monthly_files)
+    for num_file in range(len(monthly_ros_files)):
+        original_file = monthly_ros_files[num_file]
+        current_file_number = total_file_count + num_file
+
+        # Check if this is a namespace file (contains 'ocp_ros_namespace_usage')
+        if "ocp_ros_namespace_usage" in original_file:
+            basename = os.path.basename(original_file)
+            parts = basename.split("-")
+            if len(parts) >= 2:
+                month_name = parts[0]
+                year = parts[1]
+                try:
+                    month_num = datetime.strptime(month_name, "%B").month
+                    yearmonth_part = f"{year}{month_num:02d}"
+                except ValueError:
+                    logging.warning(
+                        f"Filename format issue: could not parse month '{month_name}' in '{basename}'. "
+                        f"Falling back to current month/year."
+                    )
+                    yearmonth_part = f"{year}{datetime.now().month:02d}"
+            else:
+                yearmonth_part = f"{datetime.now().year}{datetime.now().month:02d}"
+            temp_filename = f"{ocp_assembly_id}-ros-openshift-namespace-{yearmonth_part}.{current_file_number}.csv"
+        else:
+            temp_filename = f"{ocp_assembly_id}_openshift_report.{current_file_number}.csv"
+        payload_ros_files[temp_filename] = monthly_ros_files[num_file]
+
+    manifest_file_names = list(payload_files)
+    manifest_ros_data = list(payload_ros_files) if payload_ros_files else None
+    cr_status = {
+        "clusterID": "4e009161-4f40-42c8-877c-3e59f6baea3d",
+        "clusterVersion": "stable-4.6",
+        "api_url": "https://console.redhat.com",
+        "authentication": {"type": "token"},
+        "packaging": {"max_reports_to_store": 30, "max_size_MB": 100},
+        "upload": {
+            "ingress_path": "/api/ingress/v1/upload",
+            "upload": "True",
+            "upload_wait": 27,
+            "upload_cycle": options.get("upload_cycle") or OCP_UPLOAD_CYCLE,
+        },
+        "operator_commit": __version__,
+        "prometheus": {
+            "prometheus_configured": "True",
+            "prometheus_connected": "True",
+            "last_query_start_time": "2021-07-28T12:22:37Z",
+            "last_query_success_time": "2021-07-28T12:22:37Z",
+            "service_address": "https://thanos-querier.openshift-monitoring.svc:9091",
+        },
+        "reports": {
+            "report_month": "07",
+            "last_hour_queried": "2021-07-28 11:00:00 - 2021-07-28 11:59:59",
+            "data_collected": "True",
+        },
+        "source": {
+            "sources_path": "/api/sources/v1.0/",
+            "name": "INSERT-SOURCE-NAME",
+            "create_source": "False",
+            "check_cycle": 1440,
+        },
+    }
+    manifest_values = {
+        "cluster_id": str(cluster_id),
+        "uuid": str(ocp_assembly_id),
+        "date": report_datetime.isoformat(timespec="microseconds"),
+        "files": manifest_file_names,
+        "start": gen_start_date.isoformat(timespec="microseconds"),
+        "end": gen_end_date.isoformat(timespec="microseconds"),
+        "version": __version__,
+        "certified": False,
+        "cr_status": cr_status,
+    }
+    if manifest_ros_data:
+        manifest_values["resource_optimization_files"] = manifest_ros_data
+    if options.get("daily_reports"):
+        manifest_values["daily_reports"] = True
+
+    manifest_data = ocp_generate_manifest(manifest_values)
+    temp_manifest = _write_manifest(manifest_data)
+    compresslevel = _compression_level(options)
+
+    # Tarball and upload files individually for insights upload:
+    if insights_upload:
+        uploader = None
+        if not os.path.isdir(insights_upload):
+            uploader = IngressUploader(insights_upload, options.get("upload_workers") or INGRESS_UPLOAD_WORKERS)
+        with uploader or nullcontext():
+            for payload_name, report_file in {**payload_files, **payload_ros_files}.items():
+                files_to_zip = {payload_name: report_file, "manifest.json": temp_manifest}
+                temp_usage_zip = _tar_gzip_report_files(files_to_zip, compresslevel)
+                if uploader:
+                    uploader.upload(temp_usage_zip)
+                else:
+                    ocp_route_file(insights_upload, temp_usage_zip)
+                    os.remove(temp_usage_zip)
+    else:
+        files_to_zip = {**payload_files, **payload_ros_files, "manifest.json": temp_manifest}
+        temp_usage_zip = _tar_gzip_report_files(files_to_zip, compresslevel)
+        # Operator cycles share a month, so each cycle gets its own key instead of overwriting the last one.
+        key_date = gen_start_date.strftime("%Y%m%dT%H%M" if options.get("simulate_operator") else "%Y_%m")
+        payload_key = f"{options.get('payload_name') or ocp_assembly_id.hex}.{key_date}.tar.gz"
+        ocp_route_file_minio(minio_upload, temp_usage_zip, payload_key)
+        os.remove(temp_usage_zip)
+
+    os.remove(temp_manifest)
+
+
 def ocp_create_report(options):  # noqa: C901
     """Create a usage report file."""
     start_date = options.get("start_date")
@@ -901,6 +1383,22 @@ def ocp_create_report(options):  # noqa: C901
     ros_ocp_info = options.get("ros_ocp_info")
     constant_values_ros_ocp = options.get("constant_values_ros_ocp")
     ros_only = options.get("ros_only")
+    ros_ocp_numpy = options.get("ros_ocp_numpy")
+    workers = options.get("workers") or 1
+    seed = options.get("seed")
+    if workers > 1 and seed is None:
+        # every shard draws the same node list before splitting it, so shards always share a seed
+        seed = random.getrandbits(64)
+    generator_options = {
+        "ros_ocp_info": ros_ocp_info,
+        "constant_values_ros_ocp": constant_values_ros_ocp,
+        "ros_only": ros_only,
+        "ros_ocp_numpy": ros_ocp_numpy,
+        "single_pass": options.get("single_pass"),
+        "row_limit": options.get("row_limit"),
+    }
+    if ros_ocp_numpy and ros_numpy.numpy is None:
+        LOG.warning("NumPy is not installed. ROS for Openshift data will be generated without it.")
 
     if static_report_data:
         generators = _get_generators(static_report_data.get("generators"))
@@ -919,12 +1417,12 @@ def ocp_create_report(options):  # noqa: C901
         else:
             report_types = COST_OCP_REPORT_TYPE_TO_COLS
 
-        data = {rt: [] for rt in report_types}
-        file_numbers = {rt: 0 for rt in report_types}
+        month_key = month.get("start").strftime("%Y-%m")
 
         monthly_files = []
         monthly_ros_files = []
-        for generator in generators:
+        tasks = []
+        for index, generator in enumerate(generators):
             generator_cls = generator.get("generator")
             attributes = generator.get("attributes")
             gen_start_date = month.get("start")
@@ -938,165 +1436,135 @@ def ocp_create_report(options):  # noqa: C901
 
                 gen_start_date, gen_end_date = _create_generator_dates_from_yaml(attributes, month)
 
-            gen = generator_cls(
-                gen_start_date, gen_end_date, attributes, ros_ocp_info, constant_values_ros_ocp, ros_only
-            )
-            for report_type in gen.ocp_report_generation.keys():
-                LOG.info(f"Generating data for {report_type} for {month}")
-                for hour in gen.generate_data(report_type):
-                    data[report_type] += [hour]
-                    if len(data[report_type]) == options.get("row_limit"):
-                        file_numbers[report_type] += 1
-                        month_output_file = write_ocp_file(
-                            file_numbers[report_type],
-                            cluster_id,
-                            month.get("name"),
-                            gen_start_date.year,
-                            report_type,
-                            data[report_type],
-                        )
-                        monthly_files.append(month_output_file)
-                        data[report_type].clear()
-
-        for report_type in gen.ocp_report_generation.keys():
-            if file_numbers[report_type] != 0:
-                file_numbers[report_type] += 1
-
-            month_output_file = write_ocp_file(
-                file_numbers[report_type],
-                cluster_id,
-                month.get("name"),
-                gen_start_date.year,
-                report_type,
-                data[report_type],
-            )
-            if report_type in (OCP_ROS_USAGE, OCP_ROS_NAMESPACE_USAGE):
-                monthly_ros_files.append(month_output_file)
-            else:
-                monthly_files.append(month_output_file)
+            tasks.append(((seed, "ocp", index, month_key), generator_cls, gen_start_date, gen_end_date, attributes))
 
-        if insights_upload or minio_upload:
-            # Generate manifest for all files
-            ocp_assembly_id = uuid4()
-            report_datetime = gen_start_date
-            temp_files = {}
-            temp_ros_files = {}
-            for num_file in range(len(monthly_files)):
-                temp_filename = f"{ocp_assembly_id}_openshift_report.{num_file}.csv"
-                temp_files[temp_filename] = create_temporary_copy(monthly_files[num_file], temp_filename, "payload")
-
-            # Continue numbering from where regular files left off
-            total_file_count = len(monthly_files)
-            for num_file in range(len(monthly_ros_files)):
-                original_file = monthly_ros_files[num_file]
-                current_file_number = total_file_count + num_file
-
-                # Check if this is a namespace file (contains 'ocp_ros_namespace_usage')
-                if "ocp_ros_namespace_usage" in original_file:
-                    basename = os.path.basename(original_file)
-                    parts = basename.split("-")
-                    if len(parts) >= 2:
-                        month_name = parts[0]
-                        year = parts[1]
-                        try:
-                            month_num = datetime.strptime(month_name, "%B").month
-                            yearmonth_part = f"{year}{month_num:02d}"
-                        except ValueError:
-                            logging.warning(
-                                f"Filename format issue: could not parse month '{month_name}' in '{basename}'. "
-                                f"Falling back to current month/year."
-                            )
-                            yearmonth_part = f"{year}{datetime.now().month:02d}"
-                    else:
-                        yearmonth_part = f"{datetime.now().year}{datetime.now().month:02d}"
-                    temp_filename = (
-                        f"{ocp_assembly_id}-ros-openshift-namespace-{yearmonth_part}.{current_file_number}.csv"
+        if workers > 1:
+            LOG.info(f"Generating data for {month} in {workers} node shards")
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                shards = [
+                    executor.submit(
+                        _ocp_write_reports, tasks, cluster_id, month, report_types, generator_options, (shard, workers)
                     )
-                else:
-                    temp_filename = f"{ocp_assembly_id}_openshift_report.{current_file_number}.csv"
-                temp_ros_files[temp_filename] = create_temporary_copy(
-                    monthly_ros_files[num_file], temp_filename, "payload"
-                )
+                    for shard in range(workers)
+                ]
+                report_files = [shard.result() for shard in shards]
+        else:
+            report_files = [_ocp_write_reports(tasks, cluster_id, month, report_types, generator_options)]
 
-            manifest_file_names = list(temp_files)
-            manifest_ros_data = list(temp_ros_files) if temp_ros_files else None
-            cr_status = {
-                "clusterID": "4e009161-4f40-42c8-877c-3e59f6baea3d",
-                "clusterVersion": "stable-4.6",
-                "api_url": "https://console.redhat.com",
-                "authentication": {"type": "token"},
-                "packaging": {"max_reports_to_store": 30, "max_size_MB": 100},
-                "upload": {
-                    "ingress_path": "/api/ingress/v1/upload",
-                    "upload": "True",
-                    "upload_wait": 27,
-                    "upload_cycle": 360,
-                },
-                "operator_commit": __version__,
-                "prometheus": {
-                    "prometheus_configured": "True",
-                    "prometheus_connected": "True",
-                    "last_query_start_time": "2021-07-28T12:22:37Z",
-                    "last_query_success_time": "2021-07-28T12:22:37Z",
-                    "service_address": "https://thanos-querier.openshift-monitoring.svc:9091",
-                },
-                "reports": {
-                    "report_month": "07",
-                    "last_hour_queried": "2021-07-28 11:00:00 - 2021-07-28 11:59:59",
-                    "data_collected": "True",
-                },
-                "source": {
-                    "sources_path": "/api/sources/v1.0/",
-                    "name": "INSERT-SOURCE-NAME",
-                    "create_source": "False",
-                    "check_cycle": 1440,
-                },
-            }
-            manifest_values = {
-                "cluster_id": str(cluster_id),
-                "uuid": str(ocp_assembly_id),
-                "date": report_datetime.isoformat(timespec="microseconds"),
-                "files": manifest_file_names,
-                "start": gen_start_date.isoformat(timespec="microseconds"),
-                "end": gen_end_date.isoformat(timespec="microseconds"),
-                "version": __version__,
-                "certified": False,
-                "cr_status": cr_status,
-            }
-            if manifest_ros_data:
-                manifest_values["resource_optimization_files"] = manifest_ros_data
-            if options.get("daily_reports"):
-                manifest_values["daily_reports"] = True
-
-            manifest_data = ocp_generate_manifest(manifest_values)
-            temp_manifest = _write_manifest(manifest_data)
-            temp_manifest_name = create_temporary_copy(temp_manifest, "manifest.json", "payload")
-
-            # Tarball and upload files individually for insights upload:
-            if insights_upload:
-                report_files = list(temp_files.values()) + list(temp_ros_files.values())
-                for temp_usage_file in report_files:
-                    files_to_zip = [temp_usage_file, temp_manifest_name]
-                    temp_usage_zip = _tar_gzip_report_files(files_to_zip)
-                    ocp_route_file(insights_upload, temp_usage_zip)
-                    os.remove(temp_usage_zip)
-                os.remove(temp_manifest_name)
-            else:
-                report_files = list(temp_files.values()) + list(temp_ros_files.values()) + [temp_manifest_name]
-                temp_usage_zip = _tar_gzip_report_files(report_files)
-                payload_key = (
-                    f"{options.get('payload_name') or ocp_assembly_id.hex}.{gen_start_date.strftime('%Y_%m')}.tar.gz"
-                )
-                ocp_route_file_minio(minio_upload, temp_usage_zip, payload_key)
-                os.remove(temp_usage_zip)
+        for files_by_type in report_files:
+            for report_type, files in files_by_type.items():
+                if report_type in (OCP_ROS_USAGE, OCP_ROS_NAMESPACE_USAGE):
+                    monthly_ros_files.extend(files)
+                else:
+                    monthly_files.extend(files)
 
-            _remove_files(report_files)
-            os.remove(temp_manifest)
+        if insights_upload or minio_upload:
+            _ocp_upload_payloads(options, cluster_id, monthly_files, monthly_ros_files, gen_start_date, gen_end_date)
         if not write_monthly:
             LOG.info("Cleaning up local directory")
             _remove_files(monthly_files)
             _remove_files(monthly_ros_files)
 
+    LOG.debug(f"Timestamp cache: {TIMESTAMPS}")
+
+
+def ocp_simulate_operator(options):  # noqa: C901
+    """Upload OCP payloads one upload cycle at a time, the way the Cost Management Metrics Operator does.
+
+    Generators are built once and kept for the whole simulation. Each cycle only generates its
+    own hours, which are packaged with a fresh manifest and routed like any other payload, so a
+    cycle takes as long at the end of a long simulation as it did at the start.
+
+    Simulated time starts at the start date and runs simulation_speed times faster than wall-clock
+    time, or as fast as cycles can be generated when the speed is 0. The simulation stops after
+    simulation_cycles cycles, or runs until it is interrupted.
+    """
+    start_date = options.get("start_date")
+    cluster_id = options.get("ocp_cluster_id")
+    static_report_data = options.get("static_report_data")
+    ros_ocp_info = options.get("ros_ocp_info")
+    ros_only = options.get("ros_only")
+    upload_cycle = timedelta(minutes=options.get("upload_cycle") or OCP_UPLOAD_CYCLE)
+    speed = options.get("simulation_speed") or 0
+    cycles = options.get("simulation_cycles")
+    seed = options.get("seed")
+
+    if ros_only:
+        report_types = ROS_OCP_REPORT_TYPE_TO_COLS
+    elif ros_ocp_info:
+        report_types = OCP_REPORT_TYPE_TO_COLS
+    else:
+        report_types = COST_OCP_REPORT_TYPE_TO_COLS
+
+    if static_report_data:
+        generators = _get_generators(static_report_data.get("generators"))
+    else:
+        generators = [{"generator": OCPGenerator, "attributes": {}}]
+
+    gens = []
+    for index, generator in enumerate(generators):
+        seed_random(seed, "ocp", index)
+        gen = generator.get("generator")(
+            start_date,
+            start_date + upload_cycle,
+            generator.get("attributes"),
+            ros_ocp_info,
+            options.get("constant_values_ros_ocp"),
+            ros_only,
+            ros_ocp_numpy=options.get("ros_ocp_numpy"),
+        )
+        gens.append((gen, generator.get("attributes")))
+
+    cycle = 0
+    cycle_start = start_date
+    simulation_started = time.monotonic()
+    while cycles is None or cycle < cycles:
+        cycle_end = cycle_start + upload_cycle
+        if speed:
+            delay = (cycle_end - start_date).total_seconds() / speed - (time.monotonic() - simulation_started)
+            if delay > 0:
+                time.sleep(delay)
+
+        cycle_started = time.monotonic()
+        month = {"name": calendar.month_name[cycle_start.month], "start": cycle_start}
+        with ExitStack() as open_sinks:
+            sinks = {
+                report_type: open_sinks.enter_context(
+                    _ocp_report_sink(cluster_id, month, report_type, options, f"cycle{cycle}")
+                )
+                for report_type in report_types
+            }
+            for gen, attributes in gens:
+                gen_start_date, gen_end_date = cycle_start, cycle_end
+                if attributes:
+                    gen_start_date = max(gen_start_date, attributes.get("start_date"))
+                    gen_end_date = min(gen_end_date, attributes.get("end_date"))
+                    if gen_start_date >= gen_end_date:
+                        continue
+                gen.set_date_range(gen_start_date, gen_end_date)
+                _ocp_write_generator_rows(gen, sinks, options)
+
+        cycle_files = []
+        cycle_ros_files = []
+        for report_type, sink in sinks.items():
+            if report_type in (OCP_ROS_USAGE, OCP_ROS_NAMESPACE_USAGE):
+                cycle_ros_files.extend(sink.files)
+            else:
+                cycle_files.extend(sink.files)
+        _ocp_upload_payloads(
+            options, cluster_id, cycle_files, cycle_ros_files, cycle_start, cycle_end, report_datetime=cycle_end
+        )
+        if not options.get("write_monthly", False):
+            _remove_files(cycle_files)
+            _remove_files(cycle_ros_files)
+
+        LOG.info(
+            f"Uploaded operator cycle {cycle} ({cycle_start} - {cycle_end}) "
+            f"in {time.monotonic() - cycle_started:.2f} seconds"
+        )
+        cycle += 1
+        cycle_start = cycle_end
+
 
 def write_gcp_file(start_date, end_date, data, options):
     """Write GCP data to a file."""
@@ -1142,6 +1610,8 @@ def get_gcp_static_currency(generator):
 
 def gcp_create_report(options):  # noqa: C901
     """Create a GCP cost usage report file."""
+    seed = options.get("seed")
+    seed_random(seed, "gcp", "projects")
     fake = Faker()
     gcp_bucket_name = options.get("gcp_bucket_name")
     gcp_dataset_name = options.get("gcp_dataset_name")
@@ -1249,7 +1719,7 @@ def gcp_create_report(options):  # noqa: C901
             data = []
             gen_start_date = month.get("start")
             gen_end_date = month.get("end")
-            for project in projects:
+            for project_index, project in enumerate(projects):
                 num_gens = len(generators)
                 ten_percent = int(num_gens * 0.1) if num_gens > 50 else 5
                 LOG.info(
@@ -1272,6 +1742,7 @@ def gcp_create_report(options):  # noqa: C901
                     attributes["resource_level"] = resource_level
 
                     generator_cls = generator.get("generator")
+                    seed_random(seed, "gcp", project_index, count, month.get("start").strftime("%Y-%m"))
                     gen = generator_cls(gen_start_date, gen_end_date, currency, project, attributes=attributes)
                     for hour in gen.generate_data():
                         data += [hour]
@@ -1294,14 +1765,17 @@ def gcp_create_report(options):  # noqa: C901
     if not write_monthly:
         _remove_files(monthly_files)
 
+    LOG.debug(f"Timestamp cache: {TIMESTAMPS}")
+
 
 def _gcp_bigquery_process(
     start_date, end_date, currency, projects, generators, options, gcp_bucket_name, gcp_dataset_name, gcp_table_name
 ):
     resource_level = options.get("gcp_resource_level", False)
     gcp_daily_flow = options.get("gcp_daily_flow", False)
+    seed = options.get("seed")
     data = []
-    for project in projects:
+    for project_index, project in enumerate(projects):
         num_gens = len(generators)
         ten_percent = int(num_gens * 0.1) if num_gens > 50 else 5
         LOG.info(f"Producing data for {num_gens} generators for start: {start_date} and end: {end_date}.")
@@ -1313,6 +1787,7 @@ def _gcp_bigquery_process(
             attributes["resource_level"] = resource_level
 
             generator_cls = generator.get("generator")
+            seed_random(seed, "gcp", project_index, count)
             gen = generator_cls(start_date, end_date, currency, project, attributes=attributes)
             for hour in gen.generate_data():
                 data += [hour]
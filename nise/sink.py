@@ -0,0 +1,207 @@
+#
+# Copyright 2026 Red Hat, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+"""Streaming sinks that write report rows straight to disk."""
+
+import csv
+import gzip
+import io
+import os
+
+from nise.generators.row import RenderedRow
+from nise.generators.row import Row
+from nise.util import LOG
+
+
+class _CountingFile:
+    """File wrapper that tracks the number of bytes written through it."""
+
+    def __init__(self, file):
+        """Initialize the wrapper."""
+        self._file = file
+        self.bytes_written = 0
+
+    def write(self, data):
+        """Write data to the wrapped file and count its encoded size."""
+        self.bytes_written += len(data.encode())
+        return self._file.write(data)
+
+    def close(self):
+        """Close the wrapped file."""
+        self._file.close()
+
+
+def _open_gzip(file_name, compresslevel):
+    """Open a gzip file for writing text.
+
+    The header timestamp is fixed so that seeded reports compress to identical bytes.
+    """
+    return io.TextIOWrapper(gzip.GzipFile(file_name, "wb", compresslevel, mtime=0))
+
+
+class CSVSink:
+    """Write report rows to CSV files as they are generated.
+
+    Rows are written one at a time, so memory use is bounded by a single row
+    rather than by the whole report. Files are rotated once ``row_limit`` rows
+    or ``byte_limit`` bytes have been written. The first file is named
+    ``<base_path>.csv``; if the sink rotates, it is renamed to
+    ``<base_path>-1.csv`` and later files are numbered ``-2``, ``-3``, etc.
+
+    ``transform`` is an optional callable applied to each row before it is
+    written to the main files. ``variants`` maps a file name suffix to a
+    callable that transforms a row; each variant is written to its own set of
+    files that rotate in lockstep with the main files.
+
+    If ``compresslevel`` is given, files are gzip compressed as they are written
+    and named ``.csv.gz``. ``byte_limit`` still counts uncompressed bytes.
+
+    ``name_file`` is an optional callable returning the path, without extension,
+    of each new file. It replaces ``base_path`` and numbering: every file gets
+    the name it was opened with.
+
+    ``columns`` optionally names the row key each header column is read from,
+    in header order, for writing rows under a header whose column names differ
+    from their keys.
+
+    Rows may be dicts or compact ``Row`` objects. Either way they are laid out in
+    header order and written with a positional ``csv.writer``; a ``Row`` whose
+    schema matches the header is written without any per-column lookups. A
+    ``RenderedRow`` rendered for the same columns is written as its pre-rendered
+    line when there is no transform or variant to apply.
+    """
+
+    def __init__(
+        self,
+        base_path,
+        header,
+        row_limit=None,
+        byte_limit=None,
+        transform=None,
+        variants=None,
+        compresslevel=None,
+        name_file=None,
+        columns=None,
+    ):
+        """Initialize the sink and open the first file."""
+        self.base_path = base_path
+        self.name_file = name_file
+        self.header = tuple(header)
+        self.columns = tuple(columns) if columns else self.header
+        self.row_limit = row_limit
+        self.byte_limit = byte_limit
+        self.transform = transform
+        self.variants = variants or {}
+        self.compresslevel = compresslevel
+        self.extension = ".csv" if compresslevel is None else ".csv.gz"
+        self.file_number = 0
+        self.files = []
+        self.variant_files = {suffix: [] for suffix in self.variants}
+        self._handles = {}
+        self._rows = 0
+        self._projections = {}
+        self._open()
+
+    def _file_name(self, file_number, suffix=""):
+        """Return the file path for a file number and variant suffix."""
+        if file_number != 0 and not self.name_file:
+            return f"{self.base_path}-{file_number}{suffix}{self.extension}"
+        return f"{self.base_path}{suffix}{self.extension}"
+
+    def _open(self):
+        """Open a new set of output files and write their headers."""
+        if self.name_file:
+            self.base_path = self.name_file()
+        for suffix in ("", *self.variants):
+            file_name = self._file_name(self.file_number, suffix)
+            LOG.info(f"Writing to {file_name.split('/')[-1]}")
+            if self.compresslevel is None:
+                handle = _CountingFile(open(file_name, "w"))
+            else:
+                handle = _CountingFile(_open_gzip(file_name, self.compresslevel))
+            writer = csv.writer(handle)
+            writer.writerow(self.header)
+            self._handles[suffix] = (handle, writer)
+            if suffix:
+                self.variant_files[suffix].append(file_name)
+            else:
+                self.files.append(file_name)
+        self._rows = 0
+
+    def _close_handles(self):
+        """Close the currently open files."""
+        for handle, _ in self._handles.values():
+            handle.close()
+        self._handles = {}
+
+    def _is_full(self):
+        """Return whether the current file has reached a rotation limit."""
+        if self.row_limit and self._rows >= self.row_limit:
+            return True
+        if self.byte_limit:
+            handle, _ = self._handles[""]
+            return handle.bytes_written >= self.byte_limit
+        return False
+
+    def _rotate(self):
+        """Close the current files and open the next numbered ones."""
+        self._close_handles()
+        if self.file_number == 0 and not self.name_file:
+            # The first file was written without a number; renumber it now that there is more than one.
+            self.file_number = 1
+            for suffix, file_list in (("", self.files), *self.variant_files.items()):
+                numbered = self._file_name(self.file_number, suffix)
+                os.replace(file_list[0], numbered)
+                file_list[0] = numbered
+        self.file_number += 1
+        self._open()
+
+    def _values(self, row):
+        """Return the values of a row in header order, using "" for missing columns."""
+        if isinstance(row, Row):
+            try:
+                projection = self._projections[row.schema]
+            except KeyError:
+                projection = self._projections[row.schema] = row.schema.projection(self.columns)
+            return row.project(projection)
+        return [row.get(column, "") for column in self.columns]
+
+    def write(self, row):
+        """Write a single row, rotating to a new file first if needed."""
+        if self._rows and self._is_full():
+            self._rotate()
+        if isinstance(row, RenderedRow) and row.header == self.columns and not (self.transform or self.variants):
+            self._handles[""][0].write(row.line)
+            self._rows += 1
+            return
+        for suffix, (_, writer) in self._handles.items():
+            if suffix:
+                writer.writerow(self._values(self.variants[suffix](row)))
+            else:
+                writer.writerow(self._values(self.transform(row) if self.transform else row))
+        self._rows += 1
+
+    def close(self):
+        """Close any open files."""
+        self._close_handles()
+
+    def __enter__(self):
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *exc):
+        """Close the sink when leaving the context manager."""
+        self.close()
@@ -16,20 +16,47 @@
 #
 """Defines the upload mechanism to various clouds."""
 
+import importlib
 import os
 import sys
 import traceback
 
-import boto3
-from azure.core.exceptions import ServiceRequestError
-from azure.core.exceptions import ServiceResponseError
-from azure.storage.blob import BlobServiceClient
-from botocore.exceptions import ClientError
-from google.cloud import bigquery
-from google.cloud import storage
-from google.cloud.exceptions import GoogleCloudError
+import requests
 from nise.util import LOG
 from requests.exceptions import ConnectionError as BotoConnectionError
+from urllib3.util.retry import Retry
+
+# The cloud SDKs are slow to import, so they are only loaded when an upload to that cloud runs.
+_SDK_IMPORTS = {
+    "boto3": ("boto3", None),
+    "ClientError": ("botocore.exceptions", "ClientError"),
+    "BlobServiceClient": ("azure.storage.blob", "BlobServiceClient"),
+    "ServiceRequestError": ("azure.core.exceptions", "ServiceRequestError"),
+    "ServiceResponseError": ("azure.core.exceptions", "ServiceResponseError"),
+    "RequestsTransport": ("azure.core.pipeline.transport", "RequestsTransport"),
+    "bigquery": ("google.cloud.bigquery", None),
+    "storage": ("google.cloud.storage", None),
+    "GoogleCloudError": ("google.cloud.exceptions", "GoogleCloudError"),
+}
+
+
+def __getattr__(name):
+    """Import a cloud SDK name on first access and keep it as a module attribute."""
+    try:
+        module_name, attribute = _SDK_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = importlib.import_module(module_name)
+    if attribute:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def _sdk(*names):
+    """Return the cloud SDK names, importing any that have not been loaded yet."""
+    values = tuple(globals()[name] if name in globals() else __getattr__(name) for name in names)
+    return values if len(values) > 1 else values[0]
 
 
 def upload_to_s3(bucket_name, bucket_file_path, local_path):
@@ -43,6 +70,7 @@ def upload_to_s3(bucket_name, bucket_file_path, local_path):
         (Boolean): True if file was uploaded
 
     """
+    boto3, ClientError = _sdk("boto3", "ClientError")
     uploaded = True
     try:
         s3_client = boto3.resource("s3")
@@ -55,24 +83,57 @@ def upload_to_s3(bucket_name, bucket_file_path, local_path):
     return uploaded
 
 
-def upload_to_azure_container(storage_file_name, local_path, storage_file_path):
+def azure_blob_service_client(connect_str, max_block_size=None, pool_size=None):
+    """Return a blob service client for a storage account connection string.
+
+    Args:
+        connect_str (String): The storage account connection string
+        max_block_size (Integer): Files larger than this many bytes are uploaded in blocks of this size
+        pool_size (Integer): The number of connections the client keeps open to the storage account
+
+    Returns:
+        (BlobServiceClient): The client
+    """
+    BlobServiceClient = _sdk("BlobServiceClient")
+    kwargs = {}
+    if max_block_size:
+        kwargs.update(max_block_size=max_block_size, max_single_put_size=max_block_size)
+    if pool_size:
+        session = requests.Session()
+        # the client retries requests itself
+        adapter = requests.adapters.HTTPAdapter(
+            pool_maxsize=pool_size, max_retries=Retry(total=False, redirect=False, raise_on_status=False)
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        kwargs["transport"] = _sdk("RequestsTransport")(session=session)
+    return BlobServiceClient.from_connection_string(connect_str, **kwargs)
+
+
+def upload_to_azure_container(
+    storage_file_name, local_path, storage_file_path, blob_service_client=None, max_concurrency=1
+):
     """Upload data to a storage account.
 
     Args:
         storage_file_name (String): The container to upload file to
         local_path  (String): The full local file system path of the file
         storage_file_path (String): The file path to upload to within container
+        blob_service_client (BlobServiceClient): A client to reuse, instead of one for this upload
+        max_concurrency (Integer): The number of blocks of the file uploaded at the same time
 
     Returns:
         (Boolean): True if file was uploaded
     """
+    ServiceRequestError, ServiceResponseError = _sdk("ServiceRequestError", "ServiceResponseError")
     try:
-        # Retrieve the connection string for use with the application.
-        connect_str = os.getenv("AZURE_STORAGE_CONNECTION_STRING")
-        blob_service_client = BlobServiceClient.from_connection_string(connect_str)
+        if blob_service_client is None:
+            # Retrieve the connection string for use with the application.
+            connect_str = os.getenv("AZURE_STORAGE_CONNECTION_STRING")
+            blob_service_client = azure_blob_service_client(connect_str)
         blob_client = blob_service_client.get_blob_client(container=storage_file_name, blob=storage_file_path)
         with open(local_path, "rb") as data:
-            blob_client.upload_blob(data=data)
+            blob_client.upload_blob(data=data, max_concurrency=max_concurrency)
         LOG.info(f"uploaded {storage_file_name} to {storage_file_path}")
     except (OSError, ServiceRequestError, ServiceResponseError) as error:
         LOG.error(error)
@@ -103,6 +164,7 @@ def upload_to_gcp_storage(bucket_name, source_file_name, destination_blob_name):
             "GCP Storage."
         )
         return False
+    storage, GoogleCloudError = _sdk("storage", "GoogleCloudError")
     try:
         storage_client = storage.Client()
 
@@ -143,6 +205,7 @@ def gcp_bucket_to_dataset(
             "Please set your GOOGLE_APPLICATION_CREDENTIALS environment variable before attempting to create a dataset."
         )
         return False
+    bigquery, storage, GoogleCloudError = _sdk("bigquery", "storage", "GoogleCloudError")
     try:
         bigquery_client = bigquery.Client()
 
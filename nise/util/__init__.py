@@ -20,9 +20,13 @@ from collections import abc
 
 import yaml
 
+from .compress import ParallelGzipWriter  # noqa: F401
 from .log import LOG  # noqa: F401
 from .log import LOG_FORMAT  # noqa: F401
 from .log import LOG_VERBOSITY  # noqa: F401
+from .seed import derive_seed  # noqa: F401
+from .seed import random_uuid4  # noqa: F401
+from .seed import seed_random  # noqa: F401
 
 
 def load_yaml(objekt):
@@ -0,0 +1,82 @@
+#
+# Copyright 2026 Red Hat, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+"""Parallel gzip compression."""
+
+import gzip
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+BLOCK_SIZE = 1024 * 1024
+
+
+class ParallelGzipWriter:
+    """Write a gzip file, compressing blocks of it on a pool of threads.
+
+    Data is split into ``block_size`` blocks that are compressed concurrently and written,
+    in order, as consecutive gzip members. Concatenated members are a valid gzip file that
+    gzip, tarfile and other standard readers decompress as a single stream. zlib releases
+    the GIL while compressing, so the threads make use of several cores.
+    """
+
+    def __init__(self, file_name, compresslevel=9, workers=None, block_size=BLOCK_SIZE):
+        """Initialize the writer and open the output file."""
+        self.compresslevel = compresslevel
+        self.block_size = block_size
+        self.workers = workers or os.cpu_count() or 1
+        self._file = open(file_name, "wb")
+        self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        self._pending = deque()
+        self._buffer = bytearray()
+        self._members = 0
+
+    def _submit(self, block):
+        """Queue a block for compression, writing finished members to keep the queue bounded."""
+        self._pending.append(self._executor.submit(gzip.compress, block, self.compresslevel, mtime=0))
+        self._members += 1
+        while len(self._pending) > 2 * self.workers:
+            self._file.write(self._pending.popleft().result())
+
+    def write(self, data):
+        """Buffer data and queue every full block for compression."""
+        self._buffer += data
+        while len(self._buffer) >= self.block_size:
+            self._submit(bytes(self._buffer[: self.block_size]))
+            del self._buffer[: self.block_size]
+        return len(data)
+
+    def close(self):
+        """Compress any buffered data, write the remaining members and close the file."""
+        if self._file.closed:
+            return
+        try:
+            if self._buffer or not self._members:
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+            while self._pending:
+                self._file.write(self._pending.popleft().result())
+        finally:
+            self._executor.shutdown()
+            self._file.close()
+
+    def __enter__(self):
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *exc):
+        """Close the writer when leaving the context manager."""
+        self.close()
@@ -0,0 +1,55 @@
+#
+# Copyright 2026 Red Hat, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+"""Reproducible random streams."""
+
+import hashlib
+import random
+import uuid
+
+from faker import Faker
+
+
+def derive_seed(seed, *keys):
+    """Derive a 64-bit seed from a base seed and a tuple of keys.
+
+    Params:
+        seed (int): The base seed passed with --seed.
+        keys: Values identifying the unit of generation, e.g. provider, generator index and month.
+    """
+    digest = hashlib.sha256(repr((seed, *keys)).encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def seed_random(seed, *keys):
+    """Start an independent random stream for a unit of generation.
+
+    Both the ``random`` module and Faker are reseeded from ``derive_seed(seed, *keys)``.
+    Generators seed their own streams from the ``random`` module when they are built (see
+    AbstractGenerator.random), so a generator built right after this draws the same values
+    regardless of what was generated before it, what runs alongside it, or which process runs
+    it. Nothing happens when ``seed`` is None.
+    """
+    if seed is None:
+        return
+    derived = derive_seed(seed, *keys)
+    random.seed(derived)
+    Faker.seed(derived)
+
+
+def random_uuid4(rng=random):
+    """Return a version 4 UUID drawn from rng, the ``random`` module by default, so it follows --seed."""
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
@@ -16,7 +16,9 @@
 #
 from datetime import datetime
 from datetime import timedelta
+from functools import partial
 from unittest import TestCase
+from unittest.mock import patch
 
 from faker import Faker
 from nise.generators.aws import AWSGenerator
@@ -28,6 +30,9 @@ from nise.generators.aws import RDSGenerator
 from nise.generators.aws import Route53Generator
 from nise.generators.aws import S3Generator
 from nise.generators.aws import VPCGenerator
+from nise.generators.generator import AbstractGenerator
+from nise.generators.row import Row
+from nise.util import seed_random
 
 
 class TestGenerator(AWSGenerator):
@@ -38,6 +43,27 @@ class TestGenerator(AWSGenerator):
         return []
 
 
+def init_data_row_per_row(generator, start, end, **kwargs):
+    """Build a row the way AWSGenerator._init_data_row did before row templates."""
+    bill_begin = start.replace(microsecond=0, second=0, minute=0, hour=0, day=1)
+    bill_end = AbstractGenerator.next_month(bill_begin)
+    col_map = {
+        "identity/LineItemId": generator.fake.sha1(raw_output=False),
+        "identity/TimeInterval": AWSGenerator.time_interval(start, end),
+        "bill/BillingEntity": "AWS",
+        "bill/BillType": "Anniversary",
+        "bill/PayerAccountId": generator.payer_account,
+        "bill/BillingPeriodStartDate": AWSGenerator.timestamp(bill_begin),
+        "bill/BillingPeriodEndDate": AWSGenerator.timestamp(bill_end),
+    }
+    row = {}
+    for column in generator.AWS_COLUMNS:
+        row[column] = ""
+        if col_map.get(column):
+            row[column] = col_map.get(column)
+    return row
+
+
 class AbstractGeneratorTestCase(TestCase):
     """
     TestCase class for Abstract Generator
@@ -112,6 +138,78 @@ class AbstractGeneratorTestCase(TestCase):
         for col in generator.AWS_COLUMNS:
             self.assertIsNotNone(a_row.get(col))
 
+    def test_init_data_row_compact(self):
+        """Test the init data row method with compact rows."""
+        two_hours_ago = (self.now - self.one_hour) - self.one_hour
+        generator = TestGenerator(two_hours_ago, self.now, self.currency, self.payer_account, self.usage_accounts)
+        generator.compact_rows = True
+        a_row = generator._init_data_row(two_hours_ago, self.now)
+        self.assertIsInstance(a_row, Row)
+        self.assertEqual(a_row["bill/PayerAccountId"], self.payer_account)
+        for col in generator.AWS_COLUMNS:
+            self.assertIsNotNone(a_row.get(col))
+
+    def test_init_data_row_matches_per_row_rows(self):
+        """Test that rows built from row templates are the rows that were built column by column."""
+        start = datetime(2026, 8, 31, 22)
+        generators = (
+            DataTransferGenerator,
+            EBSGenerator,
+            EC2Generator,
+            MarketplaceGenerator,
+            RDSGenerator,
+            Route53Generator,
+            S3Generator,
+            VPCGenerator,
+        )
+        for index, generator_cls in enumerate(generators):
+            with self.subTest(generator=generator_cls.__name__):
+                seed_random(11, "aws", index)
+                generator = generator_cls(
+                    start, start + timedelta(hours=4), "USD", self.payer_account, self.usage_accounts
+                )
+                seed_random(11, "aws", index)
+                per_row = generator_cls(
+                    start, start + timedelta(hours=4), "USD", self.payer_account, self.usage_accounts
+                )
+                with patch.object(per_row, "_init_data_row", partial(init_data_row_per_row, per_row)):
+                    expected = list(per_row.generate_data())
+                rows = list(generator.generate_data())
+                self.assertEqual(
+                    {row["bill/BillingPeriodStartDate"] for row in rows},
+                    {"2026-08-01T00:00:00Z", "2026-09-01T00:00:00Z"},
+                )
+                self.assertEqual(rows, expected)
+
+    def test_init_data_row_template_cache(self):
+        """Test that a row template is compiled once for each billing period, kind of row and set of columns."""
+        start = datetime(2026, 8, 31, 22)
+        generator = TestGenerator(
+            start, start + timedelta(hours=4), self.currency, self.payer_account, self.usage_accounts
+        )
+        with patch.object(
+            generator, "_compile_row_template", wraps=generator._compile_row_template
+        ) as compile_template:
+            rows = [generator._init_data_row(hour["start"], hour["end"]) for hour in generator.hours]
+            self.assertEqual(compile_template.call_count, 2)
+            self.assertEqual([call.args[0].month for call in compile_template.call_args_list], [8, 9])
+            self.assertNotEqual(rows[0]["identity/LineItemId"], rows[1]["identity/LineItemId"])
+
+            rows[0]["bill/BillType"] = "changed"
+            self.assertEqual(generator._init_data_row(start, start + self.one_hour)["bill/BillType"], "Anniversary")
+            self.assertEqual(compile_template.call_count, 2)
+
+            generator.compact_rows = True
+            self.assertIsInstance(generator._init_data_row(start, start + self.one_hour), Row)
+            self.assertEqual(compile_template.call_count, 3)
+
+            key = "resourceTags/user:template-key"
+            TestGenerator(
+                start, start + self.one_hour, self.currency, self.payer_account, self.usage_accounts, tag_cols={key}
+            )
+            self.assertIn(key, generator._init_data_row(start, start + self.one_hour))
+            self.assertEqual(compile_template.call_count, 4)
+
     def test_init_data_row_start_none(self):
         """Test the init data row method none start date."""
         two_hours_ago = (self.now - self.one_hour) - self.one_hour
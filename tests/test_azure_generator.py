@@ -30,6 +30,7 @@ from nise.generators.azure import StorageGenerator
 from nise.generators.azure import VMGenerator
 from nise.generators.azure import VNGenerator
 from nise.report import _generate_azure_account_info
+from nise.util import seed_random
 
 # from nise.generators.generator import AbstractGenerator
 
@@ -186,6 +187,37 @@ class AbstractGeneratorTestCase(TestCase):
         add_info = generator._get_additional_info()
         self.assertIn("VCPU", add_info)
 
+    def test_serialize(self):
+        """Test that a field is serialized once while it keeps the same value."""
+        two_hours_ago = (self.now - self.one_hour) - self.one_hour
+        generator = TestGenerator(two_hours_ago, self.now, self.currency, self.account_info)
+        tags = {"environment": "prod"}
+        serialized = generator._serialize("Tags", tags)
+        self.assertEqual(serialized, json.dumps(tags))
+        self.assertIs(generator._serialize("Tags", tags), serialized)
+        self.assertEqual(generator._serialize("Tags", {"environment": "dev"}), '{"environment": "dev"}')
+        self.assertEqual(generator._serialize("MeterId", 12, str), "12")
+
+    def test_own_random_streams(self):
+        """Test that a generator seeded at build time draws the same rows however it is interleaved."""
+        start = datetime(2026, 9, 1)
+        end = start + timedelta(days=3)
+
+        def build():
+            seed_random(5, "azure", 0)
+            return VMGenerator(start, end, self.currency, self.account_info)
+
+        serial = list(build().generate_data())
+        generator = build()
+        seed_random(5, "azure", 1)
+        other = SQLGenerator(start, end, self.currency, self.account_info)
+        other_rows = other.generate_data()
+        interleaved = []
+        for row in generator.generate_data():
+            interleaved.append(row)
+            next(other_rows, None)
+        self.assertEqual(interleaved, serial)
+
 
 class AzureGeneratorTestCase(TestCase):
     """Test Base for specific generator classes."""
@@ -264,6 +296,22 @@ class TestBandwidthGenerator(AzureGeneratorTestCase):
             self.assertIn(row["ConsumedService"], CONSUMED_SERVICE)
 
 
+class TestGenerateData(AzureGeneratorTestCase):
+    """Tests for generating Azure rows."""
+
+    def test_generate_data_is_lazy(self):
+        """Test that rows are generated one day at a time rather than as a list."""
+        start = self.now.replace(hour=0)
+        generator = StorageGenerator(
+            start, start + timedelta(days=3), self.currency, self.account_info, self.attributes
+        )
+        rows = generator.generate_data()
+        self.assertNotIsInstance(rows, list)
+        first = next(rows)
+        self.assertEqual(first["Date"], start.strftime("%Y-%m-%d"))
+        self.assertEqual(len([first, *rows]), 3)
+
+
 class TestStorageGenerator(AzureGeneratorTestCase):
     """Tests for the Storage Generator type."""
 
@@ -0,0 +1,69 @@
+#
+# Copyright 2026 Red Hat, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+import gzip
+import os
+import shutil
+import tarfile
+from tempfile import mkdtemp
+from unittest import TestCase
+
+from nise.util import ParallelGzipWriter
+
+
+class ParallelGzipWriterTestCase(TestCase):
+    """Test cases for the parallel gzip writer."""
+
+    def setUp(self):
+        """Create a scratch directory."""
+        self.directory = mkdtemp()
+        self.file_name = os.path.join(self.directory, "out.gz")
+
+    def tearDown(self):
+        """Remove the scratch directory."""
+        shutil.rmtree(self.directory)
+
+    def test_round_trip(self):
+        """Test that data split over many blocks decompresses as one stream."""
+        data = os.urandom(1000) * 50 + b"tail"
+        with ParallelGzipWriter(self.file_name, compresslevel=1, workers=3, block_size=4096) as f_out:
+            for start in range(0, len(data), 777):
+                f_out.write(data[start : start + 777])
+
+        with gzip.open(self.file_name) as f_in:
+            self.assertEqual(f_in.read(), data)
+
+    def test_empty_file(self):
+        """Test that writing nothing still produces a valid gzip file."""
+        with ParallelGzipWriter(self.file_name):
+            pass
+        with gzip.open(self.file_name) as f_in:
+            self.assertEqual(f_in.read(), b"")
+
+    def test_tarfile(self):
+        """Test that a streamed tar archive can be read back with tarfile."""
+        source = os.path.join(self.directory, "report.csv")
+        with open(source, "w") as f:
+            f.write("a,b\n1,2\n" * 10000)
+        with (
+            ParallelGzipWriter(self.file_name, block_size=1024) as f_out,
+            tarfile.open(fileobj=f_out, mode="w|") as tar,
+        ):
+            tar.add(source, arcname="renamed.csv")
+
+        with tarfile.open(self.file_name) as tar:
+            self.assertEqual(tar.getnames(), ["renamed.csv"])
+            self.assertEqual(tar.extractfile("renamed.csv").read().decode(), "a,b\n1,2\n" * 10000)
@@ -91,6 +91,17 @@ class CommandLineTestCase(TestCase):
         with self.assertRaises(SystemExit):
             self.parser.parse_args(["report", "ocp", "--start-date", "foo"])
 
+    def test_file_byte_limit_providers(self):
+        """Test that only the providers whose report files rotate by size accept a file byte limit."""
+        for provider in ("aws", "aws-marketplace", "azure"):
+            with self.subTest(provider=provider):
+                options = vars(self.parser.parse_args(["report", provider, "--file-byte-limit", "4096"]))
+                self.assertEqual(options["byte_limit"], 4096)
+        for provider in ("gcp", "ocp"):
+            with self.subTest(provider=provider):
+                with self.assertRaises(SystemExit):
+                    self.parser.parse_args(["report", provider, "--file-byte-limit", "4096"])
+
     def test_invalid_currency(self):
         """
         Test where user passes an invalid currency.
@@ -364,6 +375,48 @@ class CommandLineTestCase(TestCase):
             options = vars(self.parser.parse_args(args))
             _validate_provider_inputs(self.parser, options)
 
+    def test_ocp_simulate_operator_without_upload(self):
+        """
+        Test that the operator simulation needs somewhere to upload its payloads.
+        """
+        args = ["report", "ocp", "--start-date", str(date.today()), "--ocp-cluster-id", "123", "--simulate-operator"]
+        options = vars(self.parser.parse_args(args))
+        self.assertEqual((options["upload_cycle"], options["simulation_speed"]), (360, 0))
+        with self.assertRaises(SystemExit):
+            _validate_provider_inputs(self.parser, options)
+
+    def test_ocp_simulation_arguments(self):
+        """
+        Test that the upload cycle and simulation cycles must be positive and the speed not negative.
+        """
+        args = ["report", "ocp", "--start-date", str(date.today()), "--ocp-cluster-id", "123"]
+        for extra_args in (
+            ["--upload-cycle", "0"],
+            ["--upload-cycle", "-60"],
+            ["--upload-cycle", "ten"],
+            ["--simulation-cycles", "0"],
+        ):
+            with self.subTest(extra_args=extra_args):
+                with patch("sys.stderr"), self.assertRaises(SystemExit):
+                    self.parser.parse_args(args + extra_args)
+        options = vars(self.parser.parse_args(args + ["--upload-cycle", "15", "--simulation-cycles", "2"]))
+        self.assertEqual((options["upload_cycle"], options["simulation_cycles"]), (15, 2))
+        options = vars(self.parser.parse_args(args + ["--simulation-speed", "-1"]))
+        with self.assertRaises(SystemExit):
+            _validate_provider_inputs(self.parser, options)
+
+    def test_ocp_ros_ocp_numpy(self):
+        """
+        Test that --ros-ocp-numpy is only accepted when NumPy is installed.
+        """
+        args = ["report", "ocp", "--start-date", str(date.today()), "--ocp-cluster-id", "123", "--ros-ocp-numpy"]
+        options = vars(self.parser.parse_args(args))
+        with patch("nise.__main__.find_spec", return_value=object()):
+            self.assertEqual(_validate_provider_inputs(self.parser, options), (True, "ocp"))
+        with patch("nise.__main__.find_spec", return_value=None):
+            with self.assertRaises(SystemExit):
+                _validate_provider_inputs(self.parser, options)
+
     def test_ocp_no_cluster_id(self):
         """
         Test where user passes ocp without cluster id combination.
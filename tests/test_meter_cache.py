@@ -0,0 +1,120 @@
+#
+# Copyright 2026 Red Hat, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+import json
+import os
+import stat
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from nise.generators.azure import DTGenerator
+from nise.generators.azure import VMGenerator
+from nise.meter_cache import load_meter_cache
+from nise.meter_cache import METER_CACHE_VERSION
+from nise.meter_cache import meter_key
+from nise.meter_cache import save_meter_cache
+
+METER = ("Standard", "Virtual Machines", "D2 v3", "Hours")
+
+
+def meters(*names):
+    """Return cached meters for the meter keys in names."""
+    return {name: (f"{name}-id", f"{name}-id", METER) for name in names}
+
+
+class MeterCacheTestCase(TestCase):
+    """Tests for the on-disk Azure meter cache."""
+
+    def setUp(self):
+        """Create a directory for the cache file."""
+        self.directory = TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "meters.json")
+
+    def tearDown(self):
+        """Remove the cache directory."""
+        self.directory.cleanup()
+
+    def test_meter_key(self):
+        """Test that meter keys identify a generator by position, class and meter attributes."""
+        self.assertEqual(meter_key(0, VMGenerator, {}), "0:VMGenerator::")
+        self.assertEqual(
+            meter_key(3, DTGenerator, {"meter_id": "meter-1", "data_direction": "in"}), "3:DTGenerator:meter-1:in"
+        )
+
+    def test_missing_file(self):
+        """Test that a missing cache file loads as an empty cache."""
+        self.assertEqual(load_meter_cache(self.path, "sub-1"), {})
+
+    def test_round_trip(self):
+        """Test that saved meters load back as tuples for the same subscription only."""
+        cached = {"a": ("meter-1", "meter-1", METER), "b": ("meter-2", "meter-2_in", "Data Transfer In")}
+        save_meter_cache(self.path, "sub-1", cached)
+        self.assertEqual(load_meter_cache(self.path, "sub-1"), cached)
+        self.assertEqual(load_meter_cache(self.path, "sub-2"), {})
+        self.assertEqual(os.listdir(self.directory.name), ["meters.json"])
+
+    def test_file_mode(self):
+        """Test that a new cache file gets the umask mode and a replaced one keeps its mode."""
+        umask = os.umask(0o022)
+        try:
+            save_meter_cache(self.path, "sub-1", meters("a"))
+        finally:
+            os.umask(umask)
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o644)
+
+        os.chmod(self.path, 0o640)
+        save_meter_cache(self.path, "sub-1", meters("b"))
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o640)
+
+    def test_keeps_other_subscriptions(self):
+        """Test that saving one subscription keeps the meters of the others."""
+        save_meter_cache(self.path, "sub-1", meters("a"))
+        save_meter_cache(self.path, "sub-2", meters("b"))
+        save_meter_cache(self.path, "sub-1", meters("c"))
+        self.assertEqual(load_meter_cache(self.path, "sub-1"), meters("c"))
+        self.assertEqual(load_meter_cache(self.path, "sub-2"), meters("b"))
+
+    def test_ignores_unusable_files(self):
+        """Test that corrupt files and files of another version are ignored and then replaced."""
+        for content in ("{not json", json.dumps({"version": METER_CACHE_VERSION - 1, "subscriptions": {}})):
+            with self.subTest(content=content):
+                with open(self.path, "w") as cache_file:
+                    cache_file.write(content)
+                with self.assertLogs("nise", level="WARNING"):
+                    self.assertEqual(load_meter_cache(self.path, "sub-1"), {})
+                save_meter_cache(self.path, "sub-1", meters("a"))
+                self.assertEqual(load_meter_cache(self.path, "sub-1"), meters("a"))
+
+    @patch("nise.meter_cache.MAX_SUBSCRIPTIONS", 2)
+    @patch("nise.meter_cache.MAX_METERS", 2)
+    def test_limits(self):
+        """Test that only the most recently used meters and saved subscriptions are kept."""
+        save_meter_cache(self.path, "sub-1", meters("a"))
+        save_meter_cache(self.path, "sub-2", meters("a", "b", "c"))
+        save_meter_cache(self.path, "sub-3", meters("a"))
+        self.assertEqual(load_meter_cache(self.path, "sub-1"), {})
+        self.assertEqual(load_meter_cache(self.path, "sub-2"), meters("b", "c"))
+        self.assertEqual(load_meter_cache(self.path, "sub-3"), meters("a"))
+
+    def test_failed_write_keeps_file(self):
+        """Test that a failed save leaves the previous cache and no temporary file behind."""
+        save_meter_cache(self.path, "sub-1", meters("a"))
+        with patch("nise.meter_cache.json.dump", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                save_meter_cache(self.path, "sub-1", meters("b"))
+        self.assertEqual(load_meter_cache(self.path, "sub-1"), meters("a"))
+        self.assertEqual(os.listdir(self.directory.name), ["meters.json"])
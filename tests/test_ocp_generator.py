@@ -16,10 +16,14 @@
 #
 """OCP Generator Unit Tests."""
 
+import csv
+import io
 import random
 from copy import copy
+from copy import deepcopy
 from datetime import datetime
 from datetime import timedelta
+from datetime import UTC
 from unittest import TestCase
 from uuid import NAMESPACE_DNS
 from uuid import uuid5
@@ -28,6 +32,7 @@ from unittest.mock import patch
 
 from faker import Faker
 
+from nise.generators.ocp.ocp_generator import DailyUsage
 from nise.generators.ocp.ocp_generator import GIGABYTE
 from nise.generators.ocp.ocp_generator import GPU_MODELS
 from nise.generators.ocp.ocp_generator import GPU_VENDOR
@@ -48,6 +53,7 @@ from nise.generators.ocp.ocp_generator import OCP_REPORT_TYPE_TO_COLS
 from nise.generators.ocp.ocp_generator import COST_OCP_REPORT_TYPE_TO_COLS
 from nise.generators.ocp.ocp_generator import ROS_OCP_REPORT_TYPE_TO_COLS
 from nise.generators.ocp.ocp_generator import OCPGenerator
+from nise.util import seed_random
 
 MAX_VOL_GIGS = 100
 
@@ -204,6 +210,21 @@ class OCPGeneratorTestCase(TestCase):
                                     self.assertIsNotNone(row[col])
                         break  # only test one row
 
+    def test_gen_hourly_label_usage_rendered(self):
+        """Test that label rows carry the CSV line of their values."""
+        generator = OCPGenerator(self.two_hours_ago, self.now, self.attributes)
+        for report_type in (OCP_NODE_LABEL, OCP_NAMESPACE_LABEL):
+            columns = OCP_REPORT_TYPE_TO_COLS[report_type]
+            rows = list(generator.generate_data(report_type))
+            self.assertTrue(rows)
+            for row in rows:
+                with self.subTest(report_type=report_type, row=row):
+                    self.assertEqual(list(row), list(columns))
+                    self.assertEqual(row.header, columns)
+                    buffer = io.StringIO()
+                    csv.writer(buffer).writerow(row.values())
+                    self.assertEqual(row.line, buffer.getvalue())
+
     def test_gen_hourly_pods_usage(self):
         """Test that gen_hourly_pods_usage generates rows."""
         generator = OCPGenerator(self.two_hours_ago, self.now, self.attributes)
@@ -221,6 +242,21 @@ class OCPGeneratorTestCase(TestCase):
                                     self.assertIsNotNone(row[col])
                         break  # only test one row
 
+    def test_gen_hourly_pods_and_vms_leave_templates_unchanged(self):
+        """Test that hourly pod and vm rows are built without changing the generator's pods and vms."""
+        generator = OCPGenerator(self.two_hours_ago, self.now, self.attributes)
+        pods = {name: dict(pod) for name, pod in generator.pods.items()}
+        vms = {name: dict(vm) for name, vm in generator.vms.items()}
+        pod_rows = list(generator._gen_hourly_pods_usage(report_type=OCP_POD_USAGE))
+        vm_rows = list(generator._gen_hourly_vm_usage(report_type=OCP_VM_USAGE))
+
+        self.assertEqual(generator.pods, pods)
+        self.assertEqual(generator.vms, vms)
+        self.assertEqual(len(pod_rows), len(pods) * len(generator.hours))
+        for row in pod_rows + vm_rows:
+            for key in ("cpu_limit", "cpu_usage", "mem_usage_gig", "pod_seconds", "vm_seconds", "vc_capacity"):
+                self.assertNotIn(key, row)
+
     def test_gen_hourly_storage_usage(self):
         """Test that gen_hourly_storage_usage generates rows."""
         generator = OCPGenerator(self.two_hours_ago, self.now, self.attributes)
@@ -563,6 +599,50 @@ class OCPGeneratorTestCase(TestCase):
         output = OCPGenerator._get_usage_for_date(test_usage, datetime.strptime(start_date, "%m-%d-%Y"))
         self.assertEqual(output, test_usage.get(start_date))
 
+    def test_get_usage_for_date_indexed(self):
+        """Test that an indexed usage map matches dates and falls back to the full period."""
+        usage = DailyUsage({"01-21-2022": 1, "2022-01-22": 2, "01-21-2022 12:00": 3, "full_period": 4, "01-23-2022": 5})
+        self.assertEqual(
+            usage, {"01-21-2022": 1, "2022-01-22": 2, "01-21-2022 12:00": 3, "full_period": 4, "01-23-2022": 5}
+        )
+        for day, expected in [(21, 1), (22, 2), (23, 4), (24, 4)]:
+            with self.subTest(day=day):
+                start = datetime(2022, 1, day, 5, tzinfo=UTC)
+                self.assertEqual(OCPGenerator._get_usage_for_date(usage, start), expected)
+                self.assertEqual(OCPGenerator._get_usage_for_date(dict(usage), start), expected)
+        self.assertIsNone(OCPGenerator._get_usage_for_date(DailyUsage({"01-21-2022": 1}), datetime(2022, 1, 22)))
+        self.assertIsNone(OCPGenerator._get_usage_for_date({}, datetime(2022, 1, 22)))
+
+    def test_set_date_range(self):
+        """Test that moving the generator to a new date range keeps its resources."""
+        generator = OCPGenerator(self.two_hours_ago, self.now, self.attributes)
+        nodes, pods = generator.nodes, generator.pods
+        later = self.now + timedelta(hours=3)
+        generator.set_date_range(self.now, later)
+        self.assertIs(generator.nodes, nodes)
+        self.assertIs(generator.pods, pods)
+        self.assertEqual([hour["start"] for hour in generator.hours], [self.now + timedelta(hours=i) for i in range(3)])
+        with self.assertRaises(ValueError):
+            generator.set_date_range(later, self.now)
+
+    def test_get_specific_pvc_from_pod_indexed(self):
+        """Test that PVC lookups see volumes added later and that the first volume listing a claim wins."""
+        generator = OCPGenerator(self.two_hours_ago, self.now, {})
+        first, second = {"capacity": 1}, {"capacity": 2}
+        generator.volumes = [{"vol_a": {"volume_claims": {"pvc_a": first}}}]
+        generator._map_pod_to_pvc("pod_a", "pvc_a")
+        self.assertEqual(generator.get_specific_pvc_from_pod("pod_a"), ("pvc_a", first))
+        self.assertEqual(generator.get_specific_pvc_from_pod("pod_b"), ("", {}))
+
+        generator.volumes.append({"vol_b": {"volume_claims": {"pvc_a": second, "pvc_b": second}}})
+        generator._map_pod_to_pvc("pod_b", "pvc_b")
+        self.assertEqual(generator.get_specific_pvc_from_pod("pod_a"), ("pvc_a", first))
+        self.assertEqual(generator.get_specific_pvc_from_pod("pod_b"), ("pvc_b", second))
+
+        generator._map_pod_to_pvc("pod_b", "pvc_a")
+        self.assertEqual(generator._mapped_pvcs["pvc_a"], 2)
+        self.assertEqual(generator._mapped_pvcs["pvc_b"], 0)
+
     def test_init_data_row(self):
         """Test that init_data_row initializes a row of data."""
         generator = OCPGenerator(self.two_hours_ago, self.now, self.attributes)
@@ -631,14 +711,29 @@ class OCPGeneratorTestCase(TestCase):
             "pod_limit_memory_byte_seconds",
         }
 
+        pod = copy(pods[0])
+        pod_seconds = kwargs["pod_seconds"]
+        expected = {
+            "pod_request_cpu_core_seconds": pod_seconds * min(pod["cpu_request"], pod["cpu_limit"]),
+            "pod_limit_cpu_core_seconds": pod_seconds * pod["cpu_limit"],
+            "pod_request_memory_byte_seconds": pod_seconds
+            * min(pod["mem_request_gig"], pod["mem_limit_gig"])
+            * GIGABYTE,
+            "pod_limit_memory_byte_seconds": pod_seconds * pod["mem_limit_gig"] * GIGABYTE,
+        }
+
         generator = OCPGenerator(self.two_hours_ago, self.now, {})
         in_row = generator._init_data_row(self.two_hours_ago, self.now, report_type=OCP_POD_USAGE)
         out_row = generator._update_pod_data(copy(in_row), self.two_hours_ago, self.now, **kwargs)
 
+        # the pod is used as a template for every hour, so it must not be changed
+        self.assertEqual(pods[0], pod)
         for key in changed:
             with self.subTest(key=key):
-                self.assertEqual(out_row.get(key), pods[0].get(key))
+                self.assertIsNotNone(out_row.get(key))
                 self.assertNotEqual(out_row.get(key), in_row.get(key))
+                if key in expected:
+                    self.assertEqual(out_row.get(key), expected[key])
 
         for key in list(set(out_row.keys()) - changed):
             with self.subTest(key=key):
@@ -772,8 +867,8 @@ class OCPGeneratorTestCase(TestCase):
         generator = OCPGenerator(self.two_hours_ago, self.now, {})
 
         with (
-            patch("nise.generators.ocp.ocp_generator.FAKER") as mock_faker,
-            patch("nise.generators.ocp.ocp_generator.randint") as mock_randint,
+            patch.object(generator, "fake") as mock_faker,
+            patch.object(generator.random, "randint") as mock_randint,
         ):
             mock_faker.word.return_value = "test-pvc"
             mock_randint.return_value = 40
@@ -798,8 +893,8 @@ class OCPGeneratorTestCase(TestCase):
         }
 
         with (
-            patch("nise.generators.ocp.ocp_generator.FAKER") as mock_faker,
-            patch("nise.generators.ocp.ocp_generator.randint") as mock_randint,
+            patch.object(generator, "fake") as mock_faker,
+            patch.object(generator.random, "randint") as mock_randint,
         ):
             mock_faker.word.return_value = "test-pvc"
             mock_randint.return_value = 35
@@ -868,8 +963,8 @@ class OCPGeneratorTestCase(TestCase):
 
         with (
             patch.object(generator, "get_specific_pvc_from_pod", return_value=("", {})),
-            patch("nise.generators.ocp.ocp_generator.FAKER") as mock_faker,
-            patch("nise.generators.ocp.ocp_generator.randint") as mock_randint,
+            patch.object(generator, "fake") as mock_faker,
+            patch.object(generator.random, "randint") as mock_randint,
         ):
             mock_faker.word.return_value = "fallback-pvc"
             mock_randint.return_value = 45
@@ -964,8 +1059,8 @@ class OCPGeneratorTestCase(TestCase):
         }
 
         with (
-            patch("nise.generators.ocp.ocp_generator.FAKER") as mock_faker,
-            patch("nise.generators.ocp.ocp_generator.randint") as mock_randint,
+            patch.object(generator, "fake") as mock_faker,
+            patch.object(generator.random, "randint") as mock_randint,
         ):
             mock_faker.word.return_value = "empty-pvc"
             mock_randint.return_value = 42
@@ -985,8 +1080,8 @@ class OCPGeneratorTestCase(TestCase):
         generator = OCPGenerator(self.two_hours_ago, self.now, {})
 
         with (
-            patch("nise.generators.ocp.ocp_generator.FAKER") as mock_faker,
-            patch("nise.generators.ocp.ocp_generator.randint") as mock_randint,
+            patch.object(generator, "fake") as mock_faker,
+            patch.object(generator.random, "randint") as mock_randint,
         ):
             mock_faker.word.return_value = "test-pvc"
             mock_randint.return_value = 35
@@ -1215,6 +1310,121 @@ class OCPGeneratorTestCase(TestCase):
         self.assertEqual(result, {})
         self.assertEqual(len(result), 0)
 
+    def test_gen_quarter_hourly_ros_ocp_namespace_usage_aggregates_once(self):
+        """Test that namespace aggregates are computed once and rebuilt when ros_data is replaced."""
+        generator = OCPGenerator(self.two_hours_ago, self.now, {}, ros_ocp_info=True)
+        generator.ros_data = {
+            "pod1": {"namespace": "ns1", "cpu_request_container_sum": 1.0, "cpu_usage_container_avg": 0.5},
+            "pod2": {"namespace": "ns2", "cpu_request_container_sum": 2.0, "cpu_usage_container_avg": 1.0},
+            "pod3": {"namespace": "ns1", "cpu_request_container_sum": 3.0, "cpu_usage_container_avg": 1.5},
+        }
+        kwargs = {"report_type": OCP_ROS_NAMESPACE_USAGE}
+        with patch.object(
+            generator, "_compute_namespace_data", wraps=generator._compute_namespace_data
+        ) as mock_compute:
+            results = list(generator._gen_quarter_hourly_ros_ocp_namespace_usage(**kwargs))
+            self.assertEqual(mock_compute.call_count, 2)
+
+        self.assertEqual(len(results), 16)
+        self.assertEqual([row["namespace"] for row in results[:2]], ["ns1", "ns2"])
+        ns1 = results[0]
+        self.assertEqual(ns1["cpu_request_namespace_sum"], 4.0)
+        self.assertEqual(ns1["cpu_usage_namespace_avg"], 1.0)
+        self.assertEqual(ns1["namespace_total_pods_max"], 2)
+
+        generator.ros_data = {"pod4": {"namespace": "ns3", "cpu_request_container_sum": 5.0}}
+        results = list(generator._gen_quarter_hourly_ros_ocp_namespace_usage(**kwargs))
+        self.assertEqual({row["namespace"] for row in results}, {"ns3"})
+        self.assertEqual(results[0]["cpu_request_namespace_sum"], 5.0)
+
+    def test_init_node_shard(self):
+        """Test that node shards split the nodes between them."""
+        shard_nodes = []
+        for shard in range(2):
+            generator = OCPGenerator(self.two_hours_ago, self.now, self.attributes, node_shard=(shard, 2))
+            shard_nodes.append([node.get("name") for node in generator.nodes])
+            self.assertEqual({pod.get("node") for pod in generator.pods.values()}, set(shard_nodes[-1]))
+        generator = OCPGenerator(self.two_hours_ago, self.now, self.attributes)
+        self.assertEqual(sorted(shard_nodes[0] + shard_nodes[1]), sorted(node.get("name") for node in generator.nodes))
+
+    def test_node_shards_match_serial_rows(self):
+        """Test that the rows of node shards, put together, are the rows of the whole cluster."""
+        other_node = deepcopy(self.attributes["nodes"][0])
+        other_node["node_name"] += "_other"
+        other_node["namespaces"] = {f"{name}_other": namespace for name, namespace in other_node["namespaces"].items()}
+        for namespace in other_node["namespaces"].values():
+            for pod in namespace.get("pods") or []:
+                pod["pod_name"] += "_other"
+            for vm in namespace.get("virtual_machines") or []:
+                vm["vm_name"] += "_other"
+        two_nodes = {"nodes": self.attributes["nodes"] + [other_node]}
+        for attributes in (two_nodes, None):
+            seed_random(3, "ocp", 0)
+            serial = OCPGenerator(self.two_hours_ago, self.now, deepcopy(attributes), ros_ocp_info=True)
+            expected = {
+                report_type: list(serial.generate_data(report_type)) for report_type in serial.ocp_report_generation
+            }
+            sharded = {report_type: [] for report_type in expected}
+            for shard in range(2):
+                seed_random(3, "ocp", 0)
+                generator = OCPGenerator(
+                    self.two_hours_ago, self.now, deepcopy(attributes), ros_ocp_info=True, node_shard=(shard, 2)
+                )
+                for report_type in sharded:
+                    sharded[report_type].extend(generator.generate_data(report_type))
+
+            self.assertGreater(len(serial.nodes), 1)
+            for report_type, rows in expected.items():
+                with self.subTest(attributes=bool(attributes), report_type=report_type):
+                    self.assertEqual(sorted(sharded[report_type], key=repr), sorted(rows, key=repr))
+
+    def test_hour_slots(self):
+        """Test that hour slots are walked lazily and hold every quarter hour in the hour it starts in."""
+        start = datetime(2026, 9, 1, tzinfo=UTC)
+        generator = OCPGenerator(start, start + timedelta(hours=2, minutes=30), self.attributes)
+        hours = [(hour["start"], hour["end"]) for hour in generator.hours]
+        quarter_hours = [(quarter["start"], quarter["end"]) for quarter in generator.quarter_hours]
+
+        slots = generator._hour_slots(quarter_hours=True)
+        self.assertIs(iter(slots), slots)
+        slots = list(slots)
+        self.assertEqual([slot.hours[0][:2] for slot in slots], hours)
+        self.assertEqual([quarter[:2] for slot in slots for quarter in slot.quarter_hours], quarter_hours)
+        for index, slot in enumerate(slots):
+            hour_start = slot.hours[0][0]
+            next_start = slots[index + 1].hours[0][0] if index + 1 < len(slots) else None
+            for quarter_start, quarter_end, interval in slot.quarter_hours:
+                self.assertLessEqual(hour_start, quarter_start)
+                self.assertTrue(next_start is None or quarter_start < next_start)
+                self.assertEqual(interval, generator._add_common_usage_info({}, quarter_start, quarter_end))
+
+        self.assertFalse([slot for slot in generator._hour_slots() if slot.quarter_hours])
+
+    def test_generate_fused_data(self):
+        """Test that fused generation emits the rows of generate_data for every report type hour by hour."""
+        for attributes in (self.attributes, None):
+            generators = []
+            for _ in range(2):
+                seed_random(7, "ocp", 0)
+                generators.append(OCPGenerator(self.two_hours_ago, self.now, attributes, ros_ocp_info=True))
+            fused = list(generators[0].generate_fused_data())
+            expected = {
+                report_type: list(generators[1].generate_data(report_type))
+                for report_type in generators[1].ocp_report_generation
+            }
+
+            for report_type, rows in expected.items():
+                with self.subTest(attributes=bool(attributes), report_type=report_type):
+                    self.assertEqual([row for fused_type, row in fused if fused_type == report_type], rows)
+
+            self.assertEqual(len(fused), sum(len(rows) for rows in expected.values()))
+            self.assertIn(OCP_ROS_USAGE, {report_type for report_type, _ in fused})
+
+            hour_starts = [OCPGenerator.timestamp(hour.get("start")) for hour in generators[0].hours]
+            hours = [sum(start <= row["interval_start"] for start in hour_starts) for _, row in fused]
+            self.assertEqual(hours, sorted(hours))
+            self.assertEqual(set(hours), {1, 2})
+
     def test_gpu_usage_in_report_type_to_cols(self):
         """Test that GPU usage is in the report type mapping."""
         self.assertIn(OCP_GPU_USAGE, OCP_REPORT_TYPE_TO_COLS)
@@ -16,23 +16,36 @@
 #
 import base64
 import calendar
+import copy
 import csv
 import datetime
+import gzip
 import json
 import os
 import re
 import shutil
+import socket
+import tarfile
+import threading
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
 from tempfile import mkdtemp
 from tempfile import NamedTemporaryFile
 from tempfile import TemporaryDirectory
 from unittest import TestCase
 from unittest.mock import ANY
+from unittest.mock import Mock
 from unittest.mock import patch
+from urllib.parse import parse_qs
+from urllib.parse import unquote
+from urllib.parse import urlparse
 
 import faker
 from dateutil.relativedelta import relativedelta
 
 from nise.__main__ import fix_dates
+from nise.generators.azure import AZURE_COLUMNS_V2_RESOURCE_GROUP
+from nise.generators.azure import AZURE_COLUMNS_V2_SUBSCRIPTION
 from nise.generators.ocp import (
     OCP_ROS_USAGE,
     OCP_ROS_NAMESPACE_USAGE,
@@ -45,6 +58,7 @@ from nise.generators.ocp import (
 )
 from nise.generators.ocp.ocp_generator import COST_OCP_REPORT_TYPE_TO_COLS
 from nise.generators.ocp.ocp_generator import OCP_REPORT_TYPE_TO_COLS
+from nise.generators.ocp.ocp_generator import OCPGenerator
 from nise.report import _convert_bytes
 from nise.report import _create_generator_dates_from_yaml
 from nise.report import _create_month_list
@@ -57,18 +71,94 @@ from nise.report import _write_jsonl
 from nise.report import _write_manifest
 from nise.report import aws_create_marketplace_report
 from nise.report import aws_create_report
+from nise.report import AzureBlobUploader
 from nise.report import azure_create_report
 from nise.report import default_currency
+from nise.report import IngressUploader
 from nise.report import gcp_create_report
 from nise.report import gcp_route_file
 from nise.report import ocp_create_report
 from nise.report import ocp_route_file
+from nise.report import ocp_simulate_operator
+from nise.report import OAuthToken
 from nise.report import post_payload_to_ingest_service
 from nise.report import write_gcp_file
 
 fake = faker.Faker()
 
 
+INGRESS_ENVIRONMENT = ("INSIGHTS_ACCOUNT_ID", "INSIGHTS_ORG_ID", "INSIGHTS_USER", "INSIGHTS_PASSWORD")
+
+
+class IngressStubHandler(BaseHTTPRequestHandler):
+    """A local stand-in for the SSO token endpoint and the Ingress upload endpoint."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        """Record the request and answer like the real service would."""
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        with self.server.lock:
+            self.server.received.append((self.path, self.client_address, self.headers.get("Authorization"), body))
+        if self.path == "/token":
+            status, payload = 200, json.dumps({"access_token": "stub-token", "expires_in": 300}).encode()
+        else:
+            status, payload = 202, b"accepted"
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        """Keep the test output quiet."""
+
+
+class BlobStubHandler(BaseHTTPRequestHandler):
+    """A local stand-in for the Azure Blob Storage block blob upload operations."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_PUT(self):
+        """Store a blob, stage a block or commit a block list."""
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        path = unquote(url.path)
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        with self.server.lock:
+            self.server.received.append((path, query.get("comp", [None])[0], self.client_address))
+            if query.get("comp") == ["block"]:
+                self.server.blocks[(path, query["blockid"][0])] = body
+            elif query.get("comp") == ["blocklist"]:
+                block_ids = re.findall(r"<Latest>([^<]*)</Latest>", body.decode())
+                self.server.blobs[path] = b"".join(self.server.blocks.pop((path, b)) for b in block_ids)
+            else:
+                self.server.blobs[path] = body
+        self.send_response(201)
+        self.send_header("ETag", '"0x1"')
+        self.send_header("Last-Modified", "Sat, 17 Oct 2026 00:00:00 GMT")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        """Keep the test output quiet."""
+
+
+def start_blob_stub(testcase):
+    """Start a local blob stub for a test and return it with a connection string for its storage account."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), BlobStubHandler)
+    server.lock = threading.Lock()
+    server.received, server.blocks, server.blobs = [], {}, {}
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    testcase.addCleanup(server.server_close)
+    testcase.addCleanup(server.shutdown)
+    connect_str = (
+        "DefaultEndpointsProtocol=http;AccountName=devstoreaccount1;"
+        f"AccountKey={base64.b64encode(b'stub-key').decode()};"
+        f"BlobEndpoint=http://127.0.0.1:{server.server_port}/devstoreaccount1;"
+    )
+    return server, connect_str
+
+
 class MiscReportTestCase(TestCase):
     """
     TestCase class for report functions
@@ -549,6 +639,80 @@ class MiscReportTestCase(TestCase):
         updated_currency = default_currency(currency, static_currency)
         self.assertEqual(updated_currency, "USD")
 
+    def test_ingress_uploader(self):
+        """Test that payloads share a session and an OAuth token when uploaded to a local Ingress stub."""
+        server = ThreadingHTTPServer(("127.0.0.1", 0), IngressStubHandler)
+        server.lock = threading.Lock()
+        server.received = []
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_port}"
+        payloads = {}
+        for count in range(6):
+            with NamedTemporaryFile(suffix=".tar.gz", delete=False) as payload:
+                payload.write(f"payload-{count}".encode())
+            payloads[payload.name] = f"payload-{count}".encode()
+
+        environment = {
+            "HCC_SERVICE_ACCOUNT_ID": "id",
+            "HCC_SERVICE_ACCOUNT_SECRET": "secret",
+            "HCC_TOKEN_URL": f"{url}/token",
+        }
+        with patch.dict(os.environ, environment):
+            for key in INGRESS_ENVIRONMENT:
+                os.environ.pop(key, None)
+            with IngressUploader(f"{url}/upload", max_workers=2) as uploader:
+                for payload in payloads:
+                    uploader.upload(payload)
+        server.shutdown()
+        server.server_close()
+
+        paths = [path for path, *_ in server.received]
+        self.assertEqual(paths.count("/token"), 1)
+        self.assertEqual(paths.count("/upload"), len(payloads))
+        uploads = [
+            (client, authorization, body) for path, client, authorization, body in server.received if path == "/upload"
+        ]
+        self.assertTrue(all(authorization == "Bearer stub-token" for _, authorization, _ in uploads))
+        for content in payloads.values():
+            self.assertEqual(sum(content in body for *_, body in uploads), 1)
+        # the pooled connections are kept alive and shared by the upload threads
+        self.assertLessEqual(len({client for client, *_ in uploads}), 2)
+        self.assertFalse(any(os.path.exists(payload) for payload in payloads))
+
+    @patch("nise.report.time.sleep")
+    def test_ingress_uploader_raises_upload_errors(self, mock_sleep):
+        """Test that uploads are retried and that the last error is raised once all uploads are done."""
+        import requests
+
+        with socket.socket() as closed:
+            closed.bind(("127.0.0.1", 0))
+            port = closed.getsockname()[1]
+        with NamedTemporaryFile(delete=False) as payload:
+            payload.write(b"payload")
+
+        with patch.dict(os.environ, {"INSIGHTS_USER": "user", "INSIGHTS_PASSWORD": "password"}):
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                with IngressUploader(f"http://127.0.0.1:{port}/upload", max_workers=1) as uploader:
+                    uploader.upload(payload.name)
+        self.assertEqual(mock_sleep.call_count, 3)
+        self.assertFalse(os.path.exists(payload.name))
+
+    @patch("nise.report.time.monotonic")
+    def test_oauth_token_expiry(self, mock_monotonic):
+        """Test that a cached OAuth token is fetched again shortly before it expires."""
+        http = Mock()
+        http.post.return_value.json.side_effect = [
+            {"access_token": "first", "expires_in": 100},
+            {"access_token": "second"},
+            {"access_token": "third"},
+        ]
+        token = OAuthToken()
+        tokens = []
+        for now in (0, 69, 70, 70):
+            mock_monotonic.return_value = now
+            tokens.append(token.get(http, "url", "data", {}))
+        self.assertEqual(tokens, ["first", "first", "second", "third"])
+
     def test_defaulting_to_static_currency(self):
         """Test that if no currency is provide in options it defaults to static."""
         currency = None
@@ -625,6 +789,45 @@ class AWSReportTestCase(TestCase):
         os.remove(expected_month_output_file)
         shutil.rmtree(local_bucket_path)
 
+    def test_aws_create_report_gzip_output(self):
+        """Test the aws report creation writes and routes .csv.gz files directly."""
+        now = datetime.datetime.now().replace(microsecond=0, second=0, minute=0, hour=0)
+        yesterday = now - datetime.timedelta(days=1)
+        local_bucket_path = mkdtemp()
+        options = {
+            "start_date": yesterday,
+            "end_date": now,
+            "aws_bucket_name": local_bucket_path,
+            "aws_report_name": "cur_report",
+            "gzip_output": True,
+            "compression_level": 1,
+            "write_monthly": True,
+        }
+        fix_dates(options, "aws")
+        with patch("nise.report._gzip_report") as mock_gzip:
+            aws_create_report(options)
+        mock_gzip.assert_not_called()
+
+        month_output_file_name = "{}-{}-{}".format(calendar.month_name[now.month], now.year, "cur_report")
+        expected_month_output_file = f"{os.getcwd()}/{month_output_file_name}.csv.gz"
+        self.assertFalse(os.path.isfile(f"{os.getcwd()}/{month_output_file_name}.csv"))
+        with gzip.open(expected_month_output_file, "rt") as f:
+            self.assertIn("identity/LineItemId", next(csv.reader(f)))
+
+        routed = [name for _, _, files in os.walk(local_bucket_path) for name in files]
+        self.assertIn(f"{month_output_file_name}.csv.gz", routed)
+        self.assertNotIn(f"{month_output_file_name}.csv.gz.gz", routed)
+        manifests = [
+            os.path.join(path, name)
+            for path, _, files in os.walk(local_bucket_path)
+            for name in files
+            if name.endswith("Manifest.json")
+        ]
+        with open(manifests[0]) as f:
+            self.assertTrue(all(key.endswith(".csv.gz") for key in json.load(f)["reportKeys"]))
+        os.remove(expected_month_output_file)
+        shutil.rmtree(local_bucket_path)
+
     def test_aws_create_report_with_local_dir_report_prefix(self):
         """Test the aws report creation method with local directory and a report prefix."""
         now = datetime.datetime.now().replace(microsecond=0, second=0, minute=0, hour=0)
@@ -914,6 +1117,102 @@ class AWSReportTestCase(TestCase):
                     os.remove(fname)
         shutil.rmtree(local_bucket_path)
 
+    def test_aws_create_report_file_byte_limit(self):
+        """Test the aws report creation rotates files by size."""
+        now = datetime.datetime.now().replace(microsecond=0, second=0, minute=0, hour=0)
+        yesterday = now - datetime.timedelta(days=1)
+        static_aws_data = {
+            "generators": [{"S3Generator": {"start_date": str(yesterday), "end_date": str(now)}}],
+            "accounts": {"payer": 9999999999999, "user": [9999999999999]},
+        }
+        options = {
+            "start_date": yesterday,
+            "end_date": now,
+            "aws_report_name": "cur_report",
+            "static_report_data": static_aws_data,
+            "byte_limit": 4096,
+            "write_monthly": True,
+        }
+        fix_dates(options, "aws")
+        aws_create_report(options)
+
+        month_output_file_name = f"{calendar.month_name[yesterday.month]}-{yesterday.year}-cur_report"
+        month_files = sorted(f for f in os.listdir(".") if f.startswith(month_output_file_name))
+        self.assertGreater(len(month_files), 1)
+        self.assertIn(f"{month_output_file_name}-1.csv", month_files)
+        for fname in month_files:
+            with open(fname) as f:
+                self.assertIn("identity/LineItemId", next(csv.reader(f)))
+        for _, _, files in os.walk("."):
+            for fname in files:
+                if fname.startswith(month_output_file_name):
+                    os.remove(fname)
+
+    def test_aws_create_report_with_workers(self):
+        """Test that seeded generation gives identical files serially, repeated and with worker processes."""
+        now = datetime.datetime.now().replace(microsecond=0, second=0, minute=0, hour=0)
+        yesterday = now - datetime.timedelta(days=1)
+        static_aws_data = {
+            "generators": [
+                {"EBSGenerator": {"start_date": str(yesterday), "end_date": str(now)}},
+                {"S3Generator": {"start_date": str(yesterday), "end_date": str(now)}},
+            ],
+            "accounts": {"payer": 9999999999999, "user": [9999999999999]},
+        }
+        month_output_file_name = f"{calendar.month_name[yesterday.month]}-{yesterday.year}-cur_report"
+        contents = []
+        for workers in (1, 1, 2):
+            options = {
+                "start_date": yesterday,
+                "end_date": now,
+                "aws_report_name": "cur_report",
+                "static_report_data": copy.deepcopy(static_aws_data),
+                "workers": workers,
+                "seed": 42,
+                "write_monthly": True,
+            }
+            fix_dates(options, "aws")
+            aws_create_report(options)
+            with open(f"{month_output_file_name}.csv") as f:
+                contents.append(f.read())
+            for fname in os.listdir("."):
+                if fname.startswith(month_output_file_name):
+                    os.remove(fname)
+
+        self.assertIn("AmazonEC2", contents[0])
+        self.assertIn("AmazonS3", contents[0])
+        self.assertEqual(contents[0], contents[1])
+        self.assertEqual(contents[0], contents[2])
+
+    def test_aws_create_report_with_workers_unseeded(self):
+        """Test that worker processes without a seed do not repeat each other's line items and resources."""
+        start = datetime.datetime(2026, 9, 1)
+        static_aws_data = {
+            "generators": [{"EC2Generator": {"start_date": "2026-09-01", "end_date": "2026-09-02"}} for _ in range(4)],
+            "accounts": {"payer": 9999999999999, "user": [9999999999999]},
+        }
+        options = {
+            "start_date": start,
+            "end_date": start + datetime.timedelta(days=1),
+            "aws_report_name": "cur_report",
+            "static_report_data": static_aws_data,
+            "workers": 2,
+            "write_monthly": True,
+        }
+        fix_dates(options, "aws")
+        aws_create_report(options)
+        month_files = [fname for fname in os.listdir(".") if fname.startswith("September-2026-cur_report")]
+        rows = []
+        for fname in month_files:
+            with open(fname) as f:
+                rows.extend(csv.DictReader(f))
+            os.remove(fname)
+
+        line_item_ids = [row["identity/LineItemId"] for row in rows]
+        self.assertGreater(len(line_item_ids), 4)
+        self.assertEqual(len(set(line_item_ids)), len(line_item_ids))
+        self.assertEqual(len({row["lineItem/ResourceId"] for row in rows}), 4)
+
 
 class AWSMarketplaceReportTestCase(TestCase):
     """
@@ -936,6 +1235,27 @@ class AWSMarketplaceReportTestCase(TestCase):
         self.assertTrue(os.path.isfile(expected_month_output_file))
         os.remove(expected_month_output_file)
 
+    def test_aws_marketplace_create_report_file_byte_limit(self):
+        """Test the aws-marketplace report creation rotates files by size."""
+        start = datetime.datetime(2026, 9, 1)
+        options = {
+            "start_date": start,
+            "end_date": start + datetime.timedelta(days=3),
+            "aws_report_name": "cur_report",
+            "byte_limit": 2048,
+            "write_monthly": True,
+        }
+        fix_dates(options, "aws")
+        aws_create_marketplace_report(options)
+
+        month_files = sorted(f for f in os.listdir(".") if f.startswith("September-2026-cur_report-marketplace"))
+        self.assertIn("September-2026-cur_report-marketplace-1.csv", month_files)
+        self.assertIn("September-2026-cur_report-marketplace-2.csv", month_files)
+        for fname in month_files:
+            with open(fname) as f:
+                self.assertIn("identity/LineItemId", next(csv.reader(f)))
+            os.remove(fname)
+
     @patch("nise.report.upload_to_s3")
     def test_aws_marketplace_create_report_with_s3(self, mock_upload_to_s3):
         """Test the aws-marketplace report creation method with s3."""
@@ -1070,6 +1390,38 @@ class OCPReportTestCase(TestCase):
             self.assertTrue(os.path.isfile(expected_month_output_file))
             os.remove(expected_month_output_file)
 
+    def test_ocp_create_report_single_pass(self):
+        """Test that a single pass writes every report type like the per report type passes."""
+        start = datetime.datetime(2026, 9, 1)
+        cluster_id = "11112222"
+        outputs = {}
+        for single_pass in (False, True):
+            options = {
+                "start_date": start,
+                "end_date": start + datetime.timedelta(days=1),
+                "ocp_cluster_id": cluster_id,
+                "write_monthly": True,
+                "ros_ocp_info": True,
+                "single_pass": single_pass,
+                "seed": 7,
+            }
+            fix_dates(options, "ocp")
+            ocp_create_report(options)
+            outputs[single_pass] = {}
+            for report_type in OCP_REPORT_TYPE_TO_COLS.keys():
+                month_output_file = f"{os.getcwd()}/September-2026-{cluster_id}-{report_type}.csv"
+                self.assertTrue(os.path.isfile(month_output_file))
+                with open(month_output_file) as month_file:
+                    outputs[single_pass][report_type] = list(csv.reader(month_file))
+                os.remove(month_output_file)
+
+        for report_type, columns in OCP_REPORT_TYPE_TO_COLS.items():
+            with self.subTest(report_type=report_type):
+                self.assertEqual(outputs[True][report_type][0], list(columns))
+        # label rows do not depend on the order random values are drawn in
+        for report_type in (OCP_NODE_LABEL, OCP_NAMESPACE_LABEL):
+            self.assertEqual(outputs[True][report_type], outputs[False][report_type])
+
     def test_ocp_create_report_ros_only(self):
         """Test the ocp report creation with ros_only flag - should create ONLY ROS reports."""
         now = datetime.datetime.now().replace(microsecond=0, second=0, minute=0, hour=0)
@@ -1186,6 +1538,193 @@ class OCPReportTestCase(TestCase):
             os.remove(expected_month_output_file)
         shutil.rmtree(local_insights_upload)
 
+    def test_ocp_create_report_payload_extracts(self):
+        """Test that the compressed ocp payloads extract to the original report files."""
+        now = datetime.datetime.now().replace(microsecond=0, second=0, minute=0, hour=0)
+        yesterday = now - datetime.timedelta(days=1)
+        local_insights_upload = mkdtemp()
+        cluster_id = "11112222"
+        options = {
+            "start_date": yesterday,
+            "end_date": now,
+            "insights_upload": local_insights_upload,
+            "ocp_cluster_id": cluster_id,
+            "compression_level": 1,
+            "write_monthly": True,
+        }
+        fix_dates(options, "ocp")
+        ocp_create_report(options)
+
+        extracted = {}
+        for path, _, files in os.walk(local_insights_upload):
+            for name in files:
+                with open(os.path.join(path, name), "rb") as f:
+                    extracted[name] = f.read()
+        self.assertIn("manifest.json", extracted)
+        manifest = json.loads(extracted["manifest.json"])
+        for report_type, payload_name in zip(OCP_REPORT_TYPE_TO_COLS, manifest["files"]):
+            month_output_file = f"{calendar.month_name[now.month]}-{now.year}-{cluster_id}-{report_type}.csv"
+            with open(month_output_file, "rb") as f:
+                self.assertEqual(extracted[payload_name], f.read())
+            os.remove(month_output_file)
+        shutil.rmtree(local_insights_upload)
+
+    def test_ocp_simulate_operator(self):
+        """Test that each operator cycle uploads only its own hours with a fresh manifest."""
+        start = datetime.datetime(2026, 9, 30, 18, tzinfo=datetime.UTC)
+        cluster_id = "11112222"
+        options = {
+            "start_date": start,
+            "ocp_cluster_id": cluster_id,
+            "insights_upload": mkdtemp(),
+            "seed": 5,
+            "upload_cycle": 180,
+            "simulation_speed": 360,
+            "simulation_cycles": 3,
+        }
+        payloads = []
+
+        def read_payload(insights_upload, local_path):
+            with tarfile.open(local_path) as tar:
+                members = {member.name: tar.extractfile(member).read().decode() for member in tar.getmembers()}
+            manifest = json.loads(members.pop("manifest.json"))
+            (name, report), *_ = members.items()
+            self.assertEqual(len(members), 1)
+            self.assertIn(name, manifest["files"])
+            payloads.append((manifest, list(csv.DictReader(report.splitlines()))))
+
+        with (
+            patch("nise.report.ocp_route_file", side_effect=read_payload),
+            patch("nise.report.time.sleep") as mock_sleep,
+            patch("nise.report.OCPGenerator", wraps=OCPGenerator) as mock_generator,
+        ):
+            ocp_simulate_operator(options)
+
+        mock_generator.assert_called_once()
+        self.assertEqual(mock_sleep.call_count, 3)
+        for call, cycle_seconds in zip(mock_sleep.call_args_list, (30, 60, 90)):
+            self.assertTrue(cycle_seconds - 5 < call.args[0] <= cycle_seconds)
+
+        self.assertEqual(len(payloads), 3 * len(COST_OCP_REPORT_TYPE_TO_COLS))
+        windows = []
+        node_labels = []
+        for manifest, rows in payloads:
+            cycle_start = datetime.datetime.fromisoformat(manifest["start"])
+            cycle_end = datetime.datetime.fromisoformat(manifest["end"])
+            if (cycle_start, cycle_end) not in windows:
+                windows.append((cycle_start, cycle_end))
+            self.assertEqual(manifest["date"], manifest["end"])
+            self.assertEqual(manifest["cr_status"]["upload"]["upload_cycle"], 180)
+            for row in rows:
+                interval_start = datetime.datetime.strptime(row["interval_start"], "%Y-%m-%d %H:%M:%S +0000 UTC")
+                self.assertTrue(cycle_start <= interval_start.replace(tzinfo=datetime.UTC) < cycle_end)
+            if rows and "node_labels" in rows[0]:
+                node_labels.append({(row["node"], row["node_labels"]) for row in rows})
+        hours = datetime.timedelta(hours=3)
+        self.assertEqual(windows, [(start + i * hours, start + (i + 1) * hours) for i in range(3)])
+        self.assertEqual(len(node_labels), 3)
+        self.assertTrue(node_labels[0] == node_labels[1] == node_labels[2])
+        self.assertFalse([name for name in os.listdir() if f"-{cluster_id}-cycle" in name])
+        shutil.rmtree(options["insights_upload"])
+
+    def test_ocp_simulate_operator_minio_keys(self):
+        """Test that each operator cycle is uploaded to Minio under its own key."""
+        start = datetime.datetime(2026, 9, 30, 22, tzinfo=datetime.UTC)
+        options = {
+            "start_date": start,
+            "ocp_cluster_id": "11112222",
+            "minio_upload": "fake-minio-url",
+            "payload_name": "cycles",
+            "simulate_operator": True,
+            "upload_cycle": 60,
+            "simulation_cycles": 3,
+        }
+        with patch("nise.report.ocp_route_file_minio") as mock_route:
+            ocp_simulate_operator(options)
+        self.assertEqual(
+            [call.args[2] for call in mock_route.call_args_list],
+            ["cycles.20260930T2200.tar.gz", "cycles.20260930T2300.tar.gz", "cycles.20261001T0000.tar.gz"],
+        )
+
+    @patch("nise.report.post_payload_to_ingest_service")
+    def test_ocp_create_report_upload_to_ingress(self, mock_post):
+        """Test that payloads for an Ingress URL are uploaded over a shared session and then removed."""
+        start = datetime.datetime(2026, 9, 1)
+        options = {
+            "start_date": start,
+            "end_date": start + datetime.timedelta(hours=2),
+            "ocp_cluster_id": "11112222",
+            "insights_upload": "http://ingress.invalid/api/ingress/v1/upload",
+            "upload_workers": 2,
+        }
+        fix_dates(options, "ocp")
+        mock_post.return_value.status_code = 202
+        ocp_create_report(options)
+
+        self.assertEqual(mock_post.call_count, len(COST_OCP_REPORT_TYPE_TO_COLS))
+        sessions = {id(call.kwargs["session"]) for call in mock_post.call_args_list}
+        self.assertEqual(len(sessions), 1)
+        for call in mock_post.call_args_list:
+            self.assertEqual(call.args[0], options["insights_upload"])
+            self.assertFalse(os.path.exists(call.args[1]))
+
+    def test_ocp_create_report_node_shards(self):
+        """Test that node shards split the cluster's nodes, match the serial rows and are all in the manifest."""
+        start = datetime.datetime(2026, 9, 1)
+        local_insights_upload = mkdtemp()
+        cluster_id = "11112222"
+        options = {
+            "start_date": start,
+            "end_date": start + datetime.timedelta(hours=3),
+            "ocp_cluster_id": cluster_id,
+            "write_monthly": True,
+            "seed": 5,
+        }
+        fix_dates(options, "ocp")
+        ocp_create_report(options)
+        with open(f"September-2026-{cluster_id}-{OCP_NODE_LABEL}.csv") as node_file:
+            all_nodes = {row["node"] for row in csv.DictReader(node_file)}
+        serial_rows = {}
+        for report_type in COST_OCP_REPORT_TYPE_TO_COLS:
+            report_file = f"September-2026-{cluster_id}-{report_type}.csv"
+            with open(report_file) as f:
+                serial_rows[report_type] = sorted(csv.reader(f))
+            os.remove(report_file)
+
+        options.update({"workers": 2, "insights_upload": local_insights_upload})
+        ocp_create_report(options)
+
+        shard_nodes = []
+        shard_files = {}
+        shard_rows = {report_type: [] for report_type in COST_OCP_REPORT_TYPE_TO_COLS}
+        for shard in range(2):
+            with open(f"September-2026-{cluster_id}-shard{shard}-{OCP_NODE_LABEL}.csv") as node_file:
+                shard_nodes.append({row["node"] for row in csv.DictReader(node_file)})
+            for report_type in COST_OCP_REPORT_TYPE_TO_COLS:
+                shard_file = f"September-2026-{cluster_id}-shard{shard}-{report_type}.csv"
+                with open(shard_file, "rb") as f:
+                    shard_files[shard_file] = f.read()
+                header, *rows = csv.reader(shard_files[shard_file].decode().splitlines())
+                shard_rows[report_type].extend(rows if shard else [header, *rows])
+                os.remove(shard_file)
+        self.assertTrue(shard_nodes[0] and shard_nodes[1])
+        self.assertFalse(shard_nodes[0] & shard_nodes[1])
+        self.assertEqual(shard_nodes[0] | shard_nodes[1], all_nodes)
+        self.assertGreater(len(serial_rows[OCP_NODE_LABEL]), 1)
+        for report_type, rows in serial_rows.items():
+            with self.subTest(report_type=report_type):
+                self.assertEqual(sorted(shard_rows[report_type]), rows)
+
+        extracted = {}
+        for path, _, files in os.walk(local_insights_upload):
+            for name in files:
+                with open(os.path.join(path, name), "rb") as f:
+                    extracted[name] = f.read()
+        manifest = json.loads(extracted["manifest.json"])
+        self.assertEqual(len(manifest["files"]), len(shard_files))
+        self.assertEqual(sorted(extracted[name] for name in manifest["files"]), sorted(shard_files.values()))
+        shutil.rmtree(local_insights_upload)
+
     def test_ocp_create_report_with_local_dir_static_generation(self):
         """Test the ocp report creation method with local directory and static generation."""
         now = datetime.datetime.now().replace(microsecond=0, second=0, minute=0, hour=0)
@@ -1708,6 +2247,242 @@ class AzureReportTestCase(TestCase):
         mock_upload.assert_called()
         os.remove(self.MOCK_AZURE_REPORT_FILENAME)
 
+    def test_azure_create_report_file_byte_limit(self):
+        """Test that a month of Azure data is split into costreport parts by size."""
+        start = datetime.datetime(2026, 9, 1)
+        local_storage_path = mkdtemp()
+        options = {
+            "start_date": start,
+            "end_date": start + datetime.timedelta(days=2),
+            "azure_container_name": local_storage_path,
+            "azure_report_name": "cur_report",
+            "byte_limit": 4096,
+            "seed": 3,
+        }
+        fix_dates(options, "azure")
+        azure_create_report(options)
+
+        folder = os.path.join(local_storage_path, "cur_report", "20260901-20260930")
+        parts = os.listdir(folder)
+        self.assertGreater(len(parts), 1)
+        for part in parts:
+            with open(os.path.join(folder, part)) as f:
+                lines = f.read().splitlines(keepends=True)
+            # a part is rotated by the first row written past the limit
+            self.assertLess(len("".join(lines[:-1]).encode()), 4096)
+        shutil.rmtree(local_storage_path)
+
+    def test_azure_create_report_row_limit(self):
+        """Test that a month of Azure data is split into costreport parts in the same date range folder."""
+        start = datetime.datetime(2026, 9, 1)
+        local_storage_path = mkdtemp()
+        options = {
+            "start_date": start,
+            "end_date": start + datetime.timedelta(days=2),
+            "azure_container_name": local_storage_path,
+            "azure_report_name": "cur_report",
+            "row_limit": 5,
+            "seed": 3,
+        }
+        fix_dates(options, "azure")
+        azure_create_report(options)
+
+        folder = os.path.join(local_storage_path, "cur_report", "20260901-20260930")
+        parts = sorted(os.listdir(folder))
+        self.assertGreater(len(parts), 1)
+        rows = []
+        for part in parts:
+            self.assertRegex(part, r"^costreport_[0-9a-f-]{36}\.csv$")
+            with open(os.path.join(folder, part)) as f:
+                part_rows = list(csv.DictReader(f))
+            self.assertLessEqual(len(part_rows), 5)
+            rows.extend(part_rows)
+        self.assertEqual({row["Date"] for row in rows}, {"2026-09-01", "2026-09-02", "2026-09-03"})
+        self.assertFalse([name for name in os.listdir() if name in parts])
+        shutil.rmtree(local_storage_path)
+
+    def test_azure_blob_uploader(self):
+        """Test that files are uploaded in concurrent blocks over one pool of connections to a local blob stub."""
+        server, connect_str = start_blob_stub(self)
+        files = {}
+        for count in range(5):
+            with NamedTemporaryFile(suffix=".csv", delete=False) as report_file:
+                report_file.write(os.urandom(5000))
+            with open(report_file.name, "rb") as f:
+                files[report_file.name] = f.read()
+
+        with patch.dict(os.environ, {"AZURE_STORAGE_CONNECTION_STRING": connect_str}):
+            with AzureBlobUploader("cost", max_workers=2, max_concurrency=3, max_block_size=1024) as uploader:
+                for count, local_path in enumerate(files):
+                    uploader.upload(local_path, f"report/{count}.csv", remove=count > 0)
+
+        for count, content in enumerate(files.values()):
+            self.assertEqual(server.blobs[f"/devstoreaccount1/cost/report/{count}.csv"], content)
+        operations = [operation for _, operation, _ in server.received]
+        self.assertEqual(operations.count("block"), 5 * 5)
+        self.assertEqual(operations.count("blocklist"), 5)
+        # the upload threads share the client's pooled, kept alive connections
+        self.assertLessEqual(len({client for *_, client in server.received}), 2 * 3)
+        self.assertEqual([os.path.exists(local_path) for local_path in files], [True, False, False, False, False])
+        os.remove(next(iter(files)))
+
+    def test_azure_create_report_upload_to_blob_stub(self):
+        """Test that every month of a report is uploaded to its date range folder and removed locally."""
+        server, connect_str = start_blob_stub(self)
+        options = {
+            "start_date": datetime.datetime(2026, 8, 30),
+            "end_date": datetime.datetime(2026, 9, 2),
+            "azure_account_name": "devstoreaccount1",
+            "azure_container_name": "cost",
+            "azure_report_name": "cur_report",
+            "azure_block_size": 1024,
+            "seed": 9,
+        }
+        fix_dates(options, "azure")
+        with patch.dict(os.environ, {"AZURE_STORAGE_CONNECTION_STRING": connect_str}):
+            azure_create_report(options)
+
+        folders = {}
+        for path, content in server.blobs.items():
+            folder, file_name = path.rsplit("/", 1)
+            self.assertRegex(file_name, r"^costreport_[0-9a-f-]{36}\.csv$")
+            self.assertFalse(os.path.exists(file_name))
+            rows = list(csv.DictReader(content.decode().splitlines()))
+            folders.setdefault(folder, set()).update(row["Date"] for row in rows)
+        self.assertEqual(
+            folders,
+            {
+                "/devstoreaccount1/cost/cur_report/20260801-20260831": {"2026-08-30", "2026-08-31"},
+                "/devstoreaccount1/cost/cur_report/20260901-20260930": {"2026-09-01", "2026-09-02"},
+            },
+        )
+        self.assertIn("block", [operation for _, operation, _ in server.received])
+
+    def test_azure_create_report_dual_export(self):
+        """Test that a dual export writes the same rows as separate subscription and resource group runs."""
+        start = datetime.datetime(2026, 9, 1)
+
+        def run(directory, **extra_options):
+            os.mkdir(directory)
+            options = {
+                "start_date": start,
+                "end_date": start + datetime.timedelta(days=1),
+                "azure_container_name": directory,
+                "azure_report_name": "cur_report",
+                "seed": 5,
+                **extra_options,
+            }
+            fix_dates(options, "azure")
+            azure_create_report(options)
+            reports = {}
+            for report_name in sorted(os.listdir(directory)):
+                folder = os.path.join(directory, report_name, "20260901-20260930")
+                header, rows = None, []
+                for part in os.listdir(folder):
+                    with open(os.path.join(folder, part)) as f:
+                        reader = csv.reader(f)
+                        header = next(reader)
+                        rows.extend(reader)
+                reports[report_name] = (header, sorted(rows))
+            return reports
+
+        with TemporaryDirectory() as directory:
+            dual = run(os.path.join(directory, "dual"), azure_dual_export=True, resource_group_export=True)
+            subscription = run(os.path.join(directory, "subscription"))
+            resource_group = run(os.path.join(directory, "resource_group"), resource_group_export=True)
+
+        self.assertEqual(list(dual), ["cur_report", "cur_report-resource-group"])
+        self.assertEqual(dual["cur_report"], subscription["cur_report"])
+        self.assertEqual(dual["cur_report-resource-group"], resource_group["cur_report"])
+        self.assertEqual(tuple(dual["cur_report"][0]), AZURE_COLUMNS_V2_SUBSCRIPTION)
+        self.assertEqual(tuple(dual["cur_report-resource-group"][0]), AZURE_COLUMNS_V2_RESOURCE_GROUP)
+        self.assertTrue(dual["cur_report"][1])
+
+    def test_azure_create_report_meter_cache(self):
+        """Test that a meter cache file keeps meter values the same across runs with different seeds."""
+        start = datetime.datetime(2026, 9, 1)
+        static_azure_data = {
+            "generators": [
+                {"VMGenerator": {"start_date": "2026-09-01", "end_date": "2026-09-02", "meter_id": "vm-meter"}},
+                {"SQLGenerator": {"start_date": "2026-09-01", "end_date": "2026-09-02", "meter_id": "sql-meter"}},
+            ],
+            "accounts": {
+                "payer": "38f1d748-3ac7-4b7f-a5ae-8b5ff16db82c",
+                "user": ["38f1d748-3ac7-4b7f-a5ae-8b5ff16db82c"],
+            },
+        }
+        with TemporaryDirectory() as directory:
+            meter_cache_file = os.path.join(directory, "meters.json")
+            meters = []
+            for seed in range(4):
+                container = os.path.join(directory, f"run{seed}")
+                os.mkdir(container)
+                options = {
+                    "start_date": start,
+                    "end_date": start + datetime.timedelta(days=1),
+                    "azure_container_name": container,
+                    "azure_report_name": "cur_report",
+                    "static_report_data": copy.deepcopy(static_azure_data),
+                    "azure_meter_cache": meter_cache_file,
+                    "seed": seed,
+                }
+                fix_dates(options, "azure")
+                azure_create_report(options)
+                folder = os.path.join(container, "cur_report", "20260901-20260930")
+                run_meters = set()
+                for part in os.listdir(folder):
+                    with open(os.path.join(folder, part)) as f:
+                        run_meters.update(
+                            (row["MeterId"], row["MeterCategory"], row["MeterSubCategory"], row["MeterName"])
+                            for row in csv.DictReader(f)
+                        )
+                meters.append(run_meters)
+            self.assertEqual(len(meters[0]), 2)
+            self.assertTrue(all(run_meters == meters[0] for run_meters in meters))
+
+    def test_azure_create_report_meter_cache_random(self):
+        """Test that generated meters keep their ids across months and runs without growing the cache."""
+        start = datetime.datetime(2026, 8, 31)
+        static_azure_data = {
+            "generators": [
+                {generator: {"start_date": "2026-08-31", "end_date": "2026-09-02"}}
+                for generator in ("VMGenerator", "SQLGenerator", "DTGenerator")
+            ],
+            "accounts": {
+                "payer": "38f1d748-3ac7-4b7f-a5ae-8b5ff16db82c",
+                "user": ["38f1d748-3ac7-4b7f-a5ae-8b5ff16db82c"],
+            },
+        }
+        with TemporaryDirectory() as directory:
+            meter_cache_file = os.path.join(directory, "meters.json")
+            meter_ids, cache_sizes = [], []
+            for seed in (0, 1, None):
+                container = os.path.join(directory, f"run{seed}")
+                os.mkdir(container)
+                options = {
+                    "start_date": start,
+                    "end_date": start + datetime.timedelta(days=1),
+                    "azure_container_name": container,
+                    "azure_report_name": "cur_report",
+                    "static_report_data": copy.deepcopy(static_azure_data),
+                    "azure_meter_cache": meter_cache_file,
+                    "seed": seed,
+                }
+                fix_dates(options, "azure")
+                azure_create_report(options)
+                run_meter_ids = set()
+                for folder, _, parts in os.walk(container):
+                    for part in parts:
+                        with open(os.path.join(folder, part)) as f:
+                            run_meter_ids.update(row["MeterId"] for row in csv.DictReader(f))
+                meter_ids.append(run_meter_ids)
+                with open(meter_cache_file) as f:
+                    cache_sizes.append(len(next(iter(json.load(f)["subscriptions"].values()))))
+            self.assertEqual(meter_ids[1], meter_ids[0])
+            self.assertEqual(meter_ids[2], meter_ids[0])
+            self.assertEqual(len(meter_ids[0]), 3)
+            self.assertEqual(cache_sizes, [3, 3, 3])
+
     @patch("nise.report._generate_azure_filename")
     def test_azure_create_report_without_write_monthly(self, mock_name):
         """Test that monthly file is not created by default."""
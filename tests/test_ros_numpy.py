@@ -0,0 +1,137 @@
+#
+# Copyright 2026 Red Hat, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+from datetime import datetime
+from datetime import timedelta
+from unittest import skipIf
+from unittest import TestCase
+from unittest.mock import patch
+
+from nise.generators.generator import REPORT_TYPE
+from nise.generators.ocp import ros_numpy
+from nise.generators.ocp.ocp_generator import OCP_ROS_USAGE
+from nise.generators.ocp.ocp_generator import OCPGenerator
+from nise.generators.ocp.ocp_generator import ROS_CPU_METRICS
+from nise.generators.ocp.ocp_generator import ROS_MEMORY_METRICS
+from nise.generators.ocp.ros_numpy import ROSContainerMetrics
+
+ROS_PODS = [
+    {
+        "cpu_limit_container_avg": 2,
+        "memory_limit_container_avg": 4000,
+        "cpu_usage_container_avg": 1.5,
+        "cpu_usage_container_max": 2,
+        "cpu_throttle_container_avg": 0,
+        "memory_usage_container_avg": 1000,
+        "memory_rss_usage_container_max": 3999,
+    },
+    {"cpu_usage_container_sum": 0.25},
+]
+
+
+@skipIf(ros_numpy.numpy is None, "NumPy is not installed")
+class ROSContainerMetricsTestCase(TestCase):
+    """Test cases for the NumPy ROS container metrics."""
+
+    def test_intervals(self):
+        """Test that values are randomized, clamped and rounded like the pure Python path."""
+        metrics = ROSContainerMetrics(ROS_PODS, ROS_CPU_METRICS, ROS_MEMORY_METRICS, seed=7, batch_size=3)
+        intervals = list(metrics.intervals(8))
+        self.assertEqual(len(intervals), 8)
+        for interval in intervals:
+            first = dict(metrics.updates(interval, 0))
+            self.assertEqual(
+                list(first),
+                [
+                    "cpu_usage_container_avg",
+                    "cpu_usage_container_max",
+                    "memory_usage_container_avg",
+                    "memory_rss_usage_container_max",
+                ],
+            )
+            self.assertTrue(1.35 <= first["cpu_usage_container_avg"] <= 1.65)
+            self.assertEqual(first["cpu_usage_container_avg"], round(first["cpu_usage_container_avg"], 5))
+            self.assertTrue(1.8 <= first["cpu_usage_container_max"] <= 2)
+            self.assertIsInstance(first["memory_usage_container_avg"], int)
+            self.assertTrue(900 <= first["memory_usage_container_avg"] <= 1100)
+            self.assertTrue(3599 <= first["memory_rss_usage_container_max"] <= 4000)
+
+            second = dict(metrics.updates(interval, 1))
+            self.assertEqual(list(second), ["cpu_usage_container_sum"])
+            self.assertTrue(0.225 <= second["cpu_usage_container_sum"] <= 0.275)
+
+    def test_intervals_seeded(self):
+        """Test that the same seed gives the same values."""
+        values = []
+        for _ in range(2):
+            metrics = ROSContainerMetrics(ROS_PODS, ROS_CPU_METRICS, ROS_MEMORY_METRICS, seed=11)
+            values.append([list(metrics.updates(interval, 0)) for interval in metrics.intervals(5)])
+        self.assertEqual(values[0], values[1])
+
+    def test_generator_rows(self):
+        """Test that the NumPy path builds the same rows as the pure Python path, apart from values."""
+        now = datetime(2026, 9, 1, 3)
+        start = now - timedelta(hours=2)
+        attributes = {
+            "nodes": [
+                {
+                    "node_name": "node",
+                    "cpu_cores": 8,
+                    "memory_gig": 32,
+                    "namespaces": {
+                        "ns": {
+                            "pods": [
+                                {"pod_name": "pod_a", "cpu_limit": 2, "mem_limit_gig": 4, "pod_seconds": 3600},
+                                {"pod_name": "pod_b", "cpu_limit": 1, "mem_limit_gig": 2, "pod_seconds": 3600},
+                            ]
+                        }
+                    },
+                }
+            ]
+        }
+        rows = {}
+        for use_numpy in (False, True):
+            generator = OCPGenerator(start, now, attributes, ros_ocp_info=True, ros_ocp_numpy=use_numpy)
+            rows[use_numpy] = list(generator._gen_quarter_hourly_ros_ocp_pods_usage(**{REPORT_TYPE: OCP_ROS_USAGE}))
+        self.assertEqual(len(rows[True]), len(rows[False]))
+        for numpy_row, python_row in zip(rows[True], rows[False]):
+            self.assertEqual(list(numpy_row), list(python_row))
+            for column in ("interval_start", "interval_end", "report_period_start", "pod", "namespace"):
+                self.assertEqual(numpy_row[column], python_row[column])
+
+
+class ROSNumPyFallbackTestCase(TestCase):
+    """Test cases for generating ROS data without NumPy."""
+
+    def test_generator_falls_back_to_python(self):
+        """Test that the pure Python path is used when NumPy is not installed."""
+        now = datetime(2026, 9, 1, 3)
+        generator = OCPGenerator(now - timedelta(hours=1), now, {}, ros_ocp_info=True, ros_ocp_numpy=True)
+        with (
+            patch.object(ros_numpy, "numpy", None),
+            patch.object(
+                generator, "_randomize_ros_ocp_line_values", wraps=generator._randomize_ros_ocp_line_values
+            ) as mock_randomize,
+        ):
+            rows = list(generator._gen_quarter_hourly_ros_ocp_pods_usage(**{REPORT_TYPE: OCP_ROS_USAGE}))
+        self.assertTrue(rows)
+        self.assertEqual(mock_randomize.call_count, len(rows))
+
+    def test_metrics_require_numpy(self):
+        """Test that the metric arrays cannot be built without NumPy."""
+        with patch.object(ros_numpy, "numpy", None):
+            with self.assertRaises(RuntimeError):
+                ROSContainerMetrics(ROS_PODS, ROS_CPU_METRICS, ROS_MEMORY_METRICS)
@@ -0,0 +1,68 @@
+#
+# Copyright 2026 Red Hat, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+from unittest import TestCase
+
+from nise.generators.row import Row
+from nise.generators.row import row_schema
+from nise.generators.row import RowSchema
+
+
+class RowTestCase(TestCase):
+    """Test cases for compact rows."""
+
+    def setUp(self):
+        """Create a schema."""
+        self.schema = RowSchema(("a", "b", "c"))
+
+    def test_dict_api(self):
+        """Test that rows can be used like dicts."""
+        row = self.schema.row()
+        row["b"] = 2
+        row["extra"] = "x"
+        self.assertEqual(row["b"], 2)
+        self.assertEqual(row.get("missing", "default"), "default")
+        self.assertIn("extra", row)
+        self.assertEqual(list(row), ["a", "b", "c", "extra"])
+        self.assertEqual(row, {"a": "", "b": 2, "c": "", "extra": "x"})
+        self.assertEqual(row.cells, ["", 2, ""])
+        with self.assertRaises(KeyError):
+            row["missing"]
+        del row["extra"]
+        self.assertNotIn("extra", row)
+        with self.assertRaises(TypeError):
+            del row["a"]
+
+    def test_copy(self):
+        """Test that copies do not share values."""
+        row = self.schema.row()
+        row["extra"] = 1
+        copied = row.copy()
+        copied["a"] = 1
+        copied["extra"] = 2
+        self.assertEqual((row["a"], row["extra"]), ("", 1))
+        self.assertIsInstance(copied, Row)
+
+    def test_project(self):
+        """Test that rows are laid out in header order."""
+        row = self.schema.row()
+        row["a"], row["c"], row["extra"] = 1, 3, "x"
+        self.assertIs(row.project(self.schema.projection(("a", "b", "c"))), row.cells)
+        self.assertEqual(row.project(self.schema.projection(("extra", "c", "d", "a"))), ["x", 3, "", 1])
+
+    def test_shared_schema(self):
+        """Test that equal column tuples share a schema."""
+        self.assertIs(row_schema(("a", "b")), row_schema(("a", "b")))
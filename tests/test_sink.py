@@ -0,0 +1,159 @@
+#
+# Copyright 2026 Red Hat, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+import csv
+import gzip
+import os
+import shutil
+from tempfile import mkdtemp
+from unittest import TestCase
+
+from nise.generators.row import RenderedRow
+from nise.generators.row import RowSchema
+from nise.sink import CSVSink
+
+
+class CSVSinkTestCase(TestCase):
+    """
+    TestCase class for the streaming CSV sink
+    """
+
+    def setUp(self):
+        """Create a scratch directory."""
+        self.directory = mkdtemp()
+        self.base_path = os.path.join(self.directory, "report")
+
+    def tearDown(self):
+        """Remove the scratch directory."""
+        shutil.rmtree(self.directory)
+
+    @staticmethod
+    def _read(file_name):
+        with open(file_name) as f:
+            return list(csv.DictReader(f))
+
+    def test_single_file(self):
+        """Test that a sink that never rotates writes one unnumbered file."""
+        with CSVSink(self.base_path, ["a", "b"], row_limit=10) as sink:
+            for i in range(3):
+                sink.write({"a": i, "b": i * 2, "extra": "ignored"})
+
+        self.assertEqual(sink.files, [f"{self.base_path}.csv"])
+        rows = self._read(sink.files[0])
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[2], {"a": "2", "b": "4"})
+
+    def test_empty_sink_writes_header(self):
+        """Test that a sink with no rows still produces a file with a header."""
+        with CSVSink(self.base_path, ["a", "b"]) as sink:
+            pass
+        with open(sink.files[0]) as f:
+            self.assertEqual(f.read().strip(), "a,b")
+
+    def test_rotate_by_row_limit(self):
+        """Test that files are numbered once the row limit is reached."""
+        with CSVSink(self.base_path, ["a"], row_limit=2) as sink:
+            for i in range(5):
+                sink.write({"a": i})
+
+        expected = [f"{self.base_path}-{n}.csv" for n in (1, 2, 3)]
+        self.assertEqual(sink.files, expected)
+        self.assertFalse(os.path.exists(f"{self.base_path}.csv"))
+        self.assertEqual([len(self._read(f)) for f in expected], [2, 2, 1])
+
+    def test_rotate_by_byte_limit(self):
+        """Test that files are rotated once the byte limit is reached."""
+        with CSVSink(self.base_path, ["a"], byte_limit=20) as sink:
+            for _ in range(10):
+                sink.write({"a": "0123456789"})
+
+        self.assertGreater(len(sink.files), 1)
+        self.assertEqual(sum(len(self._read(f)) for f in sink.files), 10)
+        for file_name in sink.files:
+            self.assertLess(os.path.getsize(file_name), 40)
+
+    def test_transform_and_variants(self):
+        """Test that transforms and variants are applied to their own files."""
+        variants = {"-copy": lambda row: {**row, "b": "copy"}}
+        with CSVSink(
+            self.base_path, ["a", "b"], row_limit=2, transform=lambda row: {**row, "b": "main"}, variants=variants
+        ) as sink:
+            for i in range(3):
+                sink.write({"a": i, "b": ""})
+
+        self.assertEqual(sink.variant_files["-copy"], [f"{self.base_path}-1-copy.csv", f"{self.base_path}-2-copy.csv"])
+        self.assertTrue(all(row["b"] == "main" for f in sink.files for row in self._read(f)))
+        self.assertTrue(all(row["b"] == "copy" for f in sink.variant_files["-copy"] for row in self._read(f)))
+
+    def test_compact_rows(self):
+        """Test that compact rows are written in header order alongside dict rows."""
+        row = RowSchema(("b", "a")).row()
+        row["a"], row["b"] = 1, 2
+        with CSVSink(self.base_path, ["a", "b"]) as sink:
+            sink.write(row)
+            sink.write({"b": 4, "a": 3})
+
+        self.assertEqual(self._read(sink.files[0]), [{"a": "1", "b": "2"}, {"a": "3", "b": "4"}])
+
+    def test_rendered_rows(self):
+        """Test that pre-rendered lines are written for their header and laid out again otherwise."""
+        row = RenderedRow({"a": "x", "b": "y,z"})
+        row.header = ("a", "b")
+        row.line = 'rendered,"y,z"\r\n'
+        with CSVSink(self.base_path, ["a", "b"]) as sink:
+            sink.write(row)
+        self.assertEqual(self._read(sink.files[0]), [{"a": "rendered", "b": "y,z"}])
+
+        for header, kwargs in ((["b", "a"], {}), (["a", "b"], {"transform": dict})):
+            with self.subTest(header=header, **kwargs):
+                with CSVSink(self.base_path, header, **kwargs) as sink:
+                    sink.write(row)
+                self.assertEqual(self._read(sink.files[0]), [{"a": "x", "b": "y,z"}])
+
+    def test_renamed_columns(self):
+        """Test that header columns can be read from differently named row keys."""
+        row = RowSchema(("id", "name")).row()
+        row["id"], row["name"] = 1, "x"
+        with CSVSink(self.base_path, ["guid", "name"], columns=["id", "name"]) as sink:
+            sink.write(row)
+            sink.write({"id": 2, "name": "y", "guid": "ignored"})
+
+        self.assertEqual(self._read(sink.files[0]), [{"guid": "1", "name": "x"}, {"guid": "2", "name": "y"}])
+
+    def test_named_files(self):
+        """Test that files named by a callable keep their names when the sink rotates."""
+        names = iter(["first", "second"])
+        with CSVSink(None, ["a"], row_limit=2, name_file=lambda: os.path.join(self.directory, next(names))) as sink:
+            for i in range(3):
+                sink.write({"a": i})
+
+        expected = [os.path.join(self.directory, name) for name in ("first.csv", "second.csv")]
+        self.assertEqual(sink.files, expected)
+        self.assertEqual([len(self._read(f)) for f in expected], [2, 1])
+
+    def test_gzip_output(self):
+        """Test that compressed sinks write reproducible .csv.gz files."""
+        contents = []
+        for _ in range(2):
+            with CSVSink(self.base_path, ["a"], row_limit=2, compresslevel=1) as sink:
+                for i in range(3):
+                    sink.write({"a": i})
+            self.assertEqual(sink.files, [f"{self.base_path}-1.csv.gz", f"{self.base_path}-2.csv.gz"])
+            contents.append([open(f, "rb").read() for f in sink.files])
+
+        self.assertEqual(contents[0], contents[1])
+        with gzip.open(sink.files[0], "rt") as f:
+            self.assertEqual(list(csv.DictReader(f)), [{"a": "0"}, {"a": "1"}])
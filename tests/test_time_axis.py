@@ -0,0 +1,157 @@
+#
+# Copyright 2026 Red Hat, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from datetime import UTC
+from unittest import TestCase
+from zoneinfo import ZoneInfo
+
+from dateutil.tz import tzutc
+
+from nise.generators.aws import AWSGenerator
+from nise.generators.time_axis import time_axis
+from nise.generators.time_axis import TimeAxis
+from nise.generators.time_axis import TimestampCache
+from nise.generators.time_axis import TIMESTAMPS
+
+
+def eager_intervals(start_date, end_date, step, length, start_offset=timedelta(0)):
+    """Build the intervals the way generators used to, as a list of dicts."""
+    intervals = []
+    cur_date = start_date
+    while (cur_date + length) <= end_date:
+        intervals.append({"start": cur_date + start_offset, "end": cur_date + length})
+        cur_date = cur_date + step
+    return intervals
+
+
+class TimeAxisTestCase(TestCase):
+    """Test cases for the generator time axis."""
+
+    def setUp(self):
+        """Set up a range of a few days."""
+        self.start = datetime(2026, 2, 27, 3, tzinfo=UTC)
+        self.end = datetime(2026, 3, 2, 12, 30, tzinfo=UTC)
+
+    def test_matches_eager_lists(self):
+        """Test that the axis yields the same intervals as the eager lists did."""
+        cases = [
+            (timedelta(hours=1), timedelta(hours=1), timedelta(0)),
+            (timedelta(hours=1), timedelta(minutes=30), timedelta(0)),
+            (timedelta(minutes=15), timedelta(minutes=15), timedelta(seconds=1)),
+            (timedelta(days=1), timedelta(days=1), timedelta(0)),
+        ]
+        for step, length, start_offset in cases:
+            with self.subTest(step=step, length=length):
+                axis = TimeAxis(self.start, self.end, step, length, start_offset)
+                expected = eager_intervals(self.start, self.end, step, length, start_offset)
+                self.assertEqual(axis, expected)
+                self.assertEqual(list(axis), expected)
+                self.assertEqual(axis[-1], expected[-1])
+                self.assertEqual(axis[2:5], expected[2:5])
+
+    def test_preserves_timezone(self):
+        """Test that naive and non-stdlib timezone dates round trip unchanged."""
+        for tzinfo in (None, tzutc()):
+            start = self.start.replace(tzinfo=tzinfo)
+            axis = TimeAxis(start, self.end.replace(tzinfo=tzinfo), timedelta(hours=1))
+            self.assertIs(axis[0]["start"].tzinfo, tzinfo)
+            self.assertEqual(axis[0]["start"], start)
+
+    def test_steps_across_offset_changes(self):
+        """Test that intervals are a step apart in UTC when the offset of the timezone changes."""
+        tzinfo = ZoneInfo("America/New_York")
+        start = datetime(2026, 3, 8, tzinfo=tzinfo)
+        axis = TimeAxis(start, start + timedelta(hours=6), timedelta(hours=1))
+        starts = [interval["start"] for interval in axis]
+        self.assertTrue(all(in_date.tzinfo is tzinfo for in_date in starts))
+        utc_starts = [in_date.astimezone(UTC) for in_date in starts]
+        self.assertEqual(utc_starts, [start.astimezone(UTC) + i * timedelta(hours=1) for i in range(len(starts))])
+        self.assertEqual({in_date.utcoffset() for in_date in starts}, {timedelta(hours=-5), timedelta(hours=-4)})
+
+    def test_long_axis(self):
+        """Test that intervals of a long axis are computed on access."""
+        step = timedelta(minutes=1)
+        axis = TimeAxis(self.start, self.start + timedelta(days=365 * 1000), step)
+        self.assertEqual(len(axis), 365 * 1000 * 24 * 60)
+        self.assertEqual(axis[-1], {"start": self.start + (len(axis) - 1) * step, "end": self.start + len(axis) * step})
+        self.assertEqual(
+            axis[5:7], [{"start": self.start + i * step, "end": self.start + (i + 1) * step} for i in (5, 6)]
+        )
+        with self.assertRaises(IndexError):
+            axis[len(axis)]
+
+    def test_empty_axis(self):
+        """Test that a range shorter than one interval is empty."""
+        axis = TimeAxis(self.start, self.start + timedelta(minutes=59), timedelta(hours=1))
+        self.assertEqual(len(axis), 0)
+        self.assertEqual(axis, [])
+
+    def test_shared_instances(self):
+        """Test that axes are shared between callers with the same arguments."""
+        axis = time_axis(self.start, self.end, timedelta(hours=1))
+        self.assertIs(axis, time_axis(self.start, self.end, timedelta(hours=1)))
+        self.assertIsNot(axis, time_axis(self.start, self.end, timedelta(days=1)))
+
+    def test_intervals_are_copies(self):
+        """Test that mutating a returned interval does not change the axis."""
+        axis = time_axis(self.start, self.end, timedelta(hours=1))
+        axis[0]["start"] = None
+        self.assertEqual(axis[0]["start"], self.start)
+
+
+class TimestampCacheTestCase(TestCase):
+    """Test cases for the shared timestamp cache."""
+
+    def test_format_counts_hits_and_misses(self):
+        """Test that each instant is formatted once per format string."""
+        cache = TimestampCache()
+        in_date = datetime(2026, 3, 1, 5, tzinfo=UTC)
+        self.assertEqual(cache.format(in_date, "%Y-%m-%d"), "2026-03-01")
+        self.assertEqual(cache.format(in_date, "%Y-%m-%d"), "2026-03-01")
+        self.assertEqual(cache.format(in_date, "%H"), "05")
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+        self.assertAlmostEqual(cache.hit_rate, 1 / 3)
+        self.assertIn("1 hits", str(cache))
+
+        cache.clear()
+        self.assertEqual((cache.hits, cache.misses, cache.hit_rate), (0, 0, 0.0))
+
+    def test_format_respects_offsets(self):
+        """Test that equal instants with different UTC offsets are formatted separately."""
+        cache = TimestampCache()
+        in_date = datetime(2026, 3, 1, 5, tzinfo=UTC)
+        shifted = in_date.astimezone(timezone(timedelta(hours=2)))
+        self.assertEqual(cache.format(in_date, "%H"), "05")
+        self.assertEqual(cache.format(shifted, "%H"), "07")
+
+    def test_max_size(self):
+        """Test that the cache is bounded."""
+        cache = TimestampCache(max_size=2)
+        start = datetime(2026, 3, 1, tzinfo=UTC)
+        for hour in range(5):
+            cache.format(start + timedelta(hours=hour), "%H")
+        self.assertLessEqual(len(cache._cache), 2)
+
+    def test_generators_use_shared_cache(self):
+        """Test that generator timestamps are served from the shared cache."""
+        hits = TIMESTAMPS.hits
+        start = datetime(2026, 3, 1, tzinfo=UTC)
+        AWSGenerator.timestamp(start)
+        AWSGenerator.timestamp(start)
+        self.assertGreater(TIMESTAMPS.hits, hits)
@@ -15,7 +15,10 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 import os
+import subprocess
+import sys
 from tempfile import NamedTemporaryFile
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 from unittest.mock import Mock
 from unittest.mock import patch
@@ -201,3 +204,51 @@ class UploadTestCase(TestCase):
         uploaded = gcp_bucket_to_dataset(bucket_name, local_path, dataset_name, table_name)
 
         self.assertFalse(uploaded)
+
+
+LOCAL_REPORT_SCRIPT = """
+import datetime
+import sys
+
+from nise.__main__ import fix_dates
+from nise.report import ocp_create_report
+
+now = datetime.datetime.now().replace(microsecond=0, second=0, minute=0, hour=0)
+options = {
+    "start_date": now - datetime.timedelta(days=1),
+    "end_date": now,
+    "insights_upload": sys.argv[1],
+    "ocp_cluster_id": "lazy-import",
+}
+fix_dates(options, "ocp")
+ocp_create_report(options)
+sdk_prefixes = ("boto3", "botocore", "s3transfer", "azure", "google.cloud")
+print(sorted(name for name in sys.modules if name.startswith(sdk_prefixes)))
+"""
+
+
+class LazyImportTestCase(TestCase):
+    """
+    TestCase class for the lazily imported cloud SDKs
+    """
+
+    def test_local_report_does_not_import_cloud_sdks(self):
+        """Test that the CLI and a local OCP report run without importing any cloud SDK."""
+        with TemporaryDirectory() as directory:
+            result = subprocess.run(
+                [sys.executable, "-c", LOCAL_REPORT_SCRIPT, directory],
+                capture_output=True,
+                text=True,
+                cwd=directory,
+                env={**os.environ, "PYTHONPATH": os.path.dirname(os.path.dirname(os.path.abspath(__file__)))},
+            )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip().splitlines()[-1], "[]")
+
+    def test_sdk_attributes_are_importable(self):
+        """Test that the SDK names are still available as module attributes."""
+        import nise.upload
+
+        self.assertIs(nise.upload.ClientError, ClientError)
+        with self.assertRaises(AttributeError):
+            nise.upload.not_an_sdk